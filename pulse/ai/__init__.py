@@ -1,9 +1,10 @@
 """AI module for Pulse CLI."""
 
-from pulse.ai.client import AIClient
+from pulse.ai.client import AIClient, get_client
 from pulse.ai.prompts import StockAnalysisPrompts
 
 __all__ = [
     "AIClient",
+    "get_client",
     "StockAnalysisPrompts",
 ]
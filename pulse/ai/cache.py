@@ -0,0 +1,155 @@
+"""Response caches for the AI client."""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache for LLM responses.
+
+    Stores L2-normalized prompt embeddings in a single matrix so a lookup is one
+    matrix-vector product. Entries are partitioned by a namespace (model + system
+    prompt) so a cached answer is never served for a different task.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 600.0,
+        max_entries: int = 256,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            ttl: Entry lifetime in seconds
+            max_entries: Maximum number of cached responses (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._embeddings: np.ndarray | None = None
+        self._entries: list[tuple[str, str, float]] = []  # (namespace, response, created)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray | list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _prune(self) -> None:
+        """Drop expired entries and enforce the size cap."""
+        if not self._entries:
+            return
+
+        cutoff = time.monotonic() - self.ttl
+        keep = [i for i, (_, _, created) in enumerate(self._entries) if created >= cutoff]
+        keep = keep[-self.max_entries :]
+
+        if len(keep) != len(self._entries):
+            self._entries = [self._entries[i] for i in keep]
+            self._embeddings = self._embeddings[keep] if keep else None
+
+    def lookup(self, namespace: str, embedding: np.ndarray | list[float]) -> str | None:
+        """
+        Find a cached response for a similar prompt.
+
+        Args:
+            namespace: Cache partition (e.g. model + system prompt)
+            embedding: Prompt embedding
+
+        Returns:
+            Cached response or None on miss
+        """
+        self._prune()
+        if self._embeddings is None:
+            return None
+
+        query = self._normalize(embedding)
+        if query.shape[0] != self._embeddings.shape[1]:
+            return None
+
+        scores = self._embeddings @ query
+        mask = np.fromiter(
+            (ns == namespace for ns, _, _ in self._entries), dtype=bool, count=len(self._entries)
+        )
+        scores[~mask] = -1.0
+
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return self._entries[best][1]
+        return None
+
+    def store(self, namespace: str, embedding: np.ndarray | list[float], response: str) -> None:
+        """
+        Cache a response.
+
+        Args:
+            namespace: Cache partition (e.g. model + system prompt)
+            embedding: Prompt embedding
+            response: LLM response text
+        """
+        vector = self._normalize(embedding)[np.newaxis, :]
+
+        if self._embeddings is None or self._embeddings.shape[1] != vector.shape[1]:
+            self._embeddings = vector
+            self._entries = []
+        else:
+            self._embeddings = np.vstack([self._embeddings, vector])
+
+        self._entries.append((namespace, response, time.monotonic()))
+        self._prune()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._embeddings = None
+        self._entries = []
+
+
+class ExactCache:
+    """LRU cache for deterministic LLM responses keyed on a hash of the request."""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize exact-match cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (least recently used evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash request parts (model, system prompt, user message) into a cache key."""
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on miss."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
@@ -1,13 +1,19 @@
 """AI client using LiteLLM for multi-provider LLM support."""
 
+import asyncio
 import os
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
+import httpx
 import litellm
-from litellm import acompletion
+import orjson
+from litellm import Router, acompletion, aembedding
 
-from pulse.ai.prompts import CHAT_SYSTEM_PROMPT
+from pulse.ai.cache import ExactCache, SemanticCache
+from pulse.ai.prompts import CHAT_SYSTEM_PROMPT, StockAnalysisPrompts, dumps_json_async
 from pulse.core.config import normalize_model_id, settings
 from pulse.utils.logger import get_logger
 
@@ -18,14 +24,30 @@ log = get_logger(__name__)
 
 
 # API Key mapping - centralized configuration
-API_KEY_MAP = {
-    "gemini/": ["GEMINI_API_KEY", "GOOGLE_API_KEY"],
-    "anthropic/": ["ANTHROPIC_API_KEY"],
-    "openai/": ["OPENAI_API_KEY"],
-    "groq/": ["GROQ_API_KEY"],
-    "deepseek/": ["DEEPSEEK_API_KEY"],
+API_KEY_MAP: dict[str, tuple[str, ...]] = {
+    "gemini/": ("GEMINI_API_KEY", "GOOGLE_API_KEY"),
+    "anthropic/": ("ANTHROPIC_API_KEY",),
+    "openai/": ("OPENAI_API_KEY",),
+    "groq/": ("GROQ_API_KEY",),
+    "deepseek/": ("DEEPSEEK_API_KEY",),
 }
 
+# Greetings that get the identity reminder even mid-conversation
+GREETINGS = frozenset({"嗨", "你好", "哈囉", "hello", "hi", "hey"})
+
+IDENTITY_PREFIX = "[指示: 以 PULSE 台灣股市助理的身份回答。不是程式設計助理。]\n\nUser: "
+
+# Reply to an opening greeting, as scripted in CHAT_SYSTEM_PROMPT's examples
+CANNED_GREETING = "你好，我是你的台灣股市分析助理。請告訴我想分析哪一檔股票。"
+
+# Number of recently serialized payload objects kept per client
+PAYLOAD_CACHE_SIZE = 8
+
+# Providers that need explicit cache breakpoints on the prompt. OpenAI, DeepSeek
+# and Gemini cache identical prefixes automatically, so a stable system prompt
+# ordering is all they need.
+PROMPT_CACHE_PREFIXES = ("anthropic/",)
+
 
 def get_available_providers() -> set[str]:
     """
@@ -44,10 +66,9 @@ def get_available_providers() -> set[str]:
     return available_providers
 
 
-def _check_api_keys():
-    """Check if required API keys are set for the current model."""
-    model = normalize_model_id(settings.ai.default_model)
-
+@lru_cache(maxsize=None)
+def _check_api_keys(model: str) -> bool:
+    """Check (once per model) if required API keys are set for the given model."""
     for prefix, env_vars in API_KEY_MAP.items():
         if model.startswith(prefix):
             # Check if any of the required env vars is set
@@ -62,7 +83,100 @@ def _check_api_keys():
 
 
 # Check API keys on module load
-_check_api_keys()
+_check_api_keys(normalize_model_id(settings.ai.default_model))
+
+
+_router: Router | None = None
+_default_client: "AIClient | None" = None
+
+
+def _configure_http_session() -> None:
+    """Install one pooled keep-alive HTTP session for LiteLLM provider clients."""
+    if litellm.aclient_session is None:
+        pool_size = settings.ai.http_pool_size
+        litellm.aclient_session = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+
+def get_client() -> "AIClient":
+    """
+    Get the process-wide AI client.
+
+    Long-lived callers (the TUI, SmartAgent) should use this instead of
+    constructing AIClient so model selection, caches and HTTP connections
+    are shared.
+    """
+    global _default_client
+    if _default_client is None:
+        _configure_http_session()
+        _default_client = AIClient()
+    return _default_client
+
+
+def _get_router() -> Router:
+    """
+    Get the shared LiteLLM router for rate-limited models.
+
+    Only models listed in settings.ai.rate_limits are registered, so the router
+    never needs credentials for providers the user has not configured.
+    """
+    global _router
+    if _router is None:
+        model_list = [
+            {"model_name": model, "litellm_params": {"model": model, **limits}}
+            for model, limits in settings.ai.rate_limits.items()
+        ]
+        _router = Router(
+            model_list=model_list,
+            num_retries=settings.ai.num_retries,
+            routing_strategy="usage-based-routing-v2",
+        )
+    return _router
+
+
+def _extract_first_json(text: str, opener: str = "{") -> str | None:
+    """
+    Extract the first balanced JSON object (or array) from text in a single pass.
+
+    Tracks bracket depth and skips brackets inside string literals, so surrounding
+    prose, code fences or a second JSON block do not affect the result.
+
+    Args:
+        text: Model response text
+        opener: "{" for an object, "[" for an array
+
+    Returns:
+        The JSON substring, or None if no balanced value is found
+    """
+    closer = "}" if opener == "{" else "]"
+    start = text.find(opener)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+
+    return None
 
 
 class AIClient:
@@ -87,8 +201,19 @@ class AIClient:
         self.temperature = settings.ai.temperature
         self.max_tokens = settings.ai.max_tokens
         self.timeout = settings.ai.timeout
+        self._specialize_for_model()
 
         self._conversation_history: list[dict[str, str]] = []
+        self._history_tokens: list[int] = []  # token count per history message
+        self._exact_cache = ExactCache(max_entries=settings.ai.response_cache_size)
+        # id(data) -> (data, json); holding data keeps its id from being reused
+        self._payload_cache: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+        self._semantic_cache: SemanticCache | None = None
+        if settings.ai.semantic_cache_enabled:
+            self._semantic_cache = SemanticCache(
+                threshold=settings.ai.semantic_cache_threshold,
+                ttl=settings.ai.semantic_cache_ttl,
+            )
 
     def set_model(self, model: str) -> None:
         """
@@ -101,6 +226,9 @@ class AIClient:
 
         if canonical_model in settings.ai.available_models:
             self.model = canonical_model
+            self._specialize_for_model()
+            self._history_tokens.clear()  # counts depend on the model's tokenizer
+            _check_api_keys(canonical_model)
             log.info(f"Model switched to: {settings.get_model_display_name(canonical_model)}")
         else:
             log.warning(f"Unknown model: {model}")
@@ -119,12 +247,130 @@ class AIClient:
     def clear_history(self) -> None:
         """Clear conversation history."""
         self._conversation_history = []
+        self._history_tokens.clear()
+
+    def _trim_history(self) -> None:
+        """Drop the oldest user/assistant pairs until history fits the token budget."""
+        budget = settings.ai.history_token_budget
+        if not budget or len(self._conversation_history) <= 2:
+            return
+
+        # Token counts are cached per message, so each turn only encodes new messages
+        history = self._conversation_history
+        counts = self._history_tokens
+        if len(counts) > len(history):
+            counts.clear()
+        counts.extend(
+            litellm.token_counter(model=self.model, messages=[message])
+            for message in history[len(counts) :]
+        )
+        total = sum(counts)
+
+        # Always keep the latest exchange so follow-up questions retain context
+        drop = 0
+        while total > budget and len(counts) - drop > 2:
+            total -= counts[drop] + counts[drop + 1]
+            drop += 2
+
+        if drop:
+            del history[:drop]
+            del counts[:drop]
+            log.debug(f"Trimmed {drop} history messages to fit {budget} tokens")
+
+    async def _embed(self, text: str) -> list[float] | None:
+        """
+        Embed text for semantic cache lookups.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector, or None if the embedding request failed
+        """
+        try:
+            response = await aembedding(model=settings.ai.semantic_cache_model, input=[text])
+            return response.data[0]["embedding"]
+        except Exception as e:
+            log.debug(f"Semantic cache embedding failed: {e}")
+            return None
+
+    def _specialize_for_model(self) -> None:
+        """Precompute the request arguments that stay fixed for the current model."""
+        self._request_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "timeout": self.timeout,
+        }
+        # Models with configured limits go through the router, which tracks
+        # rpm/tpm usage and backs off on 429s instead of failing the request
+        self._use_router = self.model in settings.ai.rate_limits
+
+    async def _completion(self, messages: list[dict[str, Any]], **kwargs: Any) -> Any:
+        """
+        Call acompletion, retrying attempts that exceed the soft timeout.
+
+        When the opt-in settings.ai.soft_timeout is set, stalled non-streaming
+        requests are cancelled after it and resent; the final attempt only uses
+        the hard timeout. Streams are sent once, since the time to get the
+        stream wrapper is not the stall being guarded against. Other errors are
+        raised immediately; rate-limit backoff is left to the router.
+
+        Args:
+            messages: Chat messages
+            **kwargs: Extra arguments passed through to acompletion (e.g. stream)
+
+        Returns:
+            LiteLLM response (or stream wrapper when stream=True)
+        """
+        soft_timeout = 0 if kwargs.get("stream") else settings.ai.soft_timeout
+        attempts = settings.ai.max_retries + 1
+        complete = _get_router().acompletion if self._use_router else acompletion
+
+        for attempt in range(1, attempts + 1):
+            request = complete(messages=messages, **self._request_kwargs, **kwargs)
+            if attempt == attempts or not soft_timeout or soft_timeout >= self.timeout:
+                return await request
+
+            try:
+                return await asyncio.wait_for(request, timeout=soft_timeout)
+            except TimeoutError:
+                log.warning(
+                    f"{self.model} exceeded soft timeout ({soft_timeout}s), "
+                    f"retrying ({attempt}/{attempts - 1})"
+                )
+
+    def _build_system_message(self, prompt: str) -> dict[str, Any]:
+        """
+        Build the system message, marking static prefixes cacheable when supported.
+
+        The shared analysis base prompt is emitted as its own cache breakpoint so
+        every analysis type reuses it; the task-specific tail gets a second one.
+
+        Args:
+            prompt: Full system prompt text
+
+        Returns:
+            System message dictionary for LiteLLM
+        """
+        if not settings.ai.prompt_caching or not self.model.startswith(PROMPT_CACHE_PREFIXES):
+            return {"role": "system", "content": prompt}
+
+        blocks: list[dict[str, Any]] = []
+        base = StockAnalysisPrompts.get_system_base()
+        if prompt.startswith(base) and len(prompt) > len(base):
+            blocks.append({"type": "text", "text": base, "cache_control": {"type": "ephemeral"}})
+            prompt = prompt[len(base) :]
+
+        blocks.append({"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}})
+        return {"role": "system", "content": blocks}
 
     async def chat(
         self,
         message: str,
         system_prompt: str | None = None,
         use_history: bool = True,
+        cache_scope: str | None = None,
     ) -> str:
         """
         Send a chat message and get a response.
@@ -133,50 +379,76 @@ class AIClient:
             message: User message
             system_prompt: Optional system prompt
             use_history: Whether to include conversation history
+            cache_scope: Semantic cache partition (e.g. the ticker), so near-identical
+                prompts about different subjects never share a cached answer
 
         Returns:
             AI response text
         """
-        messages = []
-
-        # Add system prompt
         prompt = system_prompt or CHAT_SYSTEM_PROMPT
-        messages.append({"role": "system", "content": prompt})
 
-        # Add history if enabled
-        if use_history:
-            messages.extend(self._conversation_history)
+        is_greeting = message.strip().lower() in GREETINGS
+
+        # An opening greeting in normal chat has a fixed answer; skip the LLM call
+        if is_greeting and system_prompt is None and not self._conversation_history:
+            if use_history:
+                self._conversation_history.append({"role": "user", "content": message})
+                self._conversation_history.append(
+                    {"role": "assistant", "content": CANNED_GREETING}
+                )
+            return CANNED_GREETING
 
         # Prepend identity reminder to user message for first message or greetings
         user_msg = message
-        greetings = ["嗨", "你好", "哈囉", "hello", "hi", "hey"]
-        is_greeting = message.lower().strip() in greetings
-
         if not self._conversation_history or is_greeting:
-            user_msg = (
-                f"[指示: 以 PULSE 台灣股市助理的身份回答。不是程式設計助理。]\n\nUser: {message}"
-            )
-
-        # Add current message
-        messages.append({"role": "user", "content": user_msg})
+            user_msg = IDENTITY_PREFIX + message
+
+        # Deterministic stateless requests are answered from the exact-match cache
+        exact_key: str | None = None
+        if not use_history and self.temperature == 0 and self._exact_cache.max_entries > 0:
+            exact_key = ExactCache.make_key(self.model, prompt, user_msg)
+            cached = self._exact_cache.get(exact_key)
+            if cached is not None:
+                log.debug(f"Response cache hit for {self.model}")
+                return cached
+
+        # Stateless requests can be answered from the semantic cache
+        semantic_entry: tuple[str, list[float]] | None = None
+        if self._semantic_cache is not None and not use_history:
+            namespace = f"{self.model}\x00{prompt}\x00{cache_scope or ''}"
+            embedding = await self._embed(message)
+            if embedding is not None:
+                cached = self._semantic_cache.lookup(namespace, embedding)
+                if cached is not None:
+                    log.debug(f"Semantic cache hit for {self.model}")
+                    return cached
+                semantic_entry = (namespace, embedding)
+
+        # System prompt, history (shared by reference) and current message in one list
+        history = self._conversation_history if use_history else ()
+        messages = [
+            self._build_system_message(prompt),
+            *history,
+            {"role": "user", "content": user_msg},
+        ]
 
         try:
-            response = await acompletion(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout,
-            )
+            response = await self._completion(messages)
 
             assistant_message = response.choices[0].message.content or ""
 
+            if exact_key is not None and assistant_message:
+                self._exact_cache.set(exact_key, assistant_message)
+            if semantic_entry is not None and assistant_message:
+                self._semantic_cache.store(*semantic_entry, assistant_message)
+
             # Update history
             if use_history:
                 self._conversation_history.append({"role": "user", "content": message})
                 self._conversation_history.append(
                     {"role": "assistant", "content": assistant_message}
                 )
+                self._trim_history()
 
             return assistant_message
 
@@ -220,43 +492,93 @@ class AIClient:
         Yields:
             Response text chunks
         """
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        if use_history:
-            messages.extend(self._conversation_history)
-
-        messages.append({"role": "user", "content": message})
+        history = self._conversation_history if use_history else ()
+        system = (self._build_system_message(system_prompt),) if system_prompt else ()
+        messages = [*system, *history, {"role": "user", "content": message}]
 
         try:
-            response = await acompletion(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout,
-                stream=True,
-            )
+            response = await self._completion(messages, stream=True)
 
-            full_response = ""
+            # Collect chunks for history without re-concatenating on every token
+            parts: list[str] = []
 
+            append = parts.append
             async for chunk in response:
-                if chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    full_response += content
+                content = chunk.choices[0].delta.content
+                if content:
+                    append(content)
                     yield content
 
             # Update history after streaming complete
             if use_history:
                 self._conversation_history.append({"role": "user", "content": message})
-                self._conversation_history.append({"role": "assistant", "content": full_response})
+                self._conversation_history.append({"role": "assistant", "content": "".join(parts)})
+                self._trim_history()
 
         except Exception as e:
             log.error(f"AI stream request failed: {e}")
             raise
 
+    async def _serialize_payload(self, data: Any) -> str:
+        """
+        Serialize a prompt payload, reusing the JSON for the same data object.
+
+        An analysis and a recommendation for one ticker usually share the same
+        dict, so the JSON of the last few payload objects is kept. Payloads are
+        treated as read-only once handed to the client.
+
+        Args:
+            data: Payload to serialize
+
+        Returns:
+            Indented JSON text
+        """
+        key = id(data)
+        entry = self._payload_cache.get(key)
+        if entry is not None and entry[0] is data:
+            self._payload_cache.move_to_end(key)
+            return entry[1]
+
+        payload = await dumps_json_async(data)
+        self._payload_cache[key] = (data, payload)
+        if len(self._payload_cache) > PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return payload
+
+    @staticmethod
+    def _select_system_prompt(analysis_type: str) -> str:
+        """Get the system prompt for an analysis type."""
+        if analysis_type == "technical":
+            return StockAnalysisPrompts.get_technical_prompt()
+        elif analysis_type == "fundamental":
+            return StockAnalysisPrompts.get_fundamental_prompt()
+        elif analysis_type == "broker":
+            return StockAnalysisPrompts.get_broker_flow_prompt()
+        return StockAnalysisPrompts.get_comprehensive_prompt()
+
+    async def _build_analysis_prompts(
+        self,
+        ticker: str,
+        data: dict[str, Any],
+        analysis_type: str,
+    ) -> tuple[str, str]:
+        """
+        Build the system prompt and user message for a stock analysis.
+
+        Args:
+            ticker: Stock ticker
+            data: Stock data dictionary
+            analysis_type: Type of analysis (comprehensive, technical, fundamental, broker)
+
+        Returns:
+            Tuple of (system_prompt, user_message)
+        """
+        system_prompt = self._select_system_prompt(analysis_type)
+
+        # Format data as message
+        payload = await self._serialize_payload(data)
+        return system_prompt, StockAnalysisPrompts.format_analysis_request(ticker, data, payload)
+
     async def analyze_stock(
         self,
         ticker: str,
@@ -274,28 +596,121 @@ class AIClient:
         Returns:
             AI analysis response
         """
-        from pulse.ai.prompts import StockAnalysisPrompts
-
-        prompts = StockAnalysisPrompts()
-
-        if analysis_type == "technical":
-            system_prompt = prompts.get_technical_prompt()
-        elif analysis_type == "fundamental":
-            system_prompt = prompts.get_fundamental_prompt()
-        elif analysis_type == "broker":
-            system_prompt = prompts.get_broker_flow_prompt()
-        else:
-            system_prompt = prompts.get_comprehensive_prompt()
-
-        # Format data as message
-        user_message = prompts.format_analysis_request(ticker, data)
+        system_prompt, user_message = await self._build_analysis_prompts(
+            ticker, data, analysis_type
+        )
 
         return await self.chat(
             message=user_message,
             system_prompt=system_prompt,
             use_history=False,
+            cache_scope=ticker,
         )
 
+    async def analyze_stocks(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        analysis_type: str = "comprehensive",
+        max_concurrency: int | None = None,
+    ) -> list[str | BaseException]:
+        """
+        Analyze multiple stocks concurrently.
+
+        All requests are submitted up front and a semaphore bounds how many are
+        in flight, so network and inference time overlap across tickers.
+
+        Args:
+            items: List of (ticker, data) pairs
+            analysis_type: Type of analysis (comprehensive, technical, fundamental, broker)
+            max_concurrency: Maximum in-flight requests (defaults to settings.ai.max_concurrency)
+
+        Returns:
+            Analysis responses in input order; failed tickers hold their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.ai.max_concurrency)
+
+        async def analyze_one(ticker: str, data: dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.analyze_stock(ticker, data, analysis_type)
+
+        return await asyncio.gather(
+            *(analyze_one(ticker, data) for ticker, data in items),
+            return_exceptions=True,
+        )
+
+    async def analyze_stocks_batched(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        analysis_type: str = "technical",
+        batch_size: int = 3,
+        max_concurrency: int | None = None,
+    ) -> list[str | BaseException]:
+        """
+        Analyze multiple stocks, packing several tickers into each request.
+
+        Each request sends the system prompt once for up to batch_size tickers
+        and asks for a JSON array of per-ticker analyses, which saves
+        request-per-minute budget and repeated input tokens. Groups run
+        concurrently. Tickers missing from a reply (unparseable or truncated
+        output) are re-analyzed individually via analyze_stocks.
+
+        Best suited to short analyses such as screening, since every ticker in
+        a group shares one response's max_tokens.
+
+        Args:
+            items: List of (ticker, data) pairs
+            analysis_type: Type of analysis (comprehensive, technical, fundamental, broker)
+            batch_size: Tickers per request
+            max_concurrency: Maximum in-flight requests (defaults to settings.ai.max_concurrency)
+
+        Returns:
+            Analysis responses in input order; failed tickers hold their exception
+        """
+        system_prompt = self._select_system_prompt(analysis_type)
+        semaphore = asyncio.Semaphore(max_concurrency or settings.ai.max_concurrency)
+        groups = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+        async def analyze_group(group: list[tuple[str, dict[str, Any]]]) -> dict[str, str]:
+            payload = await dumps_json_async(dict(group))
+            tickers = [ticker for ticker, _ in group]
+            message = StockAnalysisPrompts.format_batch_analysis_request(tickers, payload)
+            async with semaphore:
+                response = await self.chat(
+                    message,
+                    system_prompt=system_prompt,
+                    use_history=False,
+                    cache_scope=",".join(tickers),
+                )
+
+            try:
+                parsed = orjson.loads(_extract_first_json(response, "[") or "[]")
+                return {
+                    str(entry["ticker"]): str(entry["analysis"])
+                    for entry in parsed
+                    if isinstance(entry, dict) and "ticker" in entry and "analysis" in entry
+                }
+            except orjson.JSONDecodeError as e:
+                log.warning(f"Failed to parse batched analysis: {e}")
+                return {}
+
+        group_results = await asyncio.gather(
+            *(analyze_group(group) for group in groups), return_exceptions=True
+        )
+
+        results: dict[str, str | BaseException] = {}
+        for group, group_result in zip(groups, group_results, strict=True):
+            if isinstance(group_result, BaseException):
+                results.update((ticker, group_result) for ticker, _ in group)
+            else:
+                results.update(group_result)
+
+        missing = [(ticker, data) for ticker, data in items if ticker not in results]
+        if missing:
+            retried = await self.analyze_stocks(missing, analysis_type, max_concurrency)
+            results.update(zip((ticker for ticker, _ in missing), retried, strict=True))
+
+        return [results[ticker] for ticker, _ in items]
+
     async def analyze_stock_stream(
         self,
         ticker: str,
@@ -313,21 +728,9 @@ class AIClient:
         Yields:
             Response text chunks
         """
-        from pulse.ai.prompts import StockAnalysisPrompts
-
-        prompts = StockAnalysisPrompts()
-
-        if analysis_type == "technical":
-            system_prompt = prompts.get_technical_prompt()
-        elif analysis_type == "fundamental":
-            system_prompt = prompts.get_fundamental_prompt()
-        elif analysis_type == "broker":
-            system_prompt = prompts.get_broker_flow_prompt()
-        else:
-            system_prompt = prompts.get_comprehensive_prompt()
-
-        # Format data as message
-        user_message = prompts.format_analysis_request(ticker, data)
+        system_prompt, user_message = await self._build_analysis_prompts(
+            ticker, data, analysis_type
+        )
 
         async for chunk in self.chat_stream(
             message=user_message,
@@ -351,17 +754,13 @@ class AIClient:
         Returns:
             Recommendation dictionary
         """
-        from pulse.ai.prompts import StockAnalysisPrompts
-
-        prompts = StockAnalysisPrompts()
-        system_prompt = prompts.get_recommendation_prompt()
-
-        import json
+        system_prompt = StockAnalysisPrompts.get_recommendation_prompt()
+        payload = await self._serialize_payload(analysis_result)
 
         user_message = f"""
 請根據以下數據，為股票 {ticker} 產生投資建議：
 
-{json.dumps(analysis_result, indent=2, default=str)}
+{payload}
 
 請只輸出 JSON，並符合以下結構：
 {{
@@ -381,16 +780,14 @@ class AIClient:
             message=user_message,
             system_prompt=system_prompt,
             use_history=False,
+            cache_scope=ticker,
         )
 
         # Try to parse JSON from response
         try:
-            # Find JSON in response
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", response)
-            if json_match:
-                return json.loads(json_match.group())
+            json_text = _extract_first_json(response)
+            if json_text:
+                return orjson.loads(json_text)
         except Exception as e:
             log.warning(f"Failed to parse recommendation JSON: {e}")
 
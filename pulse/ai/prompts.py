@@ -1,8 +1,37 @@
 """AI prompts for stock analysis."""
 
-import json
+import asyncio
+from functools import cache
 from typing import Any
 
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Payloads with more leaf values than this are serialized in a worker thread;
+# below it the thread hand-off costs more than orjson itself.
+JSON_OFFLOAD_THRESHOLD = 2000
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize prompt payload data to indented JSON (non-JSON values via str)."""
+    return orjson.dumps(data, default=str, option=_JSON_OPTIONS).decode("utf-8")
+
+
+def _estimate_size(data: Any, depth: int = 3) -> int:
+    """Roughly count values in a payload, looking only a few levels deep."""
+    if depth == 0 or not isinstance(data, dict | list | tuple):
+        return 1
+    values = data.values() if isinstance(data, dict) else data
+    return sum(_estimate_size(value, depth - 1) for value in values) or 1
+
+
+async def dumps_json_async(data: Any) -> str:
+    """Serialize prompt payload data, moving large payloads off the event loop."""
+    if _estimate_size(data) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(dumps_json, data)
+    return dumps_json(data)
+
 CHAT_SYSTEM_PROMPT = """# 身份
 名稱：PULSE
 功能：台灣股市分析助理（TWSE / TPEx）
@@ -142,12 +171,16 @@ class StockAnalysisPrompts:
 - 若有推論，請用「推論」或「可能」明示，不要包裝成事實
 """
 
+    # The get_*_prompt() builders below return immutable strings, so each one is
+    # composed once and then served from functools.cache on later calls.
+
     @staticmethod
     def get_system_base() -> str:
         """Get base system prompt with SAPTA and Happy Lines knowledge."""
         return StockAnalysisPrompts._SYSTEM_BASE
 
     @staticmethod
+    @cache
     def get_comprehensive_prompt() -> str:
         """Get highly actionable comprehensive analysis prompt."""
         return (
@@ -252,6 +285,7 @@ class StockAnalysisPrompts:
         )
 
     @staticmethod
+    @cache
     def get_technical_prompt() -> str:
         """Get technical analysis prompt."""
         return (
@@ -314,6 +348,7 @@ class StockAnalysisPrompts:
         )
 
     @staticmethod
+    @cache
     def get_fundamental_prompt() -> str:
         """Get fundamental analysis prompt."""
         return (
@@ -368,6 +403,7 @@ class StockAnalysisPrompts:
         )
 
     @staticmethod
+    @cache
     def get_broker_flow_prompt() -> str:
         """Get institutional flow analysis prompt."""
         return (
@@ -410,6 +446,7 @@ class StockAnalysisPrompts:
         )
 
     @staticmethod
+    @cache
     def get_recommendation_prompt() -> str:
         """Get recommendation prompt."""
         return (
@@ -450,6 +487,7 @@ JSON 結構：
         )
 
     @staticmethod
+    @cache
     def get_screening_prompt() -> str:
         """Get stock screening prompt."""
         return (
@@ -477,14 +515,16 @@ JSON 結構：
         )
 
     @staticmethod
-    def format_analysis_request(ticker: str, data: dict[str, Any]) -> str:
-        """Format analysis request with data."""
+    def format_analysis_request(
+        ticker: str, data: dict[str, Any], payload: str | None = None
+    ) -> str:
+        """Format analysis request with data (or its pre-serialized JSON payload)."""
         return f"""請分析股票 {ticker}。
 
 請根據下列資料，依照系統規則提供分析：
 
 ```json
-{json.dumps(data, indent=2, default=str, ensure_ascii=False)}
+{payload if payload is not None else dumps_json(data)}
 ```
 
 請輸出繁體中文，並至少包含：
@@ -507,7 +547,7 @@ JSON 結構：
 請根據下列資料進行比較分析：
 
 ```json
-{json.dumps(data, indent=2, default=str, ensure_ascii=False)}
+{dumps_json(data)}
 ```
 
 請至少輸出：
@@ -517,6 +557,29 @@ JSON 結構：
 4. 主要風險與不確定性
 
 若資料不足，請明確標示，不要硬選。
+"""
+
+    @staticmethod
+    def format_batch_analysis_request(tickers: list[str], payload: str) -> str:
+        """Format a multi-ticker analysis request answered as a JSON array."""
+        ticker_list = ", ".join(tickers)
+        return f"""請分別分析以下 {len(tickers)} 檔股票：{ticker_list}。
+
+各股票資料如下（以股票代號為鍵）：
+
+```json
+{payload}
+```
+
+請只輸出一個 JSON 陣列，每檔股票一個元素，順序與上方相同：
+[
+  {{"ticker": "股票代號", "analysis": "該股票的繁體中文 Markdown 分析"}}
+]
+
+規則：
+- 不要在 JSON 前後加任何多餘內容
+- 每檔股票的分析要精簡，聚焦最關鍵的判斷與風險
+- 若某檔資料不足，仍要輸出該元素，並在 analysis 說明缺少哪些欄位
 """
 
     @staticmethod
@@ -527,7 +590,7 @@ JSON 結構：
 請根據下列資料進行產業分析：
 
 ```json
-{json.dumps(data, indent=2, default=str, ensure_ascii=False)}
+{dumps_json(data)}
 ```
 
 請至少輸出：
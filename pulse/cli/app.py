@@ -12,7 +12,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Footer, Input, Markdown, OptionList, Static
 from textual.widgets.option_list import Option
 
-from pulse.ai.client import AIClient
+from pulse.ai.client import get_client
 from pulse.cli.commands.registry import CommandRegistry
 from pulse.core.smart_agent import SmartAgent
 from pulse.utils.error_handler import format_error_response
@@ -297,9 +297,11 @@ class PulseApp(App):
 
     def __init__(self):
         super().__init__()
-        self.ai_client = AIClient()
+        self.ai_client = get_client()
         self.command_registry = CommandRegistry(self)
-        self.smart_agent = SmartAgent(progress_callback=self._update_progress)
+        self.smart_agent = SmartAgent(
+            progress_callback=self._update_progress, ai_client=self.ai_client
+        )
         self._palette_visible = False
         self._scroll_scheduled = False
 
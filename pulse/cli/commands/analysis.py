@@ -1,10 +1,96 @@
 """Analysis commands: analyze, technical, fundamental."""
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pulse.cli.app import PulseApp
+    from pulse.core.analysis.fundamental import FundamentalAnalyzer
+    from pulse.core.analysis.institutional_flow import InstitutionalFlowAnalyzer
+    from pulse.core.analysis.technical import TechnicalAnalyzer
+    from pulse.core.data.stock_data_provider import StockDataProvider
+    from pulse.core.sapta import SaptaEngine
+
+
+# Shared analyzer instances, each imported and built on first use so a command
+# only pays for the stack it needs (e.g. /technical never loads the SAPTA model)
+@cache
+def _provider() -> "StockDataProvider":
+    from pulse.core.data.stock_data_provider import StockDataProvider
+
+    return StockDataProvider()
+
+
+@cache
+def _technical() -> "TechnicalAnalyzer":
+    from pulse.core.analysis.technical import TechnicalAnalyzer
+
+    return TechnicalAnalyzer()
+
+
+@cache
+def _fundamental() -> "FundamentalAnalyzer":
+    from pulse.core.analysis.fundamental import FundamentalAnalyzer
+
+    return FundamentalAnalyzer()
+
+
+@cache
+def _broker() -> "InstitutionalFlowAnalyzer":
+    from pulse.core.analysis.institutional_flow import InstitutionalFlowAnalyzer
+
+    return InstitutionalFlowAnalyzer()
+
+
+@cache
+def _sapta() -> "SaptaEngine":
+    from pulse.core.sapta import SaptaEngine
+
+    return SaptaEngine()
+
+
+# Per-ticker results reused within a session: tag -> TTL in seconds
+RESULT_TTLS: dict[str, float] = {
+    "stock": 60,
+    "technical": 60,
+    "happy_lines": 60,
+    "broker": 60,
+    "sapta": 60,
+    "fundamental": 3600,  # Financials change quarterly
+}
+RESULT_CACHE_SIZE = 128
+
+_results: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+
+async def _cached(tag: str, ticker: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Return a recent result for (tag, ticker), or await factory and cache it.
+
+    Args:
+        tag: Result kind, a key of RESULT_TTLS
+        ticker: Stock ticker
+        factory: Zero-argument callable producing the awaitable to run on a miss
+
+    Returns:
+        Cached or freshly computed result (None results are not cached)
+    """
+    key = f"{tag}:{ticker}"
+    entry = _results.get(key)
+    if entry is not None and time.monotonic() - entry[0] < RESULT_TTLS[tag]:
+        _results.move_to_end(key)
+        return entry[1]
+
+    result = await factory()
+    if result is not None:
+        _results[key] = (time.monotonic(), result)
+        _results.move_to_end(key)
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+    return result
 
 
 def _build_fundamental_payload(fundamental) -> dict | None:
@@ -47,30 +133,26 @@ async def analyze_command(app: "PulseApp", args: str) -> str:
 
     ticker = args.strip().upper()
 
-    from pulse.core.analysis.fundamental import FundamentalAnalyzer
-    from pulse.core.analysis.institutional_flow import InstitutionalFlowAnalyzer
-    from pulse.core.analysis.technical import TechnicalAnalyzer
-    from pulse.core.data.yfinance import YFinanceFetcher
-    from pulse.core.sapta import SaptaEngine
+    from pulse.core.data.yfinance import get_fetcher
 
-    fetcher = YFinanceFetcher()
-    stock = await fetcher.fetch_stock(ticker)
+    fetcher = get_fetcher()
+    stock = await _cached("stock", ticker, lambda: fetcher.fetch_stock(ticker))
 
     if not stock:
         return f"無法取得 {ticker} 的資料"
 
     # Fetch all data in parallel
-    tech_analyzer = TechnicalAnalyzer()
-    fundamental_analyzer = FundamentalAnalyzer()
-    broker_analyzer = InstitutionalFlowAnalyzer()
-    sapta_engine = SaptaEngine()
+    tech_analyzer = _technical()
+    fundamental_analyzer = _fundamental()
+    broker_analyzer = _broker()
+    sapta_engine = _sapta()
 
     results = await asyncio.gather(
-        tech_analyzer.analyze(ticker),
-        fundamental_analyzer.analyze(ticker),
-        broker_analyzer.analyze(ticker),
-        sapta_engine.analyze(ticker),
-        tech_analyzer.analyze_happy_lines(ticker),
+        _cached("technical", ticker, lambda: tech_analyzer.analyze(ticker)),
+        _cached("fundamental", ticker, lambda: fundamental_analyzer.analyze(ticker)),
+        _cached("broker", ticker, lambda: broker_analyzer.analyze(ticker)),
+        _cached("sapta", ticker, lambda: sapta_engine.analyze(ticker)),
+        _cached("happy_lines", ticker, lambda: tech_analyzer.analyze_happy_lines(ticker)),
         return_exceptions=True,
     )
 
@@ -113,33 +195,29 @@ async def analyze_command_stream(app: "PulseApp", args: str):
 
     yield {"type": "progress", "message": f"正在取得 {ticker} 數據..."}
 
-    from pulse.core.analysis.fundamental import FundamentalAnalyzer
-    from pulse.core.analysis.institutional_flow import InstitutionalFlowAnalyzer
-    from pulse.core.analysis.technical import TechnicalAnalyzer
-    from pulse.core.data.yfinance import YFinanceFetcher
-    from pulse.core.sapta import SaptaEngine
+    from pulse.core.data.yfinance import get_fetcher
 
-    fetcher = YFinanceFetcher()
-    stock = await fetcher.fetch_stock(ticker)
+    fetcher = get_fetcher()
+    stock = await _cached("stock", ticker, lambda: fetcher.fetch_stock(ticker))
 
     if not stock:
         yield {"type": "error", "message": f"無法取得 {ticker} 的資料"}
         return
 
     # Fetch all data in parallel
-    tech_analyzer = TechnicalAnalyzer()
-    fundamental_analyzer = FundamentalAnalyzer()
-    broker_analyzer = InstitutionalFlowAnalyzer()
-    sapta_engine = SaptaEngine()
+    tech_analyzer = _technical()
+    fundamental_analyzer = _fundamental()
+    broker_analyzer = _broker()
+    sapta_engine = _sapta()
 
     yield {"type": "progress", "message": f"正在分析 {ticker} 技術指標、基本面、法人動向..."}
 
     results = await asyncio.gather(
-        tech_analyzer.analyze(ticker),
-        fundamental_analyzer.analyze(ticker),
-        broker_analyzer.analyze(ticker),
-        sapta_engine.analyze(ticker),
-        tech_analyzer.analyze_happy_lines(ticker),
+        _cached("technical", ticker, lambda: tech_analyzer.analyze(ticker)),
+        _cached("fundamental", ticker, lambda: fundamental_analyzer.analyze(ticker)),
+        _cached("broker", ticker, lambda: broker_analyzer.analyze(ticker)),
+        _cached("sapta", ticker, lambda: sapta_engine.analyze(ticker)),
+        _cached("happy_lines", ticker, lambda: tech_analyzer.analyze_happy_lines(ticker)),
         return_exceptions=True,
     )
 
@@ -180,11 +258,10 @@ async def technical_command(app: "PulseApp", args: str) -> str:
 
     ticker = args.strip().upper()
 
-    from pulse.core.analysis.technical import TechnicalAnalyzer
     from pulse.utils.rich_output import create_technical_table
 
-    analyzer = TechnicalAnalyzer()
-    indicators = await analyzer.analyze(ticker)
+    analyzer = _technical()
+    indicators = await _cached("technical", ticker, lambda: analyzer.analyze(ticker))
 
     if not indicators:
         return f"無法分析 {ticker}，請確認股票代碼是否正確"
@@ -200,11 +277,10 @@ async def fundamental_command(app: "PulseApp", args: str) -> str:
 
     ticker = args.strip().upper()
 
-    from pulse.core.analysis.fundamental import FundamentalAnalyzer
     from pulse.utils.rich_output import create_fundamental_table
 
-    analyzer = FundamentalAnalyzer()
-    data = await analyzer.analyze(ticker)
+    analyzer = _fundamental()
+    data = await _cached("fundamental", ticker, lambda: analyzer.analyze(ticker))
 
     if not data:
         return f"無法取得 {ticker} 的基本面資料"
@@ -215,6 +291,22 @@ async def fundamental_command(app: "PulseApp", args: str) -> str:
     return create_fundamental_table(ticker, summary, score_data["score"])
 
 
+_HAPPY_CHANNEL_TEMPLATE = """
+【樂活通道 (20 日高低點平均線)】
+  上限 (UB): {upper:,.2f}
+  中線 (MA20): {mid:,.2f}
+  下限 (LB): {lower:,.2f}
+  通道狀態: {status}"""
+
+_HAPPY_SUMMARY_TEMPLATE = """
+【分析摘要】
+  當前價格: NT$ {price:,.2f}
+  位階百分比: {position:.1f}%
+  所在位階: {zone}
+  目前趨勢: {trend}
+  建議訊號: {signal}"""
+
+
 async def happy_lines_command(app: "PulseApp", args: str) -> str:
     """Happy Lines (樂活五線譜) analysis command handler."""
     if not args:
@@ -233,20 +325,20 @@ async def happy_lines_command(app: "PulseApp", args: str) -> str:
             except (ValueError, IndexError):
                 pass
 
-    from pulse.core.analysis.technical import TechnicalAnalyzer
-    from pulse.core.data.stock_data_provider import StockDataProvider
+    import numpy as np
 
     try:
         # Fetch historical data
-        fetcher = StockDataProvider()
-        df = await fetcher.fetch_history(ticker, period="1y")
+        df = await _provider().fetch_history(ticker, period="1y")
 
         if df is None or df.empty:
             return f"無法取得 {ticker} 的歷史資料"
 
         # Calculate Happy Lines
-        analyzer = TechnicalAnalyzer()
-        happy_lines = analyzer.calculate_happy_lines(df, ticker, period=period)
+        analyzer = _technical()
+        happy_lines = await asyncio.to_thread(
+            analyzer.calculate_happy_lines, df, ticker, period=period
+        )
 
         if not happy_lines:
             return f"無法計算 {ticker} 的樂活五線譜 (可能需要更多歷史資料)"
@@ -265,23 +357,18 @@ async def happy_lines_command(app: "PulseApp", args: str) -> str:
 
         output_lines = [f"【樂活五線譜分析 - {ticker}】", ""]
 
+        # Mark the line at or below the current price (lines 1 and 5 also cover
+        # prices beyond them); rows run from line 5 down to line 1
+        marker_row = None
+        if all(line_price is not None for line_price, _, _ in lines):
+            ascending = np.array([line_price for line_price, _, _ in reversed(lines)])
+            lines_at_or_below = int(np.searchsorted(ascending, price, side="right"))
+            marker_row = len(lines) - max(lines_at_or_below, 1)
+
         # Five lines display
         for i, (line_price, line_name, zone_name) in enumerate(lines):
             if line_price is not None:
-                # Determine if current price is at this line
-                indicator = ""
-                if i == 0:  # Line 5 (highest)
-                    if price >= line_price:
-                        indicator = " ← 你在這裡"
-                elif i == len(lines) - 1:  # Line 1 (lowest)
-                    if price <= line_price:
-                        indicator = " ← 你在這裡"
-                else:
-                    upper_line = lines[i - 1][0]
-                    if upper_line is not None:
-                        if price < upper_line and price >= line_price:
-                            indicator = " ← 你在這裡"
-
+                indicator = " ← 你在這裡" if i == marker_row else ""
                 output_lines.append(f"{line_name} ({zone_name}): {line_price:,.2f}{indicator}")
 
         # LOHAS Channel display
@@ -292,28 +379,24 @@ async def happy_lines_command(app: "PulseApp", args: str) -> str:
             elif happy_lines.is_below_channel:
                 status = "跌破下限 (LB) - 弱勢"
 
-            output_lines.extend(
-                [
-                    "",
-                    "【樂活通道 (20 日高低點平均線)】",
-                    f"  上限 (UB): {happy_lines.channel.upper_band:,.2f}",
-                    f"  中線 (MA20): {happy_lines.channel.mid_band:,.2f}",
-                    f"  下限 (LB): {happy_lines.channel.lower_band:,.2f}",
-                    f"  通道狀態: {status}",
-                ]
+            output_lines.append(
+                _HAPPY_CHANNEL_TEMPLATE.format(
+                    upper=happy_lines.channel.upper_band,
+                    mid=happy_lines.channel.mid_band,
+                    lower=happy_lines.channel.lower_band,
+                    status=status,
+                )
             )
 
         # Summary section
-        output_lines.extend(
-            [
-                "",
-                "【分析摘要】",
-                f"  當前價格: NT$ {price:,.2f}",
-                f"  位階百分比: {position_ratio:.1f}%",
-                f"  所在位階: {happy_lines.zone.value}",
-                f"  目前趨勢: {happy_lines.trend.value}",
-                f"  建議訊號: {happy_lines.signal.value}",
-            ]
+        output_lines.append(
+            _HAPPY_SUMMARY_TEMPLATE.format(
+                price=price,
+                position=position_ratio,
+                zone=happy_lines.zone.value,
+                trend=happy_lines.trend.value,
+                signal=happy_lines.signal.value,
+            )
         )
 
         return "\n".join(output_lines)
@@ -21,9 +21,9 @@ async def chart_command(app: "PulseApp", args: str) -> str:
         period = "3mo"
 
     from pulse.core.chart_generator import ChartGenerator
-    from pulse.core.data.yfinance import YFinanceFetcher
+    from pulse.core.data.yfinance import get_fetcher
 
-    fetcher = YFinanceFetcher()
+    fetcher = get_fetcher()
     df = fetcher.get_history_df(ticker, period)
 
     if df is None or df.empty:
@@ -77,10 +77,10 @@ async def forecast_command(app: "PulseApp", args: str) -> str:
                 pass
 
     from pulse.core.chart_generator import ChartGenerator
-    from pulse.core.data.yfinance import YFinanceFetcher
+    from pulse.core.data.yfinance import get_fetcher
     from pulse.core.forecasting import PriceForecaster
 
-    fetcher = YFinanceFetcher()
+    fetcher = get_fetcher()
     df = fetcher.get_history_df(ticker, "6mo")
 
     if df is None or df.empty:
@@ -146,9 +146,9 @@ async def taiex_command(app: "PulseApp", args: str) -> str:
 """
 
     from pulse.core.chart_generator import ChartGenerator
-    from pulse.core.data.yfinance import YFinanceFetcher
+    from pulse.core.data.yfinance import get_fetcher
 
-    fetcher = YFinanceFetcher()
+    fetcher = get_fetcher()
     index_data = await fetcher.fetch_index(index_name)
 
     if not index_data:
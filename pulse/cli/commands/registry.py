@@ -251,7 +251,7 @@ class CommandRegistry:
             "stocks",
             self._cmd_stocks,
             "Fetch Taiwan stock code list (上市/上櫃)",
-            "/stocks [--json] [--csv] [--twse] [--tpex]",
+            "/stocks [--json] [--csv] [--twse] [--tpex] [--no-cache]",
             aliases=["stocklist", "tickers"],
         )
 
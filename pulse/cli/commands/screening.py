@@ -1,7 +1,9 @@
 """Screening commands: screen, compare, export."""
 
+import asyncio
 import csv
-import re
+import io
+import operator
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,6 +13,30 @@ if TYPE_CHECKING:
     from pulse.core.screener import ScreenResult
 
 
+def _parse_options(args: str) -> tuple[dict[str, str | None], list[str]]:
+    """Split command args into ``--flag[=value]`` options and positional tokens.
+
+    Option names are case-folded; values and positional tokens keep their case.
+
+    Args:
+        args: Raw command arguments
+
+    Returns:
+        Tuple of (options mapping name to value or None, positional tokens)
+    """
+    options: dict[str, str | None] = {}
+    positional: list[str] = []
+
+    for token in args.split():
+        if token.startswith("--"):
+            name, sep, value = token[2:].partition("=")
+            options[name.lower()] = value if sep else None
+        else:
+            positional.append(token)
+
+    return options, positional
+
+
 async def screen_command(app: "PulseApp", args: str) -> str:
     """Screen stocks based on technical/fundamental criteria."""
     if not args:
@@ -53,42 +79,31 @@ Example (範例):
   /screen bullish --universe=all --export
 """
 
-    from pulse.core.screener import ScreenPreset, StockScreener, StockUniverse
+    from pulse.core.screener import (
+        PRESET_VALUES,
+        UNIVERSE_ALIASES,
+        ScreenPreset,
+        StockScreener,
+    )
 
-    # Parse universe option
-    universe_type = None
-    export_filename = None
-    criteria_str = args
+    options, positional = _parse_options(args)
+    criteria_str = " ".join(positional)
 
-    # Parse --export option
-    if "--export" in args.lower():
-        export_match = re.search(r"--export(?:=(.+))?", args.lower())
-        if export_match:
-            export_filename = export_match.group(1)  # None if just --export without =
-        criteria_str = re.sub(r"\s*--export(?:=\S+)?", "", args).strip()
+    # Parse --export option (None if just --export without =)
+    export_filename = options.get("export")
 
     # Parse universe option
-    if "--universe=" in args.lower():
-        match = re.search(r"--universe=(\w+)", args.lower())
-        if match:
-            universe_map = {
-                "tw50": StockUniverse.TW50,
-                "lq45": StockUniverse.TW50,  # backward compat
-                "midcap": StockUniverse.MIDCAP,
-                "tw100": StockUniverse.MIDCAP,
-                "popular": StockUniverse.POPULAR,
-                "all": StockUniverse.ALL,
-            }
-            universe_type = universe_map.get(match.group(1))
-            criteria_str = re.sub(r"\s*--universe=\w+", "", criteria_str).strip()
+    universe_type = None
+    universe = options.get("universe")
+    if universe:
+        universe_type = UNIVERSE_ALIASES.get(universe.lower())
 
     # Create screener with proper universe
     screener = StockScreener(universe_type=universe_type)
     args_lower = criteria_str.strip().lower()
 
     # Check if it's a preset
-    preset_names = [p.value for p in ScreenPreset]
-    if args_lower in preset_names:
+    if args_lower in PRESET_VALUES:
         results = await screener.screen_preset(ScreenPreset(args_lower))
         title = f"Screening: {args_lower.upper()} ({len(screener.universe)} stocks)"
     else:
@@ -99,46 +114,20 @@ Example (範例):
     if not results:
         return f"找不到符合條件的股票: {criteria_str}"
 
-    # Convert ScreenResult to dict format for rich_output
-    from pulse.utils.rich_output import create_screen_table
-
-    result_dicts = []
-    for r in results:
-        signal = ""
-        if r.rsi_status:
-            signal = (
-                "bullish"
-                if "oversold" in r.rsi_status.lower()
-                else "bearish"
-                if "overbought" in r.rsi_status.lower()
-                else ""
-            )
-        if not signal and r.macd_status:
-            signal = (
-                "bullish"
-                if "bullish" in r.macd_status.lower()
-                else "bearish"
-                if "bearish" in r.macd_status.lower()
-                else ""
-            )
+    # Convert ScreenResult to rows for rich_output
+    from pulse.utils.rich_output import ScreenRow, create_screen_table
 
-        result_dicts.append(
-            {
-                "ticker": r.ticker,
-                "price": r.price,
-                "change_percent": r.change_percent,
-                "rsi": r.rsi_14,
-                "signal": signal,
-            }
-        )
+    rows = [
+        ScreenRow(r.ticker, r.price, r.change_percent, r.rsi_14, r.signal) for r in results
+    ]
 
     # Create display output
-    output = create_screen_table(result_dicts, title)
+    output = create_screen_table(rows, title)
 
     # Export to CSV if requested
     if export_filename:
         try:
-            csv_path = export_results_to_csv(results, export_filename)
+            csv_path = await asyncio.to_thread(export_results_to_csv, results, export_filename)
             output += f"\n\n已導出 CSV: {csv_path}"
         except Exception as e:
             output += f"\n\n導出失敗: {e}"
@@ -156,14 +145,19 @@ async def compare_command(app: "PulseApp", args: str) -> str:
     if len(tickers) < 2:
         return "請至少指定 2 檔股票進行比較"
 
-    from pulse.core.data.yfinance import YFinanceFetcher
+    from pulse.core.data.yfinance import get_fetcher
 
-    fetcher = YFinanceFetcher()
+    fetcher = get_fetcher()
     results = []
 
-    for ticker in tickers[:4]:  # Max 4 tickers
-        stock = await fetcher.fetch_stock(ticker)
-        if stock:
+    # Fetch all tickers concurrently (max 4)
+    stocks = await asyncio.gather(
+        *(fetcher.fetch_stock(ticker) for ticker in tickers[:4]),
+        return_exceptions=True,
+    )
+
+    for ticker, stock in zip(tickers[:4], stocks, strict=True):
+        if stock and not isinstance(stock, Exception):
             results.append(
                 {
                     "ticker": stock.ticker,
@@ -183,6 +177,66 @@ async def compare_command(app: "PulseApp", args: str) -> str:
     return create_compare_table(results)
 
 
+# CSV columns taken directly from ScreenResult attributes, in output order
+_CSV_NUMERIC_FIELDS = (
+    "price",
+    "change_percent",
+    "volume",
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "sma_20",
+    "sma_50",
+    "pe_ratio",
+    "pb_ratio",
+    "roe",
+    "dividend_yield",
+    "market_cap",
+    "score",
+)
+_get_numeric_fields = operator.attrgetter(*_CSV_NUMERIC_FIELDS)
+
+_CSV_HEADER = (
+    "ticker",
+    "name",
+    "sector",
+    *_CSV_NUMERIC_FIELDS,
+    "signals",
+    # Happy Lines (樂活五線譜)
+    "happy_line_1",
+    "happy_line_2",
+    "happy_line_3",
+    "happy_line_4",
+    "happy_line_5",
+    "happy_position_ratio",
+    "happy_zone",
+)
+_EMPTY_HAPPY_LINES = (None,) * 7
+
+
+def _csv_row(r: "ScreenResult") -> list:
+    """Build a CSV row for a screening result in _CSV_HEADER order."""
+    row = [r.ticker, r.name or "", r.sector or "", *_get_numeric_fields(r)]
+    row.append("; ".join(r.signals) if r.signals else "")
+
+    hl = r.happy_lines
+    if hl is None:
+        row.extend(_EMPTY_HAPPY_LINES)
+    else:
+        row.extend(
+            (
+                hl.line_1,
+                hl.line_2,
+                hl.line_3,
+                hl.line_4,
+                hl.line_5,
+                f"{hl.position_ratio:.2f}%",
+                hl.zone.value,
+            )
+        )
+    return row
+
+
 def export_results_to_csv(results: list["ScreenResult"], filename: str | None = None) -> str:
     """Export screening results to CSV file.
 
@@ -207,72 +261,12 @@ def export_results_to_csv(results: list["ScreenResult"], filename: str | None =
 
     filepath = reports_dir / filename
 
-    # Define CSV columns
-    fieldnames = [
-        "ticker",
-        "name",
-        "sector",
-        "price",
-        "change_percent",
-        "volume",
-        "rsi_14",
-        "macd",
-        "macd_signal",
-        "sma_20",
-        "sma_50",
-        "pe_ratio",
-        "pb_ratio",
-        "roe",
-        "dividend_yield",
-        "market_cap",
-        "score",
-        "signals",
-        # Happy Lines (樂活五線譜)
-        "happy_line_1",
-        "happy_line_2",
-        "happy_line_3",
-        "happy_line_4",
-        "happy_line_5",
-        "happy_position_ratio",
-        "happy_zone",
-    ]
-
-    with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for r in results:
-            row = {
-                "ticker": r.ticker,
-                "name": r.name or "",
-                "sector": r.sector or "",
-                "price": r.price,
-                "change_percent": r.change_percent,
-                "volume": r.volume,
-                "rsi_14": r.rsi_14,
-                "macd": r.macd,
-                "macd_signal": r.macd_signal,
-                "sma_20": r.sma_20,
-                "sma_50": r.sma_50,
-                "pe_ratio": r.pe_ratio,
-                "pb_ratio": r.pb_ratio,
-                "roe": r.roe,
-                "dividend_yield": r.dividend_yield,
-                "market_cap": r.market_cap,
-                "score": r.score,
-                "signals": "; ".join(r.signals) if r.signals else "",
-                # Happy Lines (樂活五線譜)
-                "happy_line_1": r.happy_lines.line_1 if r.happy_lines else None,
-                "happy_line_2": r.happy_lines.line_2 if r.happy_lines else None,
-                "happy_line_3": r.happy_lines.line_3 if r.happy_lines else None,
-                "happy_line_4": r.happy_lines.line_4 if r.happy_lines else None,
-                "happy_line_5": r.happy_lines.line_5 if r.happy_lines else None,
-                "happy_position_ratio": f"{r.happy_lines.position_ratio:.2f}%"
-                if r.happy_lines
-                else None,
-                "happy_zone": r.happy_lines.zone.value if r.happy_lines else None,
-            }
-            writer.writerow(row)
+    # Render in memory, then write the file in one call
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_HEADER)
+    writer.writerows(_csv_row(r) for r in results)
+    filepath.write_bytes(buffer.getvalue().encode("utf-8-sig"))
 
     return str(filepath)
 
@@ -310,31 +304,25 @@ async def smart_money_command(app: "PulseApp", args: str) -> str:
       /smart-money --listed --fast   # 上市公司，快速模式
       /smart-money --min=60 --limit=10  # 高分篩選
     """
-    import re
+    options, _ = _parse_options(args)
 
-    # Parse market type (mutually exclusive)
-    market = "tw50"  # default
-    if "--listed" in args.lower():
-        market = "listed"
-    elif "--otc" in args.lower():
-        market = "otc"
-    elif "--all" in args.lower():
-        market = "all"
+    # Parse market type (mutually exclusive, first match wins)
+    market = next((m for m in ("listed", "otc", "all") if m in options), "tw50")
 
     # Parse other options
-    fast_mode = "--fast" in args.lower()
+    fast_mode = "fast" in options
     min_score = 40.0
     limit = 20
 
-    if "--min=" in args.lower():
-        match = re.search(r"--min=(\d+\.?\d*)", args.lower())
-        if match:
-            min_score = float(match.group(1))
+    try:
+        min_score = float(options.get("min") or min_score)
+    except ValueError:
+        pass
 
-    if "--limit=" in args.lower():
-        match = re.search(r"--limit=(\d+)", args.lower())
-        if match:
-            limit = int(match.group(1))
+    try:
+        limit = int(options.get("limit") or limit)
+    except ValueError:
+        pass
 
     from pulse.core.smart_money_screener import SmartMoneyScreener
 
@@ -3,7 +3,7 @@
 提供命令來抓取台灣上市/上櫃股票代碼清單。
 """
 
-import argparse
+import asyncio
 from typing import TYPE_CHECKING
 
 from pulse.core.data.stock_list_fetcher import StockListFetcher
@@ -15,48 +15,27 @@ if TYPE_CHECKING:
 log = get_logger(__name__)
 
 
+# /stocks flags and the result keys they set
+STOCKS_FLAGS = {
+    "--json": "json",  # Save to JSON file (預設: data/stock_list.json)
+    "--csv": "csv",  # Save to CSV files (twse_stocks.csv, tpex_stocks.csv)
+    "--twse": "twse_only",  # Only fetch TWSE (上市) stocks
+    "--tpex": "tpex_only",  # Only fetch TPEx (上櫃) stocks
+    "--tickers": "tickers_only",  # Return only ticker codes (one per line)
+    "--sync": "sync",  # Refresh and save all stock list files for scheduled updates
+    "--no-cache": "no_cache",  # Bypass the daily stock list cache and re-download
+}
+
+
 def parse_stocks_args(args: str) -> dict:
     """Parse /stocks command arguments."""
-    parser = argparse.ArgumentParser(
-        prog="/stocks",
-        description="Fetch Taiwan stock code list (上市/上櫃股票代碼清單)",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Save to JSON file (預設: data/stock_list.json)",
-    )
-    parser.add_argument(
-        "--csv",
-        action="store_true",
-        help="Save to CSV files (twse_stocks.csv, tpex_stocks.csv)",
-    )
-    parser.add_argument("--twse", action="store_true", help="Only fetch TWSE (上市) stocks")
-    parser.add_argument("--tpex", action="store_true", help="Only fetch TPEx (上櫃) stocks")
-    parser.add_argument(
-        "--tickers",
-        action="store_true",
-        help="Return only ticker codes (one per line)",
-    )
-    parser.add_argument(
-        "--sync",
-        action="store_true",
-        help="Refresh and save all stock list files for scheduled updates",
-    )
+    tokens = set(args.split()) if args else set()
 
-    try:
-        parsed = parser.parse_args(args.split() if args else [])
-        return {
-            "json": parsed.json,
-            "csv": parsed.csv,
-            "twse_only": parsed.twse,
-            "tpex_only": parsed.tpex,
-            "tickers_only": parsed.tickers,
-            "sync": parsed.sync,
-        }
-    except SystemExit:
+    if not tokens <= STOCKS_FLAGS.keys():
         return {"error": "Invalid arguments"}
 
+    return {key: flag in tokens for flag, key in STOCKS_FLAGS.items()}
+
 
 async def stocks_command(app: "PulseApp", args: str) -> str:
     """Execute /stocks command.
@@ -77,15 +56,22 @@ async def stocks_command(app: "PulseApp", args: str) -> str:
     parsed = parse_stocks_args(args)
 
     if "error" in parsed:
-        return "無效的參數。使用方式: /stocks [--json] [--csv] [--twse] [--tpex] [--tickers]"
+        return (
+            "無效的參數。使用方式: "
+            "/stocks [--json] [--csv] [--twse] [--tpex] [--tickers] [--no-cache]"
+        )
 
-    fetcher = StockListFetcher(token=token)
+    # --sync is a scheduled refresh, so it always re-downloads
+    use_cache = not (parsed.get("no_cache") or parsed.get("sync"))
+    fetcher = StockListFetcher(token=token, use_cache=use_cache)
 
     try:
         if parsed.get("sync"):
-            files = fetcher.save_all_for_main_program()
-            twse_stocks = fetcher.get_twse_stocks()
-            tpex_stocks = fetcher.get_tpex_stocks()
+            files = await asyncio.to_thread(fetcher.save_all_for_main_program)
+            twse_stocks, tpex_stocks = await asyncio.gather(
+                asyncio.to_thread(fetcher.get_twse_stocks),
+                asyncio.to_thread(fetcher.get_tpex_stocks),
+            )
 
             return "\n".join(
                 [
@@ -103,14 +89,14 @@ async def stocks_command(app: "PulseApp", args: str) -> str:
                 ]
             )
 
-        # Fetch data
-        twse_stocks = []
-        tpex_stocks = []
+        # Fetch data off the event loop, both markets concurrently
+        async def fetch_market(enabled: bool, fetch) -> list[dict]:
+            return await asyncio.to_thread(fetch) if enabled else []
 
-        if not parsed.get("tpex_only"):
-            twse_stocks = fetcher.get_twse_stocks()
-        if not parsed.get("twse_only"):
-            tpex_stocks = fetcher.get_tpex_stocks()
+        twse_stocks, tpex_stocks = await asyncio.gather(
+            fetch_market(not parsed.get("tpex_only"), fetcher.get_twse_stocks),
+            fetch_market(not parsed.get("twse_only"), fetcher.get_tpex_stocks),
+        )
 
         # Handle tickers-only output
         if parsed.get("tickers_only"):
@@ -122,7 +108,10 @@ async def stocks_command(app: "PulseApp", args: str) -> str:
                 all_tickers = [s["ticker"] for s in twse_stocks] + [
                     s["ticker"] for s in tpex_stocks
                 ]
-                return "\n".join(sorted(all_tickers))
+                # Numeric codes compare as ints (keeping leading zeros), others follow
+                numeric = sorted((t for t in all_tickers if t.isdigit()), key=int)
+                other = sorted(t for t in all_tickers if not t.isdigit())
+                return "\n".join(numeric + other)
 
         # Save files if requested
         files_info = []
@@ -161,7 +150,7 @@ async def stocks_command(app: "PulseApp", args: str) -> str:
                         stock["industry"] or "N/A",
                     )
 
-                console.print(table)
+                await asyncio.to_thread(console.print, table)
 
         if not parsed.get("twse_only"):
             result_lines.append(f"上櫃 (TPEx): {len(tpex_stocks)} 檔股票")
@@ -178,7 +167,7 @@ async def stocks_command(app: "PulseApp", args: str) -> str:
                         stock["industry"] or "N/A",
                     )
 
-                console.print(table)
+                await asyncio.to_thread(console.print, table)
 
         if files_info:
             result_lines.append("\n已儲存:")
@@ -1,12 +1,39 @@
 """Data review screen for confirming analysis data before sending to AI."""
 
+from collections.abc import Iterator
+
+from rich.cells import cell_len
+from rich.segment import Segment
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Vertical, VerticalScroll
+from textual.containers import Container, Vertical
+from textual.geometry import Size
 from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.widgets import Button, Static, TextArea
 
 
+class LazyDataView(ScrollView):
+    """Scrollable plain-text view that only renders the lines in the viewport."""
+
+    def __init__(self, lines: list[str], *, classes: str | None = None):
+        super().__init__(classes=classes)
+        # One entry per visual row: values such as a broker summary may span lines
+        self.lines = [row for line in lines for row in line.split("\n")]
+        width = max((cell_len(line) for line in self.lines), default=0)
+        self.virtual_size = Size(width, len(self.lines))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row of the view."""
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        if index >= len(self.lines):
+            return Strip.blank(self.size.width, self.rich_style)
+        strip = Strip([Segment(self.lines[index], self.rich_style)])
+        return strip.crop(scroll_x, scroll_x + self.size.width)
+
+
 class DataReviewScreen(ModalScreen):
     """Modal screen for reviewing analysis data before sending to AI."""
 
@@ -40,6 +67,7 @@ class DataReviewScreen(ModalScreen):
     }
 
     DataReviewScreen .data-content {
+        height: 1fr;
         background: #161b22;
         padding: 1 2;
         color: #c9d1d9;
@@ -105,19 +133,28 @@ class DataReviewScreen(ModalScreen):
         Binding("ctrl+enter", "confirm", "確認送出"),
     ]
 
-    def __init__(self, ticker: str, data: dict, formatted_data: str):
+    def __init__(self, ticker: str, data: dict, formatted_data: str | None = None):
         super().__init__()
         self.ticker = ticker
         self.data = data
-        self.formatted_data = formatted_data
+        # Kept only as lines; the data panel renders just the ones in view
+        if formatted_data is None:
+            self._lines = format_analysis_lines(ticker, data)
+        else:
+            self._lines = formatted_data.split("\n")
         self.user_notes = ""
 
+    @property
+    def formatted_data(self) -> str:
+        """Formatted analysis data shown in the data panel."""
+        return "\n".join(self._lines)
+
     def compose(self) -> ComposeResult:
         with Container():
             yield Static(f"📊 {self.ticker} 數據確認", classes="header")
 
-            with VerticalScroll(classes="data-scroll"):
-                yield Static(self.formatted_data, classes="data-content")
+            with Container(classes="data-scroll"):
+                yield LazyDataView(self._lines, classes="data-content")
 
             with Vertical(classes="notes-container"):
                 yield Static(
@@ -151,18 +188,45 @@ class DataReviewScreen(ModalScreen):
         self.dismiss({"confirmed": False, "notes": ""})
 
 
-def format_analysis_data(ticker: str, data: dict) -> str:
-    """Format analysis data for display."""
-    lines = []
+_RULE = "=" * 50
+
+# Top-level sections rendered by format_analysis_data, in display order
+_SECTIONS = ("stock", "technical", "fundamental", "broker")
+
+_FOOTER = (
+    _RULE,
+    "💡 提示：",
+    "- 在下方文字框中添加補充資訊（新聞、事件、觀察等）",
+    "- 按 Ctrl+Enter 確認送出",
+    "- 按 Esc 取消分析",
+)
+
+
+def _metric_lines(metrics: dict, suffix: str = "") -> Iterator[str]:
+    """Yield indented ``key: value`` lines, formatting numbers to two decimals."""
+    return (
+        f"  {key}: {value:.2f}{suffix}" if isinstance(value, (int, float)) else f"  {key}: {value}"
+        for key, value in metrics.items()
+    )
+
+
+def format_analysis_lines(ticker: str, data: dict) -> list[str]:
+    """Format analysis data for display as a list of lines."""
+    if not any(data.get(section) for section in _SECTIONS):
+        return list(_FOOTER)
+
+    lines: list[str] = []
 
     # Stock info
     if stock := data.get("stock"):
         lines.append("📈 股票基本資訊")
-        lines.append("=" * 50)
+        lines.append(_RULE)
         lines.append(f"代碼: {stock.get('ticker', 'N/A')}")
         lines.append(f"名稱: {stock.get('name', 'N/A')}")
         lines.append(f"當前價格: NT$ {stock.get('price', 0):.2f}")
-        lines.append(f"漲跌: {stock.get('change', 0):.2f} ({stock.get('change_percent', 0):.2f}%)")
+        lines.append(
+            f"漲跌: {stock.get('change', 0):.2f} ({stock.get('change_percent', 0):.2f}%)"
+        )
         lines.append(f"成交量: {stock.get('volume', 0):,}")
         if stock.get("market_cap"):
             lines.append(f"市值: {stock.get('market_cap', 0):,.0f}")
@@ -171,24 +235,23 @@ def format_analysis_data(ticker: str, data: dict) -> str:
     # Technical analysis
     if technical := data.get("technical"):
         lines.append("📊 技術面分析")
-        lines.append("=" * 50)
+        lines.append(_RULE)
 
         if trend := technical.get("trend"):
             lines.append(f"趨勢: {trend}")
 
         if indicators := technical.get("indicators"):
-            lines.append("\n技術指標:")
-            for key, value in indicators.items():
-                if isinstance(value, (int, float)):
-                    lines.append(f"  {key}: {value:.2f}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            lines.append("")
+            lines.append("技術指標:")
+            lines.extend(_metric_lines(indicators))
 
         if signals := technical.get("signals"):
-            lines.append(f"\n信號: {', '.join(signals)}")
+            lines.append("")
+            lines.append(f"信號: {', '.join(signals)}")
 
         if support := technical.get("support"):
-            lines.append(f"\n支撐: NT$ {support:.2f}")
+            lines.append("")
+            lines.append(f"支撐: NT$ {support:.2f}")
         if resistance := technical.get("resistance"):
             lines.append(f"壓力: NT$ {resistance:.2f}")
 
@@ -197,38 +260,28 @@ def format_analysis_data(ticker: str, data: dict) -> str:
     # Fundamental analysis
     if fundamental := data.get("fundamental"):
         lines.append("💼 基本面分析")
-        lines.append("=" * 50)
+        lines.append(_RULE)
 
         if valuation := fundamental.get("valuation"):
             lines.append("估值指標:")
-            for key, value in valuation.items():
-                if isinstance(value, (int, float)):
-                    lines.append(f"  {key}: {value:.2f}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            lines.extend(_metric_lines(valuation))
 
         if profitability := fundamental.get("profitability"):
-            lines.append("\n獲利能力:")
-            for key, value in profitability.items():
-                if isinstance(value, (int, float)):
-                    lines.append(f"  {key}: {value:.2f}%")
-                else:
-                    lines.append(f"  {key}: {value}")
+            lines.append("")
+            lines.append("獲利能力:")
+            lines.extend(_metric_lines(profitability, "%"))
 
         if growth := fundamental.get("growth"):
-            lines.append("\n成長性:")
-            for key, value in growth.items():
-                if isinstance(value, (int, float)):
-                    lines.append(f"  {key}: {value:.2f}%")
-                else:
-                    lines.append(f"  {key}: {value}")
+            lines.append("")
+            lines.append("成長性:")
+            lines.extend(_metric_lines(growth, "%"))
 
         lines.append("")
 
     # Broker/institutional flow
     if broker := data.get("broker"):
         lines.append("🏦 法人動向")
-        lines.append("=" * 50)
+        lines.append(_RULE)
 
         if isinstance(broker, dict):
             if foreign := broker.get("foreign"):
@@ -241,16 +294,18 @@ def format_analysis_data(ticker: str, data: dict) -> str:
                 lines.append(f"自營商買賣超: {dealer.get('net_buy', 0):,.0f} 張")
 
             if summary := broker.get("summary"):
-                lines.append(f"\n近期趨勢: {summary}")
+                lines.append("")
+                lines.append(f"近期趨勢: {summary}")
         else:
             lines.append(str(broker))
 
         lines.append("")
 
-    lines.append("=" * 50)
-    lines.append("💡 提示：")
-    lines.append("- 在下方文字框中添加補充資訊（新聞、事件、觀察等）")
-    lines.append("- 按 Ctrl+Enter 確認送出")
-    lines.append("- 按 Esc 取消分析")
+    lines.extend(_FOOTER)
+
+    return lines
+
 
-    return "\n".join(lines)
+def format_analysis_data(ticker: str, data: dict) -> str:
+    """Format analysis data for display."""
+    return "\n".join(format_analysis_lines(ticker, data))
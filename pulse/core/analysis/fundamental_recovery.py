@@ -9,12 +9,10 @@ Provides intelligent recovery and estimation for missing/incomplete fundamental
 5. Reasonable defaults with caveats
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
-from pulse.core.data.finmind_data import FinMindFetcher
-from pulse.core.data.stock_data_provider import StockDataProvider
-from pulse.core.data.yfinance import YFinanceFetcher
 from pulse.core.models import FundamentalData
 from pulse.utils.logger import get_logger
 
@@ -110,6 +108,25 @@ SAFE_DEFAULTS: dict[str, float] = {
     "quick_ratio": 1.0,
 }
 
+# Sector averages backed by the safe defaults, so every tracked metric is present
+_EFFECTIVE_SECTOR: dict[str, dict[str, float]] = {
+    sector: {**SAFE_DEFAULTS, **averages} for sector, averages in SECTOR_AVERAGES.items()
+}
+
+# FundamentalData fields that are not metrics and are never merged
+_METADATA_FIELDS = frozenset({"ticker", "fetched_at"})
+
+# Fields estimated from sector averages when missing, with display names
+ESTIMATED_FIELDS: tuple[tuple[str, str], ...] = (
+    ("pe_ratio", "P/E Ratio"),
+    ("pb_ratio", "P/B Ratio"),
+    ("roe", "ROE"),
+    ("roa", "ROA"),
+    ("debt_to_equity", "Debt/Equity"),
+    ("dividend_yield", "Dividend Yield"),
+    ("revenue_growth", "Revenue Growth"),
+)
+
 
 class FundamentalDataRecovery:
     """
@@ -118,6 +135,10 @@ class FundamentalDataRecovery:
 
     def __init__(self):
         """Initialize recovery engine."""
+        from pulse.core.data.finmind_data import FinMindFetcher
+        from pulse.core.data.stock_data_provider import StockDataProvider
+        from pulse.core.data.yfinance import YFinanceFetcher
+
         self.finmind = FinMindFetcher()
         self.yfinance = YFinanceFetcher()
         self.provider = StockDataProvider()
@@ -146,19 +167,19 @@ class FundamentalDataRecovery:
         if not end_date:
             end_date = datetime.now().strftime("%Y-%m-%d")
 
-        # Step 1: Fetch from multiple sources
-        finmind_data = None
-        yfinance_data = None
-
-        try:
-            finmind_data = await self.finmind.fetch_fundamentals(ticker, start_date, end_date)
-        except Exception as e:
-            log.debug(f"FinMind fetch failed for {ticker}: {e}")
+        # Step 1: Fetch from multiple sources concurrently
+        finmind_data, yfinance_data = await asyncio.gather(
+            self.finmind.fetch_fundamentals(ticker, start_date, end_date),
+            self.yfinance.fetch_fundamentals(ticker),
+            return_exceptions=True,
+        )
 
-        try:
-            yfinance_data = await self.yfinance.fetch_fundamentals(ticker)
-        except Exception as e:
-            log.debug(f"yfinance fetch failed for {ticker}: {e}")
+        if isinstance(finmind_data, Exception):
+            log.debug(f"FinMind fetch failed for {ticker}: {finmind_data}")
+            finmind_data = None
+        if isinstance(yfinance_data, Exception):
+            log.debug(f"yfinance fetch failed for {ticker}: {yfinance_data}")
+            yfinance_data = None
 
         # Step 2: Merge data from multiple sources
         merged_data = self._merge_sources(finmind_data, yfinance_data)
@@ -179,93 +200,47 @@ class FundamentalDataRecovery:
 
         # Get sector for estimation
         sector = sector or merged_data.get("sector") or "Default"
-        sector_averages = SECTOR_AVERAGES.get(sector, SECTOR_AVERAGES["Default"])
-
-        # Recover each field
-        recovered_data = self._recover_field(
-            merged_data,
-            "pe_ratio",
-            sector_averages.get("pe_ratio", SAFE_DEFAULTS["pe_ratio"]),
-            recovery_info,
-            "P/E Ratio",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "pb_ratio",
-            sector_averages.get("pb_ratio", SAFE_DEFAULTS["pb_ratio"]),
-            recovery_info,
-            "P/B Ratio",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "roe",
-            sector_averages.get("roe", SAFE_DEFAULTS["roe"]),
-            recovery_info,
-            "ROE",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "roa",
-            sector_averages.get("roa", SAFE_DEFAULTS["roa"]),
-            recovery_info,
-            "ROA",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "debt_to_equity",
-            sector_averages.get("debt_to_equity", SAFE_DEFAULTS["debt_to_equity"]),
-            recovery_info,
-            "Debt/Equity",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "dividend_yield",
-            sector_averages.get("dividend_yield", SAFE_DEFAULTS["dividend_yield"]),
-            recovery_info,
-            "Dividend Yield",
-        )
-        recovered_data = self._recover_field(
-            recovered_data,
-            "revenue_growth",
-            sector_averages.get("revenue_growth", SAFE_DEFAULTS["revenue_growth"]),
-            recovery_info,
-            "Revenue Growth",
-        )
+        estimates = _EFFECTIVE_SECTOR.get(sector) or _EFFECTIVE_SECTOR["Default"]
+
+        # Recover each field, falling back to the sector average
+        for field_name, display_name in ESTIMATED_FIELDS:
+            if merged_data.get(field_name) is not None:
+                recovery_info["values_recovered"].append(display_name)
+            else:
+                merged_data[field_name] = estimates[field_name]
+                recovery_info["values_estimated"].append(f"{display_name} (sector average)")
 
         # Calculate data quality score
         total_fields = 10  # Key fields we track
-        present_fields = (
-            len(recovery_info["values_recovered"])
-            + len(recovery_info["values_estimated"])
-            + len(recovery_info["values_default"])
-        )
+        # Each estimable field is either retrieved or estimated by the loop above
+        present_fields = len(ESTIMATED_FIELDS)
         recovery_info["data_quality_score"] = round((present_fields / total_fields) * 100, 1)
 
         # Create FundamentalData object
         fundamental_result = FundamentalData(
             ticker=ticker,
-            pe_ratio=recovered_data.get("pe_ratio"),
-            pb_ratio=recovered_data.get("pb_ratio"),
-            ps_ratio=recovered_data.get("ps_ratio"),
-            peg_ratio=recovered_data.get("peg_ratio"),
-            ev_ebitda=recovered_data.get("ev_ebitda"),
-            roe=recovered_data.get("roe"),
-            roa=recovered_data.get("roa"),
-            npm=recovered_data.get("npm"),
-            opm=recovered_data.get("opm"),
-            gpm=recovered_data.get("gpm"),
-            eps=recovered_data.get("eps"),
-            bvps=recovered_data.get("bvps"),
-            dps=recovered_data.get("dps"),
-            revenue_growth=recovered_data.get("revenue_growth"),
-            earnings_growth=recovered_data.get("earnings_growth"),
-            debt_to_equity=recovered_data.get("debt_to_equity"),
-            current_ratio=recovered_data.get("current_ratio"),
-            quick_ratio=recovered_data.get("quick_ratio"),
-            dividend_yield=recovered_data.get("dividend_yield"),
-            payout_ratio=recovered_data.get("payout_ratio"),
-            market_cap=recovered_data.get("market_cap"),
-            enterprise_value=recovered_data.get("enterprise_value"),
+            pe_ratio=merged_data.get("pe_ratio"),
+            pb_ratio=merged_data.get("pb_ratio"),
+            ps_ratio=merged_data.get("ps_ratio"),
+            peg_ratio=merged_data.get("peg_ratio"),
+            ev_ebitda=merged_data.get("ev_ebitda"),
+            roe=merged_data.get("roe"),
+            roa=merged_data.get("roa"),
+            npm=merged_data.get("npm"),
+            opm=merged_data.get("opm"),
+            gpm=merged_data.get("gpm"),
+            eps=merged_data.get("eps"),
+            bvps=merged_data.get("bvps"),
+            dps=merged_data.get("dps"),
+            revenue_growth=merged_data.get("revenue_growth"),
+            earnings_growth=merged_data.get("earnings_growth"),
+            debt_to_equity=merged_data.get("debt_to_equity"),
+            current_ratio=merged_data.get("current_ratio"),
+            quick_ratio=merged_data.get("quick_ratio"),
+            dividend_yield=merged_data.get("dividend_yield"),
+            payout_ratio=merged_data.get("payout_ratio"),
+            market_cap=merged_data.get("market_cap"),
+            enterprise_value=merged_data.get("enterprise_value"),
         )
 
         return fundamental_result, recovery_info
@@ -276,84 +251,16 @@ class FundamentalDataRecovery:
         """
         Merge data from multiple sources, preferring actual values over None.
         """
-        merged: dict[str, Any] = {}
-
-        # All fields to merge
-        fields = [
-            "pe_ratio",
-            "pb_ratio",
-            "ps_ratio",
-            "peg_ratio",
-            "ev_ebitda",
-            "roe",
-            "roa",
-            "npm",
-            "opm",
-            "gpm",
-            "eps",
-            "bvps",
-            "dps",
-            "revenue_growth",
-            "earnings_growth",
-            "debt_to_equity",
-            "current_ratio",
-            "quick_ratio",
-            "dividend_yield",
-            "payout_ratio",
-            "market_cap",
-            "enterprise_value",
-        ]
-
-        for field in fields:
-            value = None
-
-            # Prefer yfinance for most fields (more comprehensive)
-            if yfinance_data:
-                value = getattr(yfinance_data, field, None)
-
-            # Fall back to FinMind if yfinance didn't have it
-            if value is None and finmind_data:
-                value = getattr(finmind_data, field, None)
-
-            merged[field] = value
+        # Start from FinMind, then overlay every value yfinance actually has
+        # (yfinance is preferred for most fields as it is more comprehensive)
+        merged: dict[str, Any] = (
+            finmind_data.model_dump(exclude=_METADATA_FIELDS) if finmind_data else {}
+        )
+        if yfinance_data:
+            merged.update(yfinance_data.model_dump(exclude=_METADATA_FIELDS, exclude_none=True))
 
         return merged
 
-    def _recover_field(
-        self,
-        data: dict[str, Any],
-        field_name: str,
-        default_value: float,
-        recovery_info: dict[str, Any],
-        display_name: str,
-    ) -> dict[str, Any]:
-        """
-        Recover a single field using fallback value.
-        """
-        if data.get(field_name) is not None:
-            # Field is already present from source - count as retrieved
-            recovery_info["values_recovered"].append(f"{display_name}")
-            return data
-
-        # Use sector average or safe default
-        data[field_name] = default_value
-
-        # Determine recovery type
-        if field_name in [
-            "pe_ratio",
-            "pb_ratio",
-            "roe",
-            "roa",
-            "debt_to_equity",
-            "dividend_yield",
-            "revenue_growth",
-        ]:
-            recovery_info["values_estimated"].append(f"{display_name} (sector average)")
-        else:
-            recovery_info["values_default"].append(f"{display_name} (default)")
-
-        return data
-
     def get_recovery_report(self, recovery_info: dict[str, Any]) -> str:
         """
         Generate a human-readable recovery report.
@@ -400,6 +307,21 @@ class FundamentalDataRecovery:
         return "\n".join(lines)
 
 
+_default_recovery: FundamentalDataRecovery | None = None
+
+
+def get_recovery() -> FundamentalDataRecovery:
+    """
+    Get the process-wide recovery engine.
+
+    Reused across calls so the underlying fetchers are only constructed once.
+    """
+    global _default_recovery
+    if _default_recovery is None:
+        _default_recovery = FundamentalDataRecovery()
+    return _default_recovery
+
+
 # Convenience function
 async def fetch_fundamentals_with_recovery(
     ticker: str,
@@ -408,5 +330,4 @@ async def fetch_fundamentals_with_recovery(
     """
     Fetch fundamental data with automatic recovery for missing values.
     """
-    recovery = FundamentalDataRecovery()
-    return await recovery.fetch_with_recovery(ticker, sector=sector)
+    return await get_recovery().fetch_with_recovery(ticker, sector=sector)
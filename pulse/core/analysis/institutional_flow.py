@@ -1,8 +1,11 @@
 """Institutional investor flow analysis."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
 from pulse.core.data.stock_data_provider import StockDataProvider
 from pulse.core.models import SignalType
 from pulse.utils.formatters import format_currency
@@ -11,6 +14,105 @@ from pulse.utils.rich_output import ICONS
 
 log = get_logger(__name__)
 
+# FinMind institutional investor names, in the order net totals are reduced
+FLOW_NAMES = ("Foreign_Investor", "Investment_Trust", "Dealer_self", "Dealer_Hedging")
+_FLOW_INDEX = {name: i for i, name in enumerate(FLOW_NAMES)}
+
+# Sign of a net flow -> (icon, insight wording, signal, score)
+FLOW_SIGNS: dict[int, tuple[str, str, SignalType, int]] = {
+    1: (ICONS["green"], "淨買超", SignalType.BUY, 70),
+    -1: (ICONS["red"], "淨賣超", SignalType.SELL, 30),
+    0: (ICONS["white"], "買賣超不明顯", SignalType.NEUTRAL, 50),
+}
+
+_SUMMARY_TEMPLATE = """═══ 機構法人動向: {ticker} ({start} 至 {end}) ═══
+
+總體訊號: {signal} (評分: {score}/100)
+
+─── 機構法人淨買賣超 ───
+總計淨流量: {overall}
+外資淨流量: {foreign}
+投信淨流量: {trust}
+自營商淨流量: {dealer}
+"""
+
+
+@lru_cache(maxsize=256)
+def _compute_flow(
+    rows: tuple[tuple[str, float, float], ...],
+    ticker: str,
+    start: str,
+    end: str,
+    days: int,
+) -> dict[str, Any]:
+    """
+    Compute net flows, signal and insights from (name, buy, sell) rows.
+
+    Pure in its arguments, so results are memoized across repeated analyses.
+    """
+    # Net (buy - sell) per institutional type in one vectorized reduction;
+    # other names (e.g. Foreign_Dealer_Self) get code -1 and are dropped.
+    # Missing buy/sell values count as zero, as in a pandas sum.
+    names, buys, sells = zip(*rows, strict=True)
+    net = np.nan_to_num(np.array(buys)) - np.nan_to_num(np.array(sells))
+    codes = np.fromiter((_FLOW_INDEX.get(name, -1) for name in names), np.intp, len(names))
+    known = codes >= 0
+    totals = np.zeros(len(FLOW_NAMES), dtype=net.dtype)
+    np.add.at(totals, codes[known], net[known])
+
+    (
+        total_foreign_net,
+        total_investment_trust_net,
+        total_dealer_self_net,
+        total_dealer_hedge_net,
+    ) = totals.tolist()
+    total_dealer_net = total_dealer_self_net + total_dealer_hedge_net
+
+    # Overall net flow
+    overall_net_flow = total_foreign_net + total_investment_trust_net + total_dealer_net
+
+    # Format each figure once; used both in the result and the insights
+    overall_fmt = format_currency(overall_net_flow, currency="NT$")
+    foreign_fmt = format_currency(total_foreign_net, currency="NT$")
+    trust_fmt = format_currency(total_investment_trust_net, currency="NT$")
+    dealer_fmt = format_currency(total_dealer_net, currency="NT$")
+
+    analysis = {
+        "ticker": ticker,
+        "analysis_period_start": start,
+        "analysis_period_end": end,
+        "overall_institutional_net_flow": overall_net_flow,
+        "overall_institutional_net_flow_formatted": overall_fmt,
+        "foreign_investor_net": total_foreign_net,
+        "foreign_investor_net_formatted": foreign_fmt,
+        "investment_trust_net": total_investment_trust_net,
+        "investment_trust_net_formatted": trust_fmt,
+        "dealer_net": total_dealer_net,
+        "dealer_net_formatted": dealer_fmt,
+        "insights": [],
+    }
+
+    # Generate insights and determine signal/score from the sign of each flow
+    overall_sign, *type_signs = np.sign(
+        [overall_net_flow, total_foreign_net, total_investment_trust_net, total_dealer_net]
+    ).tolist()
+
+    icon, verb, analysis["signal"], analysis["score"] = FLOW_SIGNS[overall_sign]
+    if overall_sign:
+        analysis["insights"].append(
+            f"{icon} 機構法人總計{verb} {overall_fmt} (過去 {days} 個交易日)"
+        )
+    else:
+        analysis["insights"].append(f"{icon} 機構法人{verb} (過去 {days} 個交易日)")
+
+    type_flows = (("外資", foreign_fmt), ("投信", trust_fmt), ("自營商", dealer_fmt))
+    for (label, formatted), sign in zip(type_flows, type_signs, strict=True):
+        if sign:
+            icon, verb, _, _ = FLOW_SIGNS[sign]
+            analysis["insights"].append(f"{icon} {label}{verb} {formatted}")
+
+    return analysis
+
 
 class InstitutionalFlowAnalyzer:
     """Analyze institutional investor flow for Taiwan stocks."""
@@ -54,122 +156,38 @@ class InstitutionalFlowAnalyzer:
         # Process the institutional data
         # FinMind returns data in "long format" with columns: date, stock_id, name, buy, sell
         # where 'name' can be: Foreign_Investor, Investment_Trust, Dealer_self, Dealer_Hedging, Foreign_Dealer_Self
-
-        # Pivot to calculate net for each institutional type
-        # Group by name and sum buy/sell
-        summary = (
-            institutional_data_df.groupby("name").agg({"buy": "sum", "sell": "sum"}).reset_index()
-        )
-        summary["net"] = summary["buy"] - summary["sell"]
-
-        # Create a lookup dictionary
-        net_by_name = dict(zip(summary["name"], summary["net"]))
-
-        # Map to our analysis
-        total_foreign_net = net_by_name.get("Foreign_Investor", 0)
-        total_investment_trust_net = net_by_name.get("Investment_Trust", 0)
-        total_dealer_self_net = net_by_name.get("Dealer_self", 0)
-        total_dealer_hedge_net = net_by_name.get("Dealer_Hedging", 0)
-        total_dealer_net = total_dealer_self_net + total_dealer_hedge_net
-
-        # Overall net flow
-        overall_net_flow = total_foreign_net + total_investment_trust_net + total_dealer_net
-
-        analysis = {
-            "ticker": ticker,
-            "analysis_period_start": start_date_str,
-            "analysis_period_end": end_date_str,
-            "overall_institutional_net_flow": overall_net_flow,
-            "overall_institutional_net_flow_formatted": format_currency(
-                overall_net_flow, currency="NT$"
-            ),
-            "foreign_investor_net": total_foreign_net,
-            "foreign_investor_net_formatted": format_currency(total_foreign_net, currency="NT$"),
-            "investment_trust_net": total_investment_trust_net,
-            "investment_trust_net_formatted": format_currency(
-                total_investment_trust_net, currency="NT$"
-            ),
-            "dealer_net": total_dealer_net,
-            "dealer_net_formatted": format_currency(total_dealer_net, currency="NT$"),
-            "insights": [],
-            "signal": SignalType.NEUTRAL,
-            "score": 50,
-        }
-
-        # Generate insights and determine signal/score
-        if overall_net_flow > 0:
-            analysis["signal"] = SignalType.BUY
-            analysis["score"] = 70
-            analysis["insights"].append(
-                f"{ICONS['green']} 機構法人總計淨買超 {analysis['overall_institutional_net_flow_formatted']} (過去 {days} 個交易日)"
-            )
-        elif overall_net_flow < 0:
-            analysis["signal"] = SignalType.SELL
-            analysis["score"] = 30
-            analysis["insights"].append(
-                f"{ICONS['red']} 機構法人總計淨賣超 {analysis['overall_institutional_net_flow_formatted']} (過去 {days} 個交易日)"
-            )
-        else:
-            analysis["insights"].append(
-                f"{ICONS['white']} 機構法人買賣超不明顯 (過去 {days} 個交易日)"
-            )
-
-        if total_foreign_net > 0:
-            analysis["insights"].append(
-                f"{ICONS['green']} 外資淨買超 {analysis['foreign_investor_net_formatted']}"
-            )
-        elif total_foreign_net < 0:
-            analysis["insights"].append(
-                f"{ICONS['red']} 外資淨賣超 {analysis['foreign_investor_net_formatted']}"
-            )
-
-        if total_investment_trust_net > 0:
-            analysis["insights"].append(
-                f"{ICONS['green']} 投信淨買超 {analysis['investment_trust_net_formatted']}"
-            )
-        elif total_investment_trust_net < 0:
-            analysis["insights"].append(
-                f"{ICONS['red']} 投信淨賣超 {analysis['investment_trust_net_formatted']}"
-            )
-
-        if total_dealer_net > 0:
-            analysis["insights"].append(
-                f"{ICONS['green']} 自營商淨買超 {analysis['dealer_net_formatted']}"
-            )
-        elif total_dealer_net < 0:
-            analysis["insights"].append(
-                f"{ICONS['red']} 自營商淨賣超 {analysis['dealer_net_formatted']}"
+        # Snapshot the rows as a hashable key so identical data reuses the computed result
+        rows = tuple(
+            zip(
+                institutional_data_df["name"].tolist(),
+                institutional_data_df["buy"].tolist(),
+                institutional_data_df["sell"].tolist(),
+                strict=True,
             )
+        )
+        analysis = _compute_flow(rows, ticker, start_date_str, end_date_str, days)
 
-        return analysis
+        # Copy so callers cannot mutate the memoized result
+        return {**analysis, "insights": list(analysis["insights"])}
 
     def format_summary_table(self, analysis: dict[str, Any]) -> str:
         """Format analysis as ASCII table."""
-        lines = []
-        lines.append(
-            f"═══ 機構法人動向: {analysis['ticker']} ({analysis['analysis_period_start']} 至 {analysis['analysis_period_end']}) ═══"
-        )
-        lines.append("")
-
-        # Signal
         signal = analysis.get("signal", SignalType.NEUTRAL)
-        score = analysis.get("score", 50)
-        lines.append(f"總體訊號: {signal.value} (評分: {score}/100)")
-        lines.append("")
-
-        # Institutional Net Flow Summary
-        lines.append("─── 機構法人淨買賣超 ───")
-        lines.append(f"總計淨流量: {analysis.get('overall_institutional_net_flow_formatted', '-')}")
-        lines.append(f"外資淨流量: {analysis.get('foreign_investor_net_formatted', '-')}")
-        lines.append(f"投信淨流量: {analysis.get('investment_trust_net_formatted', '-')}")
-        lines.append(f"自營商淨流量: {analysis.get('dealer_net_formatted', '-')}")
-        lines.append("")
+        output = _SUMMARY_TEMPLATE.format(
+            ticker=analysis["ticker"],
+            start=analysis["analysis_period_start"],
+            end=analysis["analysis_period_end"],
+            signal=signal.value,
+            score=analysis.get("score", 50),
+            overall=analysis.get("overall_institutional_net_flow_formatted", "-"),
+            foreign=analysis.get("foreign_investor_net_formatted", "-"),
+            trust=analysis.get("investment_trust_net_formatted", "-"),
+            dealer=analysis.get("dealer_net_formatted", "-"),
+        )
 
         # Insights
         insights = analysis.get("insights", [])
         if insights:
-            lines.append("─── 洞察報告 ───")
-            for insight in insights:
-                lines.append(insight)
+            output += "\n─── 洞察報告 ───\n" + "\n".join(insights)
 
-        return "\n".join(lines)
+        return output
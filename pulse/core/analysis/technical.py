@@ -1,13 +1,17 @@
 """Technical analysis engine."""
 
-from datetime import datetime
-
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 try:
-    from ta.momentum import RSIIndicator, StochasticOscillator
-    from ta.trend import MACD, EMAIndicator, SMAIndicator
-    from ta.volatility import AverageTrueRange, BollingerBands
     from ta.volume import MFIIndicator, OnBalanceVolumeIndicator
 
     HAS_TA = True
@@ -29,13 +33,240 @@ from pulse.utils.logger import get_logger
 log = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _history_range(today: date, days: int = 365) -> tuple[str, str]:
+    """(start, end) date strings covering ``days`` up to ``today``; these only change daily."""
+    return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+
+def _lowercase_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with lowercase column names, only copying when a rename is needed.
+
+    Data providers already emit lowercase OHLCV columns, so this is normally a no-op.
+    """
+    columns = [str(col).lower() for col in df.columns]
+    if columns == list(df.columns):
+        return df
+    return df.set_axis(columns, axis=1)
+
+
+def _tail_mean(values: np.ndarray, window: int) -> float:
+    """Mean of the last ``window`` values (NaN if fewer), like ``rolling(window).mean()[-1]``."""
+    if len(values) < window:
+        return float("nan")
+    return float(values[-window:].mean())
+
+
+def _tail_std(values: np.ndarray, window: int) -> float:
+    """Population std of the last ``window`` values (NaN if fewer), as Bollinger Bands use."""
+    if len(values) < window:
+        return float("nan")
+    return float(values[-window:].std())
+
+
+def _tail_stochastic(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int = 14, d_n: int = 3
+) -> tuple[float, float]:
+    """Latest stochastic %K and its ``d_n``-bar mean %D, from the trailing bars only."""
+    if len(close) < n:
+        return float("nan"), float("nan")
+    need = n + d_n - 1
+    highest = sliding_window_view(high[-need:], n).max(axis=1)
+    lowest = sliding_window_view(low[-need:], n).min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = 100 * (close[-len(highest) :] - lowest) / (highest - lowest)
+    d = k.mean() if len(k) == d_n else float("nan")
+    return float(k[-1]), float(d)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window`` mean aligned to ``values``, like ``rolling(window).mean()``.
+
+    Positions before the first full window, or whose window holds a NaN, are NaN.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1 :] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window`` population std aligned to ``values``, like ``rolling().std(ddof=0)``."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1 :] = sliding_window_view(values, window).std(axis=1)
+    return out
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range per bar; the first bar, with no previous close, is ``high - low``."""
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def _wilder_atr(tr: np.ndarray, n: int) -> np.ndarray:
+    """ATR series as the ta library computes it.
+
+    Zero before bar ``n - 1``, seeded there with the mean of the first ``n`` true
+    ranges, then Wilder-smoothed. Raises IndexError with fewer than ``n`` bars.
+    """
+    atr = np.zeros(len(tr))
+    atr[n - 1] = np.nanmean(tr[:n])
+    for i in range(n, len(tr)):
+        atr[i] = (atr[i - 1] * (n - 1) + tr[i]) / n
+    return atr
+
+
+def _window_midpoint(high: np.ndarray, low: np.ndarray, window: int, lag: int = 0) -> float:
+    """Midpoint of the highest high and lowest low over ``window`` bars ending ``lag`` bars back.
+
+    Matches ``(high.rolling(window).max() + low.rolling(window).min()) / 2`` at
+    position ``-1 - lag``, including NaN when fewer than ``window`` bars exist.
+    """
+    end = len(high) - lag
+    if end < window:
+        return float("nan")
+    return float(high[end - window : end].max() + low[end - window : end].min()) / 2
+
+
+def _ema(values: pd.Series, span: int) -> pd.Series:
+    """EMA that is NaN until ``span`` observations, as the ta library computes it."""
+    return values.ewm(span=span, min_periods=span, adjust=False).mean()
+
+
+def _macd(
+    close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
+) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """MACD line, signal line and histogram, matching the ta library's ``MACD``."""
+    macd = _ema(close, fast) - _ema(close, slow)
+    macd_signal = _ema(macd, signal)
+    return macd, macd_signal, macd - macd_signal
+
+
+def _rsi(close: np.ndarray, n: int = 14) -> np.ndarray:
+    """RSI series with Wilder smoothing, matching the ta library's ``RSIIndicator``.
+
+    Gains and losses share one ``ewm`` pass; the first ``n - 1`` values are NaN and
+    a window with no losses reads 100.
+    """
+    diff = np.diff(close, prepend=np.nan)
+    moves = pd.DataFrame(
+        {"up": np.where(diff > 0, diff, 0.0), "dn": np.where(diff < 0, -diff, 0.0)}
+    )
+    smoothed = moves.ewm(alpha=1 / n, min_periods=n, adjust=False).mean().to_numpy()
+    up, dn = smoothed[:, 0], smoothed[:, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(dn == 0, 100.0, 100 - 100 / (1 + up / dn))
+
+
+def _adx_arrays(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute (ADX, +DI, -DI) arrays using simple moving average smoothing."""
+    tr = _true_range(high, low, close)
+
+    up = np.concatenate(([np.nan], np.diff(high)))
+    down = np.concatenate(([np.nan], -np.diff(low)))
+    # +DM wins ties against -DM only when strictly larger; -DM is compared with the
+    # already-filtered +DM. NaN comparisons are False, so the first bar is 0.
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > plus_dm) & (down > 0), down, 0.0)
+
+    # A zero denominator (no range or no directional movement, e.g. a flat
+    # market) reads as 0 rather than NaN, which would blank every later ADX
+    # window; the NaN warm-up before the first full window is kept
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atr = _rolling_mean(tr, n)
+        plus_di = np.where(atr == 0, 0.0, _rolling_mean(plus_dm, n) / atr * 100)
+        minus_di = np.where(atr == 0, 0.0, _rolling_mean(minus_dm, n) / atr * 100)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum == 0, 0.0, np.abs(plus_di - minus_di) / di_sum * 100)
+    return _rolling_mean(dx, n), plus_di, minus_di
+
+
+def _last_or_none(values: np.ndarray) -> float | None:
+    """Last value as a float, or None when empty or NaN."""
+    if len(values) == 0 or np.isnan(values[-1]):
+        return None
+    return float(values[-1])
+
+
+def _rsi_status(indicators: TechnicalIndicators) -> str:
+    """Summary status for RSI (14)."""
+    rsi = indicators.rsi_14
+    return "Oversold" if rsi < 30 else "Overbought" if rsi > 70 else "Neutral"
+
+
+def _macd_status(indicators: TechnicalIndicators) -> str:
+    """Summary status for MACD against its signal line."""
+    return "Bullish" if indicators.macd > indicators.macd_signal else "Bearish"
+
+
+def _has_bands(indicators: TechnicalIndicators) -> bool:
+    """Whether both Bollinger Bands are available for the summary."""
+    return bool(indicators.bb_upper and indicators.bb_lower)
+
+
+# Happy Lines signal by (zone, trend). Oversold/undervalued zones buy and
+# overbought/overvalued zones sell, unless the trend still runs against them
+# (then wait for the reversal); the balanced zone and unlisted pairs are neutral
+_HAPPY_SIGNALS: dict[tuple[HappyZone, TrendType], SignalType] = {
+    (HappyZone.OVERSOLD, TrendType.BULLISH): SignalType.STRONG_BUY,
+    (HappyZone.OVERSOLD, TrendType.SIDEWAYS): SignalType.BUY,
+    (HappyZone.UNDERVALUED, TrendType.BULLISH): SignalType.STRONG_BUY,
+    (HappyZone.UNDERVALUED, TrendType.SIDEWAYS): SignalType.BUY,
+    (HappyZone.OVERBOUGHT, TrendType.BEARISH): SignalType.STRONG_SELL,
+    (HappyZone.OVERBOUGHT, TrendType.SIDEWAYS): SignalType.SELL,
+    (HappyZone.OVERVALUED, TrendType.BEARISH): SignalType.STRONG_SELL,
+    (HappyZone.OVERVALUED, TrendType.SIDEWAYS): SignalType.SELL,
+}
+
+# Happy Lines results kept per analyzer, keyed by (ticker, period, lookback, day)
+HAPPY_LINES_CACHE_SIZE = 256
+
+# Fewest bars calculate_indicators can fill: the 14-bar ATR seed window
+_MIN_FRAME_BARS = 14
+
+
+# Indicator summary rows, in display order:
+# (name, field, value format, whether shown, status or None for no status)
+_SummaryRow = tuple[
+    str,
+    str,
+    str,
+    Callable[[TechnicalIndicators], bool],
+    Callable[[TechnicalIndicators], str] | None,
+]
+_SUMMARY_SPEC: tuple[_SummaryRow, ...] = (
+    ("RSI (14)", "rsi_14", "{:.2f}", lambda i: bool(i.rsi_14), _rsi_status),
+    (
+        "MACD",
+        "macd",
+        "{:.2f}",
+        lambda i: i.macd is not None and i.macd_signal is not None,
+        _macd_status,
+    ),
+    ("SMA 20", "sma_20", "{:,.0f}", lambda i: bool(i.sma_20), None),
+    ("SMA 50", "sma_50", "{:,.0f}", lambda i: bool(i.sma_50), None),
+    ("BB Upper", "bb_upper", "{:,.0f}", _has_bands, None),
+    ("BB Lower", "bb_lower", "{:,.0f}", _has_bands, None),
+)
+
+
 class TechnicalAnalyzer:
     """Technical analysis engine using ta library."""
 
+    # Fewest calendar days of history fetched for Happy Lines; raise it when a
+    # caller wants more context than the lookback window itself needs
+    min_history_days = 45
+
     def __init__(self):
         """Initialize technical analyzer."""
         self.fetcher = StockDataProvider()
         self.settings = settings.analysis
+        self._happy_lines_cache: OrderedDict[
+            tuple[str, str, int, date], tuple[float, HappyLinesIndicators]
+        ] = OrderedDict()
 
     async def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame | None:
         """
@@ -52,56 +283,63 @@ class TechnicalAnalyzer:
             return None
 
         try:
-            df = df.copy()
-
-            # Ensure column names are lowercase
-            df.columns = df.columns.str.lower()
+            # Ensure column names are lowercase; df.assign below returns a new frame,
+            # so the caller's DataFrame is never modified and needs no copy
+            df = _lowercase_columns(df)
+
+            # ATR needs a full first window to seed its smoothing; bail out before
+            # computing anything rather than failing after most of the work is done.
+            # Longer windows (MA_50, MA_200) are left all-NaN by the rolling helpers
+            # without a pass over the data.
+            if len(df) < _MIN_FRAME_BARS:
+                log.warning(
+                    f"Insufficient data for indicators: {len(df)} bars, need {_MIN_FRAME_BARS}"
+                )
+                return None
 
             close = df["close"]
             high = df["high"]
             low = df["low"]
             volume = df["volume"]
 
-            # Calculate indicators
-            # RSI
-            rsi = RSIIndicator(close, n=14)
-            df["RSI_14"] = rsi.rsi()
-
-            # Moving Averages
-            df["MA_50"] = SMAIndicator(close, n=50).sma_indicator()
-            df["MA_200"] = SMAIndicator(close, n=200).sma_indicator()
-
-            # MACD
-            macd = MACD(close)
-            df["MACD"] = macd.macd()
-            df["MACD_signal"] = macd.macd_signal()
-            df["MACD_hist"] = macd.macd_diff()
-
-            # Bollinger Bands
-            bb = BollingerBands(close, n=20, ndev=2)
-            df["BB_upper"] = bb.bollinger_hband()
-            df["BB_middle"] = bb.bollinger_mavg()
-            df["BB_lower"] = bb.bollinger_lband()
-
-            # ATR
-            atr = AverageTrueRange(high, low, close, n=14)
-            df["ATR"] = atr.average_true_range()
-
-            # EMA for crossover strategies
-            df["EMA_9"] = EMAIndicator(close, n=9).ema_indicator()
-            df["EMA_21"] = EMAIndicator(close, n=21).ema_indicator()
-
-            # MA_20 for strategies
-            df["MA_20"] = SMAIndicator(close, n=20).sma_indicator()
-
-            # Volume SMA for volume confirmation
-            df["Volume_SMA_20"] = SMAIndicator(volume.astype(float), n=20).sma_indicator()
-
-            # ADX (Average Directional Index)
-            df["ADX"] = self._calculate_adx_series(high, low, close, n=14)
-
-            # Bollinger Band width for squeeze detection
-            df["BB_width"] = bb.bollinger_wband()
+            # Moving-window indicators share one float copy of close; the 20-bar
+            # mean serves MA_20 and the Bollinger middle band alike
+            close_np = close.to_numpy(dtype=float)
+            sma_20 = _rolling_mean(close_np, 20)
+            band = 2 * _rolling_std(close_np, 20)
+            bb_upper = sma_20 + band
+            bb_lower = sma_20 - band
+
+            # RSI and the EMA family are computed directly with pandas ewm, as the
+            # ta library does underneath
+            macd, macd_signal, macd_hist = _macd(close)
+
+            df = df.assign(
+                RSI_14=_rsi(close_np, 14),
+                MA_50=_rolling_mean(close_np, 50),
+                MA_200=_rolling_mean(close_np, 200),
+                MACD=macd,
+                MACD_signal=macd_signal,
+                MACD_hist=macd_hist,
+                BB_upper=bb_upper,
+                BB_middle=sma_20,
+                BB_lower=bb_lower,
+                ATR=_wilder_atr(
+                    _true_range(high.to_numpy(dtype=float), low.to_numpy(dtype=float), close_np),
+                    14,
+                ),
+                # EMA for crossover strategies
+                EMA_9=_ema(close, 9),
+                EMA_21=_ema(close, 21),
+                # MA_20 for strategies
+                MA_20=sma_20,
+                # Volume SMA for volume confirmation
+                Volume_SMA_20=_rolling_mean(volume.to_numpy(dtype=float), 20),
+                # ADX (Average Directional Index)
+                ADX=self._calculate_adx_series(high, low, close, n=14),
+                # Bollinger Band width for squeeze detection
+                BB_width=(bb_upper - bb_lower) / sma_20 * 100,
+            )
 
             return df
 
@@ -131,28 +369,24 @@ class TechnicalAnalyzer:
             return None
 
         if df is None:
-            from datetime import datetime, timedelta
-
             # Define date range for fetching data (e.g., 1 year history)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365)
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
+            start_date_str, end_date_str = _history_range(date.today())
 
             # Get historical data
             df = await self.fetcher.fetch_history(
                 ticker, period, start_date=start_date_str, end_date=end_date_str
             )
         else:
-            df = df.copy()
-            df.columns = [str(col).lower() for col in df.columns]
+            df = _lowercase_columns(df)
 
         if df is None or df.empty:
             log.warning(f"No data available for {ticker}")
             return None
 
         try:
-            return self._calculate_indicators(ticker, df)
+            # CPU-bound; run off the event loop so concurrent analyses (and the UI)
+            # are not blocked while indicators are computed
+            return await asyncio.to_thread(self._calculate_indicators, ticker, df)
         except Exception as e:
             log.error(f"Error calculating indicators for {ticker}: {e}")
             return None
@@ -180,27 +414,29 @@ class TechnicalAnalyzer:
         df: pd.DataFrame,
     ) -> TechnicalIndicators:
         """Calculate all technical indicators."""
-        # Ensure we have the required columns
-        df = df.copy()
-
-        # Get latest values
         close = df["close"]
         high = df["high"]
         low = df["low"]
         volume = df["volume"]
 
-        latest_close = float(close.iloc[-1])
+        # Convert the price columns once; the NumPy-based indicators below share them
+        close_np = close.to_numpy(dtype=float)
+        high_np = high.to_numpy(dtype=float)
+        low_np = low.to_numpy(dtype=float)
+        volume_np = volume.to_numpy(dtype=float)
+
+        # Get latest values
+        latest_close = float(close_np[-1])
 
         # === Trend Indicators ===
 
-        # SMA - cache rolling window computations
-        rolling_20 = close.rolling(window=20)
-        rolling_50 = close.rolling(window=50)
-        rolling_200 = close.rolling(window=200)
+        # Only the latest bar is reported, so moving-window indicators are taken
+        # from the trailing bars instead of computing full-length series
 
-        sma_20 = rolling_20.mean().iloc[-1]
-        sma_50 = rolling_50.mean().iloc[-1]
-        sma_200 = rolling_200.mean().iloc[-1] if len(df) >= 200 else None
+        # SMA
+        sma_20 = _tail_mean(close_np, 20)
+        sma_50 = _tail_mean(close_np, 50)
+        sma_200 = _tail_mean(close_np, 200) if len(df) >= 200 else None
 
         # EMA - cached computations
         ema_9 = close.ewm(span=9, adjust=False).mean().iloc[-1]
@@ -210,35 +446,34 @@ class TechnicalAnalyzer:
         # === Momentum Indicators ===
 
         # RSI
-        rsi = RSIIndicator(close, n=14)
-        rsi_14 = float(rsi.rsi().iloc[-1])
+        rsi_14 = float(_rsi(close_np, 14)[-1])
 
         # MACD
-        macd_indicator = MACD(close)
-        macd_val = float(macd_indicator.macd().iloc[-1])
-        macd_signal = float(macd_indicator.macd_signal().iloc[-1])
-        macd_histogram = float(macd_indicator.macd_diff().iloc[-1])
+        macd_line, signal_line, histogram = _macd(close)
+        macd_val = float(macd_line.iloc[-1])
+        macd_signal = float(signal_line.iloc[-1])
+        macd_histogram = float(histogram.iloc[-1])
 
         # Stochastic
-        stoch = StochasticOscillator(high, low, close)
-        stoch_k = float(stoch.stoch().iloc[-1])
-        stoch_d = float(stoch.stoch_signal().iloc[-1])
+        stoch_k, stoch_d = _tail_stochastic(high_np, low_np, close_np)
 
         # === Volatility Indicators ===
 
         # Bollinger Bands
-        bb = BollingerBands(close, n=20, ndev=2)
-        bb_upper = float(bb.bollinger_hband().iloc[-1])
-        bb_middle = float(bb.bollinger_mavg().iloc[-1])
-        bb_lower = float(bb.bollinger_lband().iloc[-1])
-        bb_width = float(bb.bollinger_wband().iloc[-1])
+        bb_middle = sma_20
+        band = 2 * _tail_std(close_np, 20)
+        bb_upper = bb_middle + band
+        bb_lower = bb_middle - band
+        bb_width = (bb_upper - bb_lower) / bb_middle * 100
 
-        # ATR
-        atr = AverageTrueRange(high, low, close, n=14)
-        atr_14 = float(atr.average_true_range().iloc[-1])
+        # ATR; the true range is shared with the Keltner Channel
+        true_range = _true_range(high_np, low_np, close_np)
+        atr_14 = float(_wilder_atr(true_range, 14)[-1])
 
         # Keltner Channel
-        kc_middle, kc_upper, kc_lower = self._calculate_keltner_channel(close, high, low)
+        kc_middle, kc_upper, kc_lower = self._calculate_keltner_channel(
+            close, high, low, true_range=true_range
+        )
 
         # === Volume Indicators ===
 
@@ -253,16 +488,16 @@ class TechnicalAnalyzer:
         # === Advanced Momentum Indicators ===
 
         # ADX (Average Directional Index) - Manual implementation
-        adx_val, adx_pos, adx_neg = self._calculate_adx(high, low, close, n=14)
+        adx_val, adx_pos, adx_neg = self._calculate_adx(high_np, low_np, close_np, n=14)
 
         # CCI (Commodity Channel Index) - Manual implementation
-        cci_val = self._calculate_cci(high, low, close, n=20)
+        cci_val = self._calculate_cci(high_np, low_np, close_np, n=20)
 
         # Ichimoku Cloud (一目均衡表)
-        ichimoku = self._calculate_ichimoku(df)
+        ichimoku = self._calculate_ichimoku(df, high=high_np, low=low_np)
 
         # Volume SMA
-        volume_sma = SMAIndicator(volume.astype(float), n=20).sma_indicator().iloc[-1]
+        volume_sma = _tail_mean(volume_np, 20)
 
         # === Support/Resistance ===
         support_1, support_2, resistance_1, resistance_2 = self._calculate_support_resistance(df)
@@ -325,11 +560,10 @@ class TechnicalAnalyzer:
         window: int = 20,
     ) -> tuple:
         """Calculate support and resistance levels using pivot points."""
-        recent = df.tail(window)
-
-        high = recent["high"].max()
-        low = recent["low"].min()
-        close = recent["close"].iloc[-1]
+        # Reduce the trailing window on raw arrays; nanmax/nanmin skip gaps as pandas does
+        high = np.nanmax(df["high"].to_numpy(dtype=float)[-window:])
+        low = np.nanmin(df["low"].to_numpy(dtype=float)[-window:])
+        close = df["close"].to_numpy(dtype=float)[-1]
 
         # Pivot point
         pivot = (high + low + close) / 3
@@ -349,7 +583,12 @@ class TechnicalAnalyzer:
             float(resistance_2),
         )
 
-    def _calculate_ichimoku(self, df: pd.DataFrame) -> dict[str, float | None]:
+    def _calculate_ichimoku(
+        self,
+        df: pd.DataFrame,
+        high: np.ndarray | None = None,
+        low: np.ndarray | None = None,
+    ) -> dict[str, float | None]:
         """
         Calculate Ichimoku Cloud (一目均衡表) indicators.
 
@@ -359,41 +598,40 @@ class TechnicalAnalyzer:
         Senkou Span B (Leading Span B): (Highest High + Lowest Low) / 2 for 52 periods, plotted 26 ahead
         Chikou Span (Lagging Span): Close plotted 26 periods behind
 
+        Args:
+            df: OHLCV DataFrame
+            high: High prices of ``df`` as a float array (optional)
+            low: Low prices of ``df`` as a float array (optional)
+
         Returns:
             Dictionary with tenkan, kijun, senkou_a, senkou_b, chikou
         """
-        high = df["high"]
-        low = df["low"]
+        if high is None:
+            high = df["high"].to_numpy(dtype=float)
+        if low is None:
+            low = df["low"].to_numpy(dtype=float)
         close = df["close"]
 
         # Need sufficient data for Ichimoku calculations (at least 52 periods)
-        # Senkou Span A/B are plotted 26 periods ahead
+        # Senkou Span A/B are plotted 26 periods ahead, so only the windows ending
+        # at the last bar and 26 bars back are needed, not full rolling series
 
         try:
             # Tenkan-sen (Conversion Line) - 9 periods
-            tenkan_high = high.rolling(window=9).max()
-            tenkan_low = low.rolling(window=9).min()
-            tenkan = (tenkan_high + tenkan_low) / 2
-
             # Kijun-sen (Base Line) - 26 periods
-            kijun_high = high.rolling(window=26).max()
-            kijun_low = low.rolling(window=26).min()
-            kijun = (kijun_high + kijun_low) / 2
-
-            # Senkou Span B (Leading Span B) - 52 periods
-            senkou_b_high = high.rolling(window=52).max()
-            senkou_b_low = low.rolling(window=52).min()
-            senkou_b = (senkou_b_high + senkou_b_low) / 2
-
-            # Senkou Span A (Leading Span A) - plotted 26 periods ahead
-            senkou_a = (tenkan + kijun) / 2
-
-            # Get latest values (shifted 26 periods ahead for leading indicators)
-            latest_tenkan = float(tenkan.iloc[-1]) if len(tenkan) > 0 else None
-            latest_kijun = float(kijun.iloc[-1]) if len(kijun) > 0 else None
-            latest_senkou_a = float(senkou_a.iloc[-26]) if len(senkou_a) > 26 else None
-            latest_senkou_b = float(senkou_b.iloc[-26]) if len(senkou_b) > 26 else None
-            latest_chikou = float(close.iloc[-26]) if len(close) > 26 else None
+            latest_tenkan = _window_midpoint(high, low, 9) if len(close) > 0 else None
+            latest_kijun = _window_midpoint(high, low, 26) if len(close) > 0 else None
+
+            if len(close) > 26:
+                # Senkou Span A (Leading Span A) - plotted 26 periods ahead
+                latest_senkou_a = (
+                    _window_midpoint(high, low, 9, lag=25) + _window_midpoint(high, low, 26, lag=25)
+                ) / 2
+                # Senkou Span B (Leading Span B) - 52 periods
+                latest_senkou_b = _window_midpoint(high, low, 52, lag=25)
+                latest_chikou = float(close.iloc[-26])
+            else:
+                latest_senkou_a = latest_senkou_b = latest_chikou = None
 
             return {
                 "tenkan": latest_tenkan,
@@ -427,40 +665,22 @@ class TechnicalAnalyzer:
             ADX Series
         """
         try:
-            # Calculate True Range (TR)
-            prev_close = close.shift(1)
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-            # Calculate +DM and -DM
-            plus_dm = high.diff()
-            minus_dm = -low.diff()
-
-            # Only consider positive values for +DM, negative for -DM
-            plus_dm = plus_dm.where(plus_dm > minus_dm, 0)
-            plus_dm = plus_dm.where(plus_dm > 0, 0)
-            minus_dm = minus_dm.where(minus_dm > plus_dm, 0)
-            minus_dm = minus_dm.where(minus_dm > 0, 0)
-
-            # Smooth using rolling mean
-            atr = tr.rolling(window=n).mean()
-            plus_di = (plus_dm.rolling(window=n).mean() / atr) * 100
-            minus_di = (minus_dm.rolling(window=n).mean() / atr) * 100
-
-            # Calculate DX
-            dx = (abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
-
-            # Calculate ADX (smoothed DX)
-            adx = dx.rolling(window=n).mean()
-
-            return adx
+            adx, _, _ = _adx_arrays(
+                high.to_numpy(dtype=float),
+                low.to_numpy(dtype=float),
+                close.to_numpy(dtype=float),
+                n,
+            )
+            return pd.Series(adx, index=high.index)
         except Exception:
             return pd.Series([None] * len(high), index=high.index)
 
     def _calculate_adx(
-        self, high: pd.Series, low: pd.Series, close: pd.Series, n: int = 14
+        self,
+        high: pd.Series | np.ndarray,
+        low: pd.Series | np.ndarray,
+        close: pd.Series | np.ndarray,
+        n: int = 14,
     ) -> tuple[float | None, float | None, float | None]:
         """
         Calculate ADX (Average Directional Index) and +/- DI.
@@ -475,48 +695,22 @@ class TechnicalAnalyzer:
             Tuple of (adx, plus_di, minus_di)
         """
         try:
-            # Calculate True Range (TR)
-            prev_close = close.shift(1)
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-            # Calculate +DM and -DM
-            plus_dm = high.diff()
-            minus_dm = -low.diff()
-
-            # Only consider positive values for +DM, negative for -DM
-            plus_dm = plus_dm.where(plus_dm > minus_dm, 0)
-            plus_dm = plus_dm.where(plus_dm > 0, 0)
-            minus_dm = minus_dm.where(minus_dm > plus_dm, 0)
-            minus_dm = minus_dm.where(minus_dm > 0, 0)
-
-            # Smooth using rolling mean
-            atr = tr.rolling(window=n).mean()
-            plus_di = (plus_dm.rolling(window=n).mean() / atr) * 100
-            minus_di = (minus_dm.rolling(window=n).mean() / atr) * 100
-
-            # Calculate DX
-            dx = (abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
-
-            # Calculate ADX (smoothed DX)
-            adx = dx.rolling(window=n).mean()
-
-            return (
-                float(adx.iloc[-1]) if len(adx) > 0 and not pd.isna(adx.iloc[-1]) else None,
-                float(plus_di.iloc[-1])
-                if len(plus_di) > 0 and not pd.isna(plus_di.iloc[-1])
-                else None,
-                float(minus_di.iloc[-1])
-                if len(minus_di) > 0 and not pd.isna(minus_di.iloc[-1])
-                else None,
+            adx, plus_di, minus_di = _adx_arrays(
+                np.asarray(high, dtype=float),
+                np.asarray(low, dtype=float),
+                np.asarray(close, dtype=float),
+                n,
             )
+            return _last_or_none(adx), _last_or_none(plus_di), _last_or_none(minus_di)
         except Exception:
             return None, None, None
 
     def _calculate_cci(
-        self, high: pd.Series, low: pd.Series, close: pd.Series, n: int = 20
+        self,
+        high: pd.Series | np.ndarray,
+        low: pd.Series | np.ndarray,
+        close: pd.Series | np.ndarray,
+        n: int = 20,
     ) -> float | None:
         """
         Calculate CCI (Commodity Channel Index).
@@ -533,19 +727,22 @@ class TechnicalAnalyzer:
             CCI value or None
         """
         try:
-            # Typical Price
-            tp = (high + low + close) / 3
-
-            # SMA of Typical Price
-            tp_sma = tp.rolling(window=n).mean()
-
-            # Mean Deviation
-            mean_dev = tp.rolling(window=n).apply(lambda x: abs(x - x.mean()).mean(), raw=True)
+            # Only the latest CCI is reported, so only the last window is needed
+            tp = (
+                np.asarray(high, dtype=float)
+                + np.asarray(low, dtype=float)
+                + np.asarray(close, dtype=float)
+            ) / 3
+            if len(tp) < n:
+                return None
+            window = tp[-n:]
+            tp_sma = window.mean()
+            mean_dev = np.abs(window - tp_sma).mean()
 
-            # CCI
-            cci = (tp - tp_sma) / (0.015 * mean_dev)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cci = (tp[-1] - tp_sma) / (0.015 * mean_dev)
 
-            return float(cci.iloc[-1]) if len(cci) > 0 and not pd.isna(cci.iloc[-1]) else None
+            return None if np.isnan(cci) else float(cci)
         except Exception:
             return None
 
@@ -557,6 +754,7 @@ class TechnicalAnalyzer:
         ema_period: int = 20,
         atr_period: int = 10,
         atr_multiplier: float = 2.0,
+        true_range: np.ndarray | None = None,
     ) -> tuple[float | None, float | None, float | None]:
         """
         Calculate Keltner Channel indicators.
@@ -573,22 +771,27 @@ class TechnicalAnalyzer:
             ema_period: Period for EMA (default 20)
             atr_period: Period for ATR (default 10)
             atr_multiplier: ATR multiplier for bands (default 2.0)
+            true_range: Precomputed true range of the same bars (optional)
 
         Returns:
             Tuple of (kc_middle, kc_upper, kc_lower)
         """
         try:
             # Calculate EMA for middle band
-            ema = EMAIndicator(close, n=ema_period)
-            kc_middle = float(ema.ema_indicator().iloc[-1])
+            kc_middle = float(_ema(close, ema_period).iloc[-1])
 
             # Calculate ATR for band width
-            atr = AverageTrueRange(high, low, close, n=atr_period)
-            atr_value = atr.average_true_range()
+            if true_range is None:
+                true_range = _true_range(
+                    high.to_numpy(dtype=float),
+                    low.to_numpy(dtype=float),
+                    close.to_numpy(dtype=float),
+                )
+            atr_value = _wilder_atr(true_range, atr_period)[-1]
 
             # Calculate upper and lower bands
-            kc_upper = kc_middle + (atr_value.iloc[-1] * atr_multiplier)
-            kc_lower = kc_middle - (atr_value.iloc[-1] * atr_multiplier)
+            kc_upper = kc_middle + (atr_value * atr_multiplier)
+            kc_lower = kc_middle - (atr_value * atr_multiplier)
 
             return (
                 float(kc_middle) if kc_middle and not pd.isna(kc_middle) else None,
@@ -723,87 +926,19 @@ class TechnicalAnalyzer:
         Returns:
             List of indicator summaries
         """
-        summary = []
-
-        # RSI
-        if indicators.rsi_14:
-            rsi_status = (
-                "Oversold"
-                if indicators.rsi_14 < 30
-                else "Overbought"
-                if indicators.rsi_14 > 70
-                else "Neutral"
-            )
-            summary.append(
-                {
-                    "name": "RSI (14)",
-                    "value": f"{indicators.rsi_14:.2f}",
-                    "status": rsi_status,
-                }
-            )
-
-        # MACD
-        if indicators.macd is not None and indicators.macd_signal is not None:
-            macd_status = "Bullish" if indicators.macd > indicators.macd_signal else "Bearish"
-            summary.append(
-                {
-                    "name": "MACD",
-                    "value": f"{indicators.macd:.2f}",
-                    "status": macd_status,
-                }
-            )
-
-        # Moving Averages
-        if indicators.sma_20:
-            summary.append(
-                {
-                    "name": "SMA 20",
-                    "value": f"{indicators.sma_20:,.0f}",
-                    "status": "",
-                }
-            )
-
-        if indicators.sma_50:
-            summary.append(
-                {
-                    "name": "SMA 50",
-                    "value": f"{indicators.sma_50:,.0f}",
-                    "status": "",
-                }
-            )
-
-        # Bollinger Bands
-        if indicators.bb_upper and indicators.bb_lower:
-            summary.append(
-                {
-                    "name": "BB Upper",
-                    "value": f"{indicators.bb_upper:,.0f}",
-                    "status": "",
-                }
-            )
-            summary.append(
-                {
-                    "name": "BB Lower",
-                    "value": f"{indicators.bb_lower:,.0f}",
-                    "status": "",
-                }
-            )
-
-        # Trend & Signal
-        summary.append(
-            {
-                "name": "Trend",
-                "value": indicators.trend.value,
-                "status": "",
-            }
-        )
-        summary.append(
+        summary = [
             {
-                "name": "Signal",
-                "value": indicators.signal.value,
-                "status": "",
+                "name": name,
+                "value": fmt.format(getattr(indicators, field)),
+                "status": status(indicators) if status else "",
             }
-        )
+            for name, field, fmt, shown, status in _SUMMARY_SPEC
+            if shown(indicators)
+        ]
+
+        # Trend & Signal
+        summary.append({"name": "Trend", "value": indicators.trend.value, "status": ""})
+        summary.append({"name": "Signal", "value": indicators.signal.value, "status": ""})
 
         return summary
 
@@ -836,19 +971,20 @@ class TechnicalAnalyzer:
                 return None
 
             # Ensure column names are lowercase
-            df = df.copy()
-            df.columns = df.columns.str.lower()
+            df = _lowercase_columns(df)
 
-            close = df["close"]
-            current_price = float(close.iloc[-1])
+            close = df["close"].to_numpy(dtype=np.float64)
+            current_price = float(close[-1])
+
+            # Only the latest window matters, so reduce it directly instead of
+            # computing rolling statistics over the whole history
+            window = close[-period:]
 
             # Calculate moving average (中軌)
-            ma = close.rolling(window=period).mean()
-            line_3 = float(ma.iloc[-1])
+            line_3 = float(window.mean())
 
-            # Calculate standard deviation
-            std = close.rolling(window=period).std()
-            std_dev = float(std.iloc[-1])
+            # Calculate standard deviation (sample, as pandas rolling std)
+            std_dev = float(window.std(ddof=1))
 
             # Calculate five lines
             line_5 = line_3 + (std_dev * 2.0)  # 過熱線
@@ -926,14 +1062,10 @@ class TechnicalAnalyzer:
                 log.warning(f"Insufficient data for LOHAS Channel (needs {period_days} days)")
                 return None
 
-            close = df["close"]
-            high = df["high"]
-            low = df["low"]
-
             # Calculate Moving Averages (20-day)
-            mid_band = float(close.rolling(window=period_days).mean().iloc[-1])
-            upper_band = float(high.rolling(window=period_days).mean().iloc[-1])
-            lower_band = float(low.rolling(window=period_days).mean().iloc[-1])
+            mid_band = _tail_mean(df["close"].to_numpy(dtype=np.float64), period_days)
+            upper_band = _tail_mean(df["high"].to_numpy(dtype=np.float64), period_days)
+            lower_band = _tail_mean(df["low"].to_numpy(dtype=np.float64), period_days)
 
             bandwidth = (upper_band - lower_band) / mid_band if mid_band > 0 else 0.0
 
@@ -968,16 +1100,14 @@ class TechnicalAnalyzer:
         else:
             return HappyZone.OVERSOLD
 
-    def _determine_happy_trend(self, close: pd.Series, period: int) -> TrendType:
+    def _determine_happy_trend(self, close: np.ndarray, period: int) -> TrendType:
         """Determine trend direction based on price vs moving average."""
         try:
-            ma = close.rolling(window=period).mean()
-            current_price = float(close.iloc[-1])
-            current_ma = float(ma.iloc[-1])
+            current_price = float(close[-1])
+            current_ma = _tail_mean(close, period)
 
             # Also check shorter term trend
-            short_ma = close.rolling(window=20).mean()
-            current_short_ma = float(short_ma.iloc[-1])
+            current_short_ma = _tail_mean(close, 20)
 
             if current_price > current_ma and current_price > current_short_ma:
                 return TrendType.BULLISH
@@ -990,27 +1120,7 @@ class TechnicalAnalyzer:
 
     def _determine_happy_signal(self, zone: HappyZone, trend: TrendType) -> SignalType:
         """Determine trading signal based on zone and trend."""
-        # Buy signals: oversold/undervalued zones
-        if zone in [HappyZone.OVERSOLD, HappyZone.UNDERVALUED]:
-            if trend == TrendType.BULLISH:
-                return SignalType.STRONG_BUY
-            elif trend == TrendType.SIDEWAYS:
-                return SignalType.BUY
-            else:
-                return SignalType.NEUTRAL  # Wait for trend reversal
-
-        # Sell signals: overbought/overvalued zones
-        elif zone in [HappyZone.OVERBOUGHT, HappyZone.OVERVALUED]:
-            if trend == TrendType.BEARISH:
-                return SignalType.STRONG_SELL
-            elif trend == TrendType.SIDEWAYS:
-                return SignalType.SELL
-            else:
-                return SignalType.NEUTRAL  # Wait for trend reversal
-
-        # Balanced zone
-        else:
-            return SignalType.NEUTRAL
+        return _HAPPY_SIGNALS.get((zone, trend), SignalType.NEUTRAL)
 
     async def analyze_happy_lines(
         self,
@@ -1022,27 +1132,81 @@ class TechnicalAnalyzer:
 
         Args:
             ticker: Stock ticker symbol
-            period: Historical data period
+            period: Historical data period (used by sources that ignore dates)
             lookback_period: Calculation period for Happy Lines (default: 60 days)
 
         Returns:
             HappyLinesIndicators object or None
         """
-        from datetime import datetime, timedelta
-
-        # Define date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
+        # Repeat calls for the same ticker within the TTL skip both fetch and math
+        today = date.today()
+        key = (ticker, period, lookback_period, today)
+        entry = self._happy_lines_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < settings.data.technical_cache_ttl:
+            self._happy_lines_cache.move_to_end(key)
+            return entry[1]
+
+        # Only the last lookback_period bars are used, so fetch that many trading
+        # days plus a weekend/holiday cushion rather than a full year
+        history_days = max(int(lookback_period * 1.6) + 10, self.min_history_days)
+        start_date_str, end_date_str = _history_range(today, history_days)
 
         # Get historical data
         df = await self.fetcher.fetch_history(
             ticker, period, start_date=start_date_str, end_date=end_date_str
         )
 
+        # A stale local store or a trading suspension can leave the short window
+        # without enough bars; fall back to the full year before giving up
+        if df is not None and 0 < len(df) < lookback_period and history_days < 365:
+            start_date_str, end_date_str = _history_range(today)
+            df = await self.fetcher.fetch_history(
+                ticker, period, start_date=start_date_str, end_date=end_date_str
+            )
+
         if df is None or df.empty:
             log.warning(f"No data available for {ticker}")
             return None
 
-        return self.calculate_happy_lines(df, ticker, period=lookback_period)
+        # CPU-bound; keep the event loop free for other tickers' fetches
+        result = await asyncio.to_thread(
+            self.calculate_happy_lines, df, ticker, period=lookback_period
+        )
+
+        if result is not None:
+            self._happy_lines_cache[key] = (time.monotonic(), result)
+            self._happy_lines_cache.move_to_end(key)
+            while len(self._happy_lines_cache) > HAPPY_LINES_CACHE_SIZE:
+                self._happy_lines_cache.popitem(last=False)
+        return result
+
+    async def analyze_happy_lines_batch(
+        self,
+        tickers: list[str],
+        period: str = "1y",
+        lookback_period: int = 60,
+        max_concurrency: int = 20,
+    ) -> list[HappyLinesIndicators | None | BaseException]:
+        """Perform Happy Lines analysis on several stocks concurrently.
+
+        All history requests are submitted up front and a semaphore bounds how
+        many are in flight, so network latency overlaps across tickers.
+
+        Args:
+            tickers: Stock ticker symbols
+            period: Historical data period
+            lookback_period: Calculation period for Happy Lines (default: 60 days)
+            max_concurrency: Maximum in-flight history requests
+
+        Returns:
+            Results in input order; failed tickers hold their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(ticker: str) -> HappyLinesIndicators | None:
+            async with semaphore:
+                return await self.analyze_happy_lines(ticker, period, lookback_period)
+
+        return await asyncio.gather(
+            *(analyze_one(ticker) for ticker in tickers), return_exceptions=True
+        )
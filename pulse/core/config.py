@@ -59,6 +59,58 @@ class AISettings(BaseSettings):
         default=4096, ge=100, le=32000, description="Maximum tokens for AI responses"
     )
     timeout: int = Field(default=120, description="Request timeout in seconds")
+    soft_timeout: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Opt-in: cancel and resend non-streaming attempts slower than this "
+            "(seconds, 0 disables; a cancelled attempt's tokens are still billed)"
+        ),
+    )
+    max_retries: int = Field(
+        default=1, ge=0, description="Retries after a soft timeout before the final attempt"
+    )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Mark static system prompts cacheable for providers that support it",
+    )
+
+    history_token_budget: int = Field(
+        default=8000,
+        ge=0,
+        description="Max tokens of conversation history sent per request (0 disables trimming)",
+    )
+    rate_limits: dict[str, dict[str, int]] = Field(
+        default={},
+        description="Per-model provider limits, e.g. {'openai/gpt-4o': {'rpm': 500, 'tpm': 30000}}",
+    )
+    num_retries: int = Field(
+        default=3, ge=0, description="Rate-limit retries for models routed with rate_limits"
+    )
+    http_pool_size: int = Field(
+        default=20, ge=1, description="Keep-alive HTTP connections shared by LLM requests"
+    )
+    max_concurrency: int = Field(
+        default=5, ge=1, description="Maximum concurrent requests for batch analysis"
+    )
+    response_cache_size: int = Field(
+        default=128,
+        ge=0,
+        description="Exact-match response cache size for temperature 0 requests (0 disables)",
+    )
+
+    # Semantic response cache for stateless requests (needs an embedding-capable provider)
+    semantic_cache_enabled: bool = Field(
+        default=False, description="Reuse responses for near-duplicate stateless prompts"
+    )
+    semantic_cache_model: str = Field(
+        default="openai/text-embedding-3-small",
+        description="Embedding model used for semantic cache lookups",
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92, ge=0.0, le=1.0, description="Cosine similarity required for a cache hit"
+    )
+    semantic_cache_ttl: int = Field(default=600, description="Semantic cache TTL in seconds")
 
     # Available models (LiteLLM format)
     # Users can set API keys via environment variables:
@@ -108,6 +160,9 @@ class DataSettings(BaseSettings):
     broker_cache_ttl: int = Field(
         default=86400, description="Broker/institutional data TTL (24 hours)"
     )
+    stock_list_cache_ttl: int = Field(
+        default=86400, description="TWSE/TPEx stock list TTL (24 hours)"
+    )
 
     # Cache optimization settings
     cache_preload_count: int = Field(default=10, description="Number of top stocks to preload")
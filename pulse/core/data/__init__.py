@@ -7,7 +7,7 @@ from pulse.core.data.local_warehouse import LocalWarehouseFetcher
 from pulse.core.data.warehouse_sync import WarehouseSyncResult, WarehouseSyncService
 from pulse.core.data.stock_data_provider import StockDataProvider
 from pulse.core.data.stock_list_fetcher import StockListFetcher
-from pulse.core.data.yfinance import YFinanceFetcher
+from pulse.core.data.yfinance import YFinanceFetcher, get_fetcher
 
 __all__ = [
     "YFinanceFetcher",
@@ -19,4 +19,5 @@ __all__ = [
     "DataCache",
     "StockDataProvider",
     "StockListFetcher",
+    "get_fetcher",
 ]
@@ -18,11 +18,11 @@ log = get_logger(__name__)
 T = TypeVar("T")
 
 # Module-level singleton lock and instance for cache reuse
-_cache_singleton: DataCache | None = None
+_cache_singleton: "DataCache | None" = None
 _cache_lock = threading.Lock()
 
 
-def _get_cache_instance() -> DataCache:
+def _get_cache_instance() -> "DataCache":
     """Get the global cache instance (thread-safe singleton)."""
     global _cache_singleton
     if _cache_singleton is None:
@@ -172,6 +172,18 @@ class DataCache:
         fundamental_ttl = ttl or settings.data.fundamental_cache_ttl
         return self.set(key, data, fundamental_ttl)
 
+    def get_stock_list(self, date: str) -> Any | None:
+        """Get cached TWSE/TPEx stock list for a trading date (YYYYMMDD)."""
+        key = self._make_key("stock_list", date)
+        return self.get(key)
+
+    def set_stock_list(self, date: str, data: Any, ttl: int | None = None) -> bool:
+        """Cache TWSE/TPEx stock list for a trading date (YYYYMMDD)."""
+        key = self._make_key("stock_list", date)
+        # Listings change at most daily
+        stock_list_ttl = ttl or settings.data.stock_list_cache_ttl
+        return self.set(key, data, stock_list_ttl)
+
     async def preload_hot_data(self, tickers: list[str]) -> None:
         """
         Preload hot data for specified tickers.
@@ -3,12 +3,14 @@
 抓取台灣上市股票和上櫃股票的代碼清單。
 """
 
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
 import pandas as pd
 
+from pulse.core.data.cache import DataCache, _get_cache_instance
 from pulse.utils.constants import TW50_TICKERS
 from pulse.utils.logger import get_logger
 
@@ -32,16 +34,26 @@ class StockListFetcher:
     MARKET_TPEX = "tpex"
     MARKET_EMERGING = "emerging"
 
-    def __init__(self, token: str = ""):
+    def __init__(
+        self,
+        token: str = "",
+        use_cache: bool = True,
+        cache: DataCache | None = None,
+    ):
         """
         Initialize stock list fetcher.
 
         Args:
             token: FinMind API token (optional, for higher rate limits)
+            use_cache: Read the stock list from the disk cache when fresh
+            cache: Disk cache to use (defaults to the shared data cache)
         """
         self.token = token
+        self.use_cache = use_cache
+        self._cache = cache
         self._dl: "DataLoader | None" = None
         self._all_stocks_cache: pd.DataFrame | None = None
+        self._fetch_lock = threading.Lock()
 
     @property
     def dl(self) -> "DataLoader":
@@ -61,25 +73,42 @@ class StockListFetcher:
         Returns:
             DataFrame with all stock info, or None if failed
         """
-        try:
-            if self._all_stocks_cache is not None:
-                return self._all_stocks_cache
-
-            log.info("Fetching Taiwan stock info from FinMind...")
-            df = self.dl.taiwan_stock_info()
-
-            if df is None or df.empty:
-                log.warning("No stock info returned from FinMind")
+        if self._all_stocks_cache is not None:
+            return self._all_stocks_cache
+
+        # TWSE and TPEx lists may be requested from worker threads at once;
+        # serialize so they share a single download
+        with self._fetch_lock:
+            try:
+                if self._all_stocks_cache is not None:
+                    return self._all_stocks_cache
+
+                cache = self._cache or _get_cache_instance()
+                today = datetime.now().strftime("%Y%m%d")
+
+                if self.use_cache:
+                    cached = cache.get_stock_list(today)
+                    if cached is not None:
+                        log.debug("Using cached Taiwan stock info")
+                        self._all_stocks_cache = cached
+                        return cached
+
+                log.info("Fetching Taiwan stock info from FinMind...")
+                df = self.dl.taiwan_stock_info()
+
+                if df is None or df.empty:
+                    log.warning("No stock info returned from FinMind")
+                    return None
+
+                self._all_stocks_cache = df
+                cache.set_stock_list(today, df)
+                log.info(f"Fetched {len(df)} stocks from FinMind")
+                return df
+
+            except Exception as e:
+                log.error(f"Error fetching stock info from FinMind: {e}")
                 return None
 
-            self._all_stocks_cache = df
-            log.info(f"Fetched {len(df)} stocks from FinMind")
-            return df
-
-        except Exception as e:
-            log.error(f"Error fetching stock info from FinMind: {e}")
-            return None
-
     def _is_valid_ticker(self, stock_id: str) -> bool:
         """
         Check if stock_id is a valid regular stock (not ETF, not special codes).
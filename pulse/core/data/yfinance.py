@@ -540,3 +540,19 @@ class YFinanceFetcher:
         except Exception as e:
             log.error(f"Error fetching index {index_name}: {e}")
             return None
+
+
+_default_fetcher: YFinanceFetcher | None = None
+
+
+def get_fetcher() -> YFinanceFetcher:
+    """
+    Get the process-wide yfinance fetcher.
+
+    Command handlers should use this instead of constructing YFinanceFetcher
+    per call so the OTC ticker set is loaded once.
+    """
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = YFinanceFetcher()
+    return _default_fetcher
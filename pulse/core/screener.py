@@ -30,6 +30,10 @@ except ImportError:
     HappyLinesIndicators = Any
     HappyZone = Any
 
+# Overall bullish/bearish label per status; RSI extremes take precedence over MACD
+_RSI_SIGNALS = {"Oversold": "bullish", "Overbought": "bearish"}
+_MACD_SIGNALS = {"Bullish": "bullish", "Bearish": "bearish"}
+
 
 def load_all_tickers() -> list[str]:
     """Load all tickers (TW50 + MIDCAP + POPULAR combined)."""
@@ -68,6 +72,19 @@ class StockUniverse(str, Enum):
     ALL = "all"  # All Taiwan stocks
 
 
+PRESET_VALUES: frozenset[str] = frozenset(p.value for p in ScreenPreset)
+
+# --universe= names accepted by /screen, including legacy aliases
+UNIVERSE_ALIASES: dict[str, StockUniverse] = {
+    "tw50": StockUniverse.TW50,
+    "lq45": StockUniverse.TW50,  # backward compat
+    "midcap": StockUniverse.MIDCAP,
+    "tw100": StockUniverse.MIDCAP,
+    "popular": StockUniverse.POPULAR,
+    "all": StockUniverse.ALL,
+}
+
+
 @dataclass
 class ScreenResult:
     """Result from stock screening."""
@@ -171,6 +188,11 @@ class ScreenResult:
             return "Bullish"
         return "Bearish"
 
+    @property
+    def signal(self) -> str:
+        """Overall signal label: "bullish", "bearish" or "" (RSI extremes, then MACD)."""
+        return _RSI_SIGNALS.get(self.rsi_status) or _MACD_SIGNALS.get(self.macd_status, "")
+
     @property
     def bb_width(self) -> float | None:
         """Bollinger Band width as % of middle band."""
@@ -313,6 +335,7 @@ class StockScreener:
         self,
         universe: list[str] | None = None,
         universe_type: StockUniverse | None = None,
+        concurrency: int = 30,
     ):
         """
         Initialize screener with stock universe.
@@ -320,7 +343,9 @@ class StockScreener:
         Args:
             universe: Custom list of tickers. If provided, overrides universe_type.
             universe_type: Predefined universe type (TW50, MIDCAP, POPULAR, ALL).
+            concurrency: Maximum number of tickers fetched at once.
         """
+        self.concurrency = concurrency
         if universe is not None:
             self.universe = universe
         elif universe_type:
@@ -403,8 +428,10 @@ class StockScreener:
             df.columns = df.columns.str.lower()
 
             # 3. Calculate technical indicators from the ALREADY fetched data
-            # Use the internal _calculate_indicators which takes a DataFrame
-            technical = analyzer._calculate_indicators(ticker, df)
+            # Use the internal _calculate_indicators which takes a DataFrame.
+            # CPU-bound, so run it in a worker thread; other tickers' requests keep
+            # progressing on the event loop meanwhile
+            technical = await asyncio.to_thread(analyzer._calculate_indicators, ticker, df)
 
             if technical:
                 result.rsi_14 = technical.rsi_14
@@ -429,7 +456,9 @@ class StockScreener:
                 result.resistance = technical.resistance_1
 
                 # 4. Calculate Happy Lines (Reuse the same DataFrame)
-                happy_lines = analyzer.calculate_happy_lines(df, ticker, period=60)
+                happy_lines = await asyncio.to_thread(
+                    analyzer.calculate_happy_lines, df, ticker, period=60
+                )
                 if happy_lines:
                     result.happy_lines = happy_lines
 
@@ -538,8 +567,7 @@ class StockScreener:
         results = []
 
         # Fetch data for all stocks in parallel (with semaphore to limit concurrency)
-        # Increased to 30 for better throughput
-        semaphore = asyncio.Semaphore(30)
+        semaphore = asyncio.Semaphore(self.concurrency)
 
         from pulse.core.analysis.technical import TechnicalAnalyzer
         from pulse.core.data.stock_data_provider import StockDataProvider
@@ -549,8 +577,13 @@ class StockScreener:
         analyzer = TechnicalAnalyzer()
 
         async def fetch_with_limit(ticker: str) -> ScreenResult | None:
-            async with semaphore:
-                return await self._fetch_stock_data(ticker, fetcher=fetcher, analyzer=analyzer)
+            try:
+                async with semaphore:
+                    return await self._fetch_stock_data(
+                        ticker, fetcher=fetcher, analyzer=analyzer
+                    )
+            finally:
+                progress.advance(task_id)
 
         log.info(f"Screening {len(self.universe)} stocks...")
 
@@ -565,21 +598,17 @@ class StockScreener:
             disable=not show_progress,
         )
 
-        all_results: list[ScreenResult | None | BaseException] = []
-
         with progress:
             task_id = progress.add_task(
                 f"Screening {len(self.universe)} stocks...", total=len(self.universe)
             )
 
-            # Process in larger batches for better efficiency
-            batch_size = 30
-            for i in range(0, len(self.universe), batch_size):
-                batch = self.universe[i : i + batch_size]
-                tasks = [fetch_with_limit(ticker) for ticker in batch]
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                all_results.extend(batch_results)
-                progress.update(task_id, advance=len(batch))
+            # Schedule everything at once; the semaphore keeps a steady number of
+            # requests in flight instead of waiting on the slowest ticker per batch
+            all_results = await asyncio.gather(
+                *(fetch_with_limit(ticker) for ticker in self.universe),
+                return_exceptions=True,
+            )
 
         # Filter and score results
         for result in all_results:
@@ -84,8 +84,8 @@ class SmartAgent:
         r"操作",
     ]
 
-    def __init__(self, progress_callback=None):
-        self.ai_client = None  # Lazy load
+    def __init__(self, progress_callback=None, ai_client=None):
+        self.ai_client = ai_client  # Lazy load unless a shared client is passed in
         self._last_ticker: str | None = None
         self._last_context: AgentContext | None = None
         self._progress_callback = progress_callback
@@ -4,10 +4,20 @@ Provides consistent, beautiful terminal output.
 """
 
 import sys
-from typing import Any
+from typing import Any, NamedTuple
+
 
 # Type definitions for better type checking
-ScreenResultDict = dict[str, Any]
+class ScreenRow(NamedTuple):
+    """One row of screening output."""
+
+    ticker: str
+    price: float
+    change_percent: float
+    rsi: float | None
+    signal: str
+
+
 CompareResultDict = dict[str, Any]
 TechnicalIndicatorDict = dict[str, Any]
 
@@ -451,7 +461,7 @@ def create_sapta_table(
     return "\n".join(lines)
 
 
-def create_screen_table(results: list[ScreenResultDict], title: str) -> str:
+def create_screen_table(results: list[ScreenRow], title: str) -> str:
     """Create a formatted screening results output."""
     lines = [create_header("股票篩選", ""), ""]
     lines.append(f"{title}")
@@ -461,20 +471,14 @@ def create_screen_table(results: list[ScreenResultDict], title: str) -> str:
         lines.append("找不到符合條件的股票")
         return "\n".join(lines)
 
-    for i, r in enumerate(results[:20], 1):
-        ticker = r.get("ticker", "")
-        price = r.get("price", 0)
-        change = r.get("change_percent", 0)
-        rsi = r.get("rsi", 0)
-        signal = r.get("signal", "")
-
+    for i, (ticker, price, change, rsi, signal) in enumerate(results[:20], 1):
         change_str = f"{change:+.2f}%"
         rsi_str = f"RSI:{rsi:.1f}" if rsi else ""
 
         # Signal indicator
-        if "bullish" in signal.lower():
+        if signal == "bullish":
             signal_str = "(多頭)"
-        elif "bearish" in signal.lower():
+        elif signal == "bearish":
             signal_str = "(空頭)"
         else:
             signal_str = ""
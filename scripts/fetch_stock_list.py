@@ -62,7 +62,7 @@ def main():
 
     token = os.getenv("FINMIND_TOKEN", "") or ""
 
-    fetcher = StockListFetcher(token=token)
+    fetcher = StockListFetcher(token=token, use_cache=False)
 
     try:
         # Save all files for main program
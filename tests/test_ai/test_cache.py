@@ -0,0 +1,67 @@
+"""Tests for AI response caches (pulse/ai/cache.py)."""
+
+from unittest.mock import patch
+
+from pulse.ai.cache import ExactCache, SemanticCache
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache."""
+
+    def test_similar_prompt_hits(self):
+        cache = SemanticCache(threshold=0.9)
+        cache.store("ns", [1.0, 0.0, 0.0], "cached")
+
+        assert cache.lookup("ns", [0.99, 0.05, 0.0]) == "cached"
+
+    def test_dissimilar_prompt_misses(self):
+        cache = SemanticCache(threshold=0.9)
+        cache.store("ns", [1.0, 0.0, 0.0], "cached")
+
+        assert cache.lookup("ns", [0.0, 1.0, 0.0]) is None
+
+    def test_namespaces_are_isolated(self):
+        cache = SemanticCache(threshold=0.9)
+        cache.store("technical", [1.0, 0.0], "technical answer")
+
+        assert cache.lookup("fundamental", [1.0, 0.0]) is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = SemanticCache(ttl=10)
+        with patch("pulse.ai.cache.time.monotonic", return_value=100.0):
+            cache.store("ns", [1.0, 0.0], "old")
+        with patch("pulse.ai.cache.time.monotonic", return_value=111.0):
+            assert cache.lookup("ns", [1.0, 0.0]) is None
+        assert len(cache) == 0
+
+    def test_max_entries_evicts_oldest(self):
+        cache = SemanticCache(max_entries=2)
+        cache.store("ns", [1.0, 0.0, 0.0], "a")
+        cache.store("ns", [0.0, 1.0, 0.0], "b")
+        cache.store("ns", [0.0, 0.0, 1.0], "c")
+
+        assert len(cache) == 2
+        assert cache.lookup("ns", [1.0, 0.0, 0.0]) is None
+        assert cache.lookup("ns", [0.0, 0.0, 1.0]) == "c"
+
+
+class TestExactCache:
+    """Test cases for ExactCache."""
+
+    def test_key_depends_on_every_part(self):
+        key = ExactCache.make_key("model", "system", "user")
+
+        assert key == ExactCache.make_key("model", "system", "user")
+        assert key != ExactCache.make_key("model", "system", "other")
+        assert key != ExactCache.make_key("other", "system", "user")
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ExactCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
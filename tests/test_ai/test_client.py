@@ -66,6 +66,27 @@ class TestAIClientInitialization:
         assert ai_client._conversation_history == []
 
 
+class TestGetClient:
+    """Test cases for the shared client getter."""
+
+    def test_get_client_returns_shared_instance(self):
+        """Test get_client reuses one client and installs a pooled HTTP session."""
+        import litellm
+
+        from pulse.ai import client as client_module
+
+        with (
+            patch.object(client_module, "_default_client", None),
+            patch.object(litellm, "aclient_session", None),
+        ):
+            first = client_module.get_client()
+            second = client_module.get_client()
+            session = litellm.aclient_session
+
+        assert first is second
+        assert session is not None
+
+
 class TestSetModel:
     """Test cases for set_model method."""
 
@@ -179,14 +200,90 @@ class TestChat:
 
     @pytest.mark.asyncio
     async def test_greeting_handled(self, ai_client, mock_litellm):
-        """Test that greetings are handled with identity reminder."""
-        mock_litellm.return_value = MockResponse("你好！")
+        """Test that an opening greeting is answered without an LLM call."""
+        from pulse.ai.client import CANNED_GREETING
 
         result = await ai_client.chat("嗨")
 
-        assert isinstance(result, str)
+        assert result == CANNED_GREETING
+        mock_litellm.assert_not_called()
+        assert ai_client._conversation_history == [
+            {"role": "user", "content": "嗨"},
+            {"role": "assistant", "content": CANNED_GREETING},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_greeting_with_custom_system_prompt_reaches_llm(self, ai_client, mock_litellm):
+        """Test greetings under a custom system prompt are not short-circuited."""
+        mock_litellm.return_value = MockResponse("你好！")
+
+        result = await ai_client.chat("嗨", system_prompt="你是一個股票分析專家")
+
+        assert result == "你好！"
         mock_litellm.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_mid_conversation_greeting_gets_identity_prefix(self, ai_client, mock_litellm):
+        """Test greetings are normalized and prefixed even with existing history."""
+        from pulse.ai.client import IDENTITY_PREFIX
+
+        mock_litellm.return_value = MockResponse("你好！")
+        await ai_client.chat("2330 怎麼看")
+
+        await ai_client.chat("  Hello ")
+
+        user_msg = mock_litellm.call_args.kwargs["messages"][-1]["content"]
+        assert user_msg == IDENTITY_PREFIX + "  Hello "
+
+
+class TestHistoryTrimming:
+    """Test cases for token-budgeted conversation history."""
+
+    @pytest.mark.asyncio
+    async def test_oldest_pairs_dropped_over_budget(self, ai_client, mock_litellm):
+        """Test history is trimmed from the front in user/assistant pairs."""
+        from pulse.core.config import settings
+
+        mock_litellm.return_value = MockResponse("回應 " * 50)
+
+        with patch.object(settings.ai, "history_token_budget", 150):
+            for i in range(5):
+                await ai_client.chat(f"問題 {i}")
+
+        history = ai_client._conversation_history
+        assert 2 <= len(history) < 10
+        assert len(history) % 2 == 0
+        assert history[0]["role"] == "user"
+        assert history[-2]["content"] == "問題 4"
+
+    @pytest.mark.asyncio
+    async def test_each_message_counted_once(self, ai_client, mock_litellm):
+        """Test token counts are cached so earlier turns are not re-encoded."""
+        import litellm
+
+        mock_litellm.return_value = MockResponse("回應")
+
+        with patch("pulse.ai.client.litellm.token_counter", wraps=litellm.token_counter) as counter:
+            for i in range(3):
+                await ai_client.chat(f"問題 {i}")
+
+        # Trimming starts once there is more than one exchange: 4 + 2 new messages
+        assert counter.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_latest_exchange_always_kept(self, ai_client, mock_litellm):
+        """Test the newest pair survives even when it alone exceeds the budget."""
+        from pulse.core.config import settings
+
+        mock_litellm.return_value = MockResponse("很長的回應 " * 200)
+
+        with patch.object(settings.ai, "history_token_budget", 10):
+            await ai_client.chat("第一題")
+            await ai_client.chat("第二題")
+
+        assert [m["content"] for m in ai_client._conversation_history][0] == "第二題"
+        assert len(ai_client._conversation_history) == 2
+
 
 class TestChatStream:
     """Test cases for chat_stream method."""
@@ -332,6 +429,331 @@ class TestAnalyzeStock:
         assert isinstance(result, str)
 
 
+class TestSoftTimeout:
+    """Test cases for soft-timeout retries."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_attempt_is_retried(self, ai_client, mock_litellm):
+        """Test an attempt slower than the soft timeout is cancelled and resent."""
+        import asyncio
+
+        from pulse.core.config import settings
+
+        calls = 0
+
+        async def stall_then_answer(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+            return MockResponse("回應")
+
+        mock_litellm.side_effect = stall_then_answer
+
+        with (
+            patch.object(settings.ai, "soft_timeout", 0.01),
+            patch.object(settings.ai, "max_retries", 1),
+        ):
+            result = await ai_client.chat("Test", use_history=False)
+
+        assert result == "回應"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_streams_are_not_retried(self, ai_client, mock_litellm):
+        """Test a stream slower than the soft timeout is sent only once."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from pulse.core.config import settings
+
+        async def chunks():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="回應"))])
+
+        async def slow_stream(**kwargs):
+            await asyncio.sleep(0.05)
+            return chunks()
+
+        mock_litellm.side_effect = slow_stream
+
+        with (
+            patch.object(settings.ai, "soft_timeout", 0.01),
+            patch.object(settings.ai, "max_retries", 1),
+        ):
+            result = [chunk async for chunk in ai_client.chat_stream("Test", use_history=False)]
+
+        assert result == ["回應"]
+        mock_litellm.assert_called_once()
+
+    def test_disabled_by_default(self):
+        """Test soft-timeout retries are opt-in."""
+        from pulse.core.config import AISettings
+
+        assert AISettings().soft_timeout == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_retried(self, ai_client, mock_litellm):
+        """Test non-timeout errors surface without a retry."""
+        mock_litellm.side_effect = Exception("rate limit exceeded")
+
+        with pytest.raises(Exception, match="API 配額超限"):
+            await ai_client.chat("Test", use_history=False)
+
+        mock_litellm.assert_called_once()
+
+
+class TestAnalyzeStockStream:
+    """Test cases for analyze_stock_stream method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_uses_same_prompts_as_analyze_stock(self, ai_client, mock_litellm):
+        """Test streaming analysis sends the same messages as the blocking call."""
+
+        async def mock_stream():
+            for text in ["技術", "分析"]:
+                chunk = MagicMock()
+                chunk.choices = [MagicMock()]
+                chunk.choices[0].delta.content = text
+                yield chunk
+
+        mock_litellm.return_value = MockResponse("技術分析")
+        await ai_client.analyze_stock("2330", {"price": 100}, "technical")
+        blocking_messages = mock_litellm.call_args.kwargs["messages"]
+
+        mock_litellm.return_value = mock_stream()
+        chunks = [
+            c async for c in ai_client.analyze_stock_stream("2330", {"price": 100}, "technical")
+        ]
+
+        assert chunks == ["技術", "分析"]
+        assert mock_litellm.call_args.kwargs["messages"][0] == blocking_messages[0]
+        assert mock_litellm.call_args.kwargs["stream"] is True
+
+
+class TestRateLimitRouting:
+    """Test cases for routing rate-limited models through litellm.Router."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_model_uses_router(self, mock_litellm):
+        """Test models with configured limits bypass bare acompletion."""
+        from pulse.core.config import settings
+
+        router = MagicMock()
+        router.acompletion = AsyncMock(return_value=MockResponse("路由回應"))
+        limits = {"deepseek/deepseek-v4-flash": {"rpm": 10}}
+
+        with (
+            patch.object(settings.ai, "rate_limits", limits),
+            patch("pulse.ai.client._get_router", return_value=router),
+        ):
+            client = AIClient(model="deepseek/deepseek-v4-flash")
+            result = await client.chat("Test", use_history=False)
+
+        assert result == "路由回應"
+        router.acompletion.assert_called_once()
+        mock_litellm.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unlimited_model_calls_acompletion(self, ai_client, mock_litellm):
+        """Test models without limits keep the direct acompletion path."""
+        mock_litellm.return_value = MockResponse("回應")
+
+        with patch("pulse.ai.client._get_router") as get_router:
+            await ai_client.chat("Test", use_history=False)
+
+        get_router.assert_not_called()
+        mock_litellm.assert_called_once()
+
+
+class TestPayloadSerialization:
+    """Test cases for reusing serialized payloads across related calls."""
+
+    @pytest.mark.asyncio
+    async def test_same_data_serialized_once(self, ai_client, mock_litellm):
+        """Test analysis then recommendation on one dict encodes it once."""
+        mock_litellm.return_value = MockResponse('{"signal": "Buy"}')
+        data = {"price": 100, "rsi_14": 55.0}
+
+        with patch("pulse.ai.client.dumps_json_async", new_callable=AsyncMock) as dumps:
+            dumps.return_value = '{"price": 100}'
+            await ai_client.analyze_stock("2330", data)
+            await ai_client.get_recommendation("2330", data)
+
+        dumps.assert_called_once_with(data)
+
+
+class TestAnalyzeStocks:
+    """Test cases for analyze_stocks batch method."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, ai_client, mock_litellm):
+        """Test batch results align with the input tickers."""
+        mock_litellm.side_effect = [MockResponse("A"), MockResponse("B")]
+
+        results = await ai_client.analyze_stocks([("2330", {}), ("2317", {})])
+
+        assert results == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_returned_not_raised(self, ai_client, mock_litellm):
+        """Test one failing ticker does not cancel the batch."""
+        mock_litellm.side_effect = [MockResponse("A"), Exception("API Error")]
+
+        results = await ai_client.analyze_stocks([("2330", {}), ("2317", {})])
+
+        assert results[0] == "A"
+        assert isinstance(results[1], Exception)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, ai_client, mock_litellm):
+        """Test no more than max_concurrency requests run at once."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_completion(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MockResponse("ok")
+
+        mock_litellm.side_effect = slow_completion
+
+        await ai_client.analyze_stocks([(str(i), {}) for i in range(6)], max_concurrency=2)
+
+        assert peak == 2
+
+
+class TestAnalyzeStocksBatched:
+    """Test cases for analyze_stocks_batched method."""
+
+    @pytest.mark.asyncio
+    async def test_group_answered_in_one_request(self, ai_client, mock_litellm):
+        """Test tickers in one group share a single request."""
+        mock_litellm.return_value = MockResponse(
+            '```json\n[{"ticker": "2317", "analysis": "B"}, {"ticker": "2330", "analysis": "A"}]\n```'
+        )
+
+        results = await ai_client.analyze_stocks_batched([("2330", {}), ("2317", {})])
+
+        assert results == ["A", "B"]
+        mock_litellm.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_tickers_fall_back_to_single_requests(self, ai_client, mock_litellm):
+        """Test tickers absent from the batched reply are analyzed individually."""
+        mock_litellm.side_effect = [
+            MockResponse('[{"ticker": "2330", "analysis": "A"}'),  # truncated array
+            MockResponse("A 單獨"),
+            MockResponse("B 單獨"),
+        ]
+
+        results = await ai_client.analyze_stocks_batched([("2330", {}), ("2317", {})])
+
+        assert results == ["A 單獨", "B 單獨"]
+        assert mock_litellm.call_count == 3
+
+
+class TestPromptCaching:
+    """Test cases for provider prompt-caching hints."""
+
+    @pytest.mark.asyncio
+    async def test_anthropic_system_prompt_has_cache_breakpoints(self, mock_litellm):
+        """Test Anthropic requests split the shared base into a cacheable block."""
+        from pulse.ai.prompts import StockAnalysisPrompts
+
+        mock_litellm.return_value = MockResponse("分析")
+        client = AIClient(model="anthropic/claude-sonnet-4-20250514")
+
+        await client.analyze_stock("2330", {"price": 100}, "technical")
+
+        system = mock_litellm.call_args.kwargs["messages"][0]
+        assert system["role"] == "system"
+        assert system["content"][0]["text"] == StockAnalysisPrompts.get_system_base()
+        assert all(block["cache_control"] == {"type": "ephemeral"} for block in system["content"])
+
+    @pytest.mark.asyncio
+    async def test_other_providers_keep_plain_system_prompt(self, ai_client, mock_litellm):
+        """Test providers with automatic caching receive the prompt unchanged."""
+        mock_litellm.return_value = MockResponse("分析")
+
+        await ai_client.chat("Test", system_prompt="系統提示", use_history=False)
+
+        system = mock_litellm.call_args.kwargs["messages"][0]
+        assert system == {"role": "system", "content": "系統提示"}
+
+
+class TestSemanticCache:
+    """Test cases for the semantic response cache in chat."""
+
+    @pytest.mark.asyncio
+    async def test_stateless_repeat_served_from_cache(self, ai_client, mock_litellm):
+        """Test a near-duplicate stateless prompt skips the LLM call."""
+        from types import SimpleNamespace
+
+        from pulse.ai.cache import SemanticCache
+
+        ai_client._semantic_cache = SemanticCache(threshold=0.9)
+        mock_litellm.return_value = MockResponse("2330 偏多")
+        embedding = SimpleNamespace(data=[{"embedding": [0.6, 0.8]}])
+
+        with patch("pulse.ai.client.aembedding", new=AsyncMock(return_value=embedding)):
+            first = await ai_client.chat("2330 怎麼看", use_history=False)
+            second = await ai_client.chat("2330 怎麼看？", use_history=False)
+
+        assert first == second == "2330 偏多"
+        mock_litellm.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_analyses_of_different_tickers_both_miss(self, ai_client, mock_litellm):
+        """Test near-identical payloads for different tickers never share an answer."""
+        from types import SimpleNamespace
+
+        from pulse.ai.cache import SemanticCache
+
+        ai_client._semantic_cache = SemanticCache(threshold=0.9)
+        mock_litellm.side_effect = [MockResponse("2330 偏多"), MockResponse("2454 偏空")]
+        embedding = SimpleNamespace(data=[{"embedding": [0.6, 0.8]}])
+
+        with patch("pulse.ai.client.aembedding", new=AsyncMock(return_value=embedding)):
+            first = await ai_client.analyze_stock("2330", {"price": 100.0, "rsi_14": 55.0})
+            second = await ai_client.analyze_stock("2454", {"price": 100.5, "rsi_14": 55.0})
+
+        assert first == "2330 偏多"
+        assert second == "2454 偏空"
+        assert mock_litellm.call_count == 2
+
+
+class TestExactCache:
+    """Test cases for the exact-match response cache in chat."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_repeat_served_from_cache(self, ai_client, mock_litellm):
+        """Test identical temperature 0 stateless requests hit the API once."""
+        ai_client.temperature = 0
+        mock_litellm.return_value = MockResponse("回應")
+
+        await ai_client.chat("Test", use_history=False)
+        result = await ai_client.chat("Test", use_history=False)
+
+        assert result == "回應"
+        mock_litellm.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_not_cached(self, ai_client, mock_litellm):
+        """Test requests with temperature > 0 always reach the API."""
+        ai_client.temperature = 0.7
+        mock_litellm.return_value = MockResponse("回應")
+
+        await ai_client.chat("Test", use_history=False)
+        await ai_client.chat("Test", use_history=False)
+
+        assert mock_litellm.call_count == 2
+
+
 class TestGetRecommendation:
     """Test cases for get_recommendation method."""
 
@@ -356,6 +778,28 @@ class TestGetRecommendation:
         assert "action" in result
 
 
+    @pytest.mark.asyncio
+    async def test_get_recommendation_extracts_first_fenced_object(self, ai_client, mock_litellm):
+        """Test the first JSON object is parsed from fenced output with extra blocks."""
+        mock_litellm.return_value = MockResponse(
+            '```json\n{"signal": "Buy", "summary": "站上 {月線}\\"支撐\\""}\n```\n'
+            '備註 {"signal": "Sell"}'
+        )
+
+        result = await ai_client.get_recommendation("2330", {"rsi_14": 25.0})
+
+        assert result == {"signal": "Buy", "summary": '站上 {月線}"支撐"'}
+
+    @pytest.mark.asyncio
+    async def test_get_recommendation_falls_back_to_raw_response(self, ai_client, mock_litellm):
+        """Test unbalanced output is returned as raw_response."""
+        mock_litellm.return_value = MockResponse('{"signal": "Buy"')
+
+        result = await ai_client.get_recommendation("2330", {"rsi_14": 25.0})
+
+        assert result == {"raw_response": '{"signal": "Buy"'}
+
+
 class TestModelSettings:
     """Test cases for model settings."""
 
@@ -90,3 +90,52 @@ class TestStockAnalysisPrompts:
         assert "請分析產業類別：半導體" in prompt
         assert "未來展望" in prompt
         assert "直接說明限制" in prompt
+
+    def test_composed_prompts_are_built_once(self):
+        first = StockAnalysisPrompts.get_comprehensive_prompt()
+        second = StockAnalysisPrompts().get_comprehensive_prompt()
+
+        assert first is second
+        assert first.startswith(StockAnalysisPrompts.get_system_base())
+
+    def test_format_analysis_request_serializes_rich_values(self):
+        from datetime import date
+
+        import numpy as np
+
+        prompt = StockAnalysisPrompts.format_analysis_request(
+            "2330", {"name": "台積電", "rsi": np.float64(55.5), "date": date(2024, 1, 2)}
+        )
+
+        assert '"name": "台積電"' in prompt
+        assert '"rsi": 55.5' in prompt
+        assert '"date": "2024-01-02"' in prompt
+
+
+class TestDumpsJsonAsync:
+    """Test off-loop JSON serialization."""
+
+    async def test_small_payload_serialized_inline(self):
+        from unittest.mock import patch
+
+        from pulse.ai.prompts import dumps_json, dumps_json_async
+
+        data = {"price": 100}
+        with patch("pulse.ai.prompts.asyncio.to_thread") as to_thread:
+            result = await dumps_json_async(data)
+
+        to_thread.assert_not_called()
+        assert result == dumps_json(data)
+
+    async def test_large_payload_serialized_in_thread(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from pulse.ai.prompts import JSON_OFFLOAD_THRESHOLD, dumps_json, dumps_json_async
+
+        data = {"history": [{"close": i, "volume": i} for i in range(JSON_OFFLOAD_THRESHOLD)]}
+        with patch("pulse.ai.prompts.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await dumps_json_async(data)
+
+        to_thread.assert_called_once()
+        assert result == dumps_json(data)
@@ -231,6 +231,138 @@ class TestAnalyzeCommandInputValidation:
         assert "無法" in result or "not found" in result.lower()
 
 
+class TestAnalyzerReuse:
+    """Test cases for shared analysis command instances."""
+
+    def test_analyzers_are_shared_instances(self):
+        """Test analyzers are created once and reused across commands."""
+        from pulse.cli.commands import analysis
+
+        assert analysis._technical() is analysis._technical()
+        assert analysis._provider() is analysis._provider()
+
+    @pytest.mark.asyncio
+    async def test_technical_command_does_not_build_sapta(self, mock_app):
+        """Test a command only builds the analyzers it uses (e.g. not SAPTA)."""
+        from pulse.cli.commands import analysis
+
+        analysis._sapta.cache_clear()
+        technical = MagicMock()
+        technical.analyze = AsyncMock(return_value=None)
+
+        with (
+            patch("pulse.core.sapta.SaptaEngine") as sapta_engine,
+            patch.object(analysis, "_technical", return_value=technical),
+        ):
+            await analysis.technical_command(mock_app, "9999")
+
+        technical.analyze.assert_awaited_once_with("9999")
+        sapta_engine.assert_not_called()
+        assert analysis._sapta.cache_info().currsize == 0
+
+
+class TestResultCache:
+    """Test cases for the per-ticker analysis result cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_results(self):
+        from pulse.cli.commands import analysis
+
+        analysis._results.clear()
+        yield
+        analysis._results.clear()
+
+    @pytest.mark.asyncio
+    async def test_cached_reuses_recent_result(self):
+        """Test repeated lookups within the TTL skip the factory."""
+        from pulse.cli.commands.analysis import _cached
+
+        factory = AsyncMock(return_value="indicators")
+
+        first = await _cached("technical", "2330", factory)
+        second = await _cached("technical", "2330", factory)
+
+        assert first == second == "indicators"
+        factory.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_expires_after_ttl(self):
+        """Test results older than the TTL are recomputed."""
+        from pulse.cli.commands.analysis import RESULT_TTLS, _cached
+
+        factory = AsyncMock(return_value="indicators")
+
+        with patch("pulse.cli.commands.analysis.time.monotonic", return_value=1000.0):
+            await _cached("technical", "2330", factory)
+        with patch(
+            "pulse.cli.commands.analysis.time.monotonic",
+            return_value=1000.0 + RESULT_TTLS["technical"] + 1,
+        ):
+            await _cached("technical", "2330", factory)
+
+        assert factory.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_skips_none(self):
+        """Test failed (None) results are not cached."""
+        from pulse.cli.commands.analysis import _cached
+
+        factory = AsyncMock(return_value=None)
+
+        await _cached("stock", "9999", factory)
+        await _cached("stock", "9999", factory)
+
+        assert factory.await_count == 2
+
+
+class TestHappyLinesCommand:
+    """Test cases for happy lines command output."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "price,marked",
+        [
+            (55.0, "第5線"),
+            (50.0, "第5線"),
+            (45.0, "第4線"),
+            (30.0, "第3線"),
+            (25.0, "第2線"),
+            (15.0, "第1線"),
+            (5.0, "第1線"),
+        ],
+    )
+    async def test_happy_lines_marks_current_zone(self, mock_app, price, marked):
+        """Test exactly one line is marked as the current position."""
+        import pandas as pd
+
+        from pulse.cli.commands.analysis import happy_lines_command
+
+        happy = MagicMock(
+            line_1=10.0,
+            line_2=20.0,
+            line_3=30.0,
+            line_4=40.0,
+            line_5=50.0,
+            current_price=price,
+            position_ratio=50.0,
+            channel=None,
+        )
+        provider = MagicMock()
+        provider.fetch_history = AsyncMock(return_value=pd.DataFrame({"close": [1.0]}))
+        technical = MagicMock()
+        technical.calculate_happy_lines.return_value = happy
+
+        with (
+            patch("pulse.cli.commands.analysis._provider", return_value=provider),
+            patch("pulse.cli.commands.analysis._technical", return_value=technical),
+        ):
+            result = await happy_lines_command(mock_app, "2330")
+
+        marked_lines = [line for line in result.splitlines() if "你在這裡" in line]
+        assert len(marked_lines) == 1
+        assert marked_lines[0].startswith(marked)
+
+
 class TestTechnicalCommandInputValidation:
     """Test cases for technical command input validation."""
 
@@ -270,6 +402,128 @@ class TestScreenCommand:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    @pytest.mark.asyncio
+    async def test_screen_command_labels_signals(self, mock_app):
+        """Test RSI takes precedence over MACD when labelling screen rows."""
+        from pulse.cli.commands.screening import screen_command
+        from pulse.core.screener import ScreenResult
+
+        results = [
+            ScreenResult(ticker="2330", price=1000.0, rsi_14=25.0, macd=-1.0, macd_signal=0.0),
+            ScreenResult(ticker="2454", price=900.0, rsi_14=50.0, macd=-1.0, macd_signal=0.0),
+            ScreenResult(ticker="2317", price=100.0),
+        ]
+
+        with patch("pulse.core.screener.StockScreener") as mock_screener:
+            mock_screener.return_value.screen_preset = AsyncMock(return_value=results)
+            mock_screener.return_value.universe = ["2330", "2454", "2317"]
+            result = await screen_command(mock_app, "oversold")
+
+        lines = result.splitlines()
+        assert "(多頭)" in next(line for line in lines if "2330" in line)
+        assert "(空頭)" in next(line for line in lines if "2454" in line)
+        line_2317 = next(line for line in lines if "2317" in line)
+        assert "(多頭)" not in line_2317 and "(空頭)" not in line_2317
+
+    @pytest.mark.asyncio
+    async def test_screen_command_resolves_universe_alias(self, mock_app):
+        """Test legacy universe aliases map to the current universe."""
+        from pulse.cli.commands.screening import screen_command
+        from pulse.core.screener import StockUniverse
+
+        with patch("pulse.core.screener.StockScreener") as mock_screener:
+            mock_screener.return_value.screen_preset = AsyncMock(return_value=[])
+            mock_screener.return_value.universe = []
+            await screen_command(mock_app, "oversold --universe=LQ45")
+
+        mock_screener.assert_called_once_with(universe_type=StockUniverse.TW50)
+        mock_screener.return_value.screen_preset.assert_awaited_once()
+
+
+class TestParseOptions:
+    """Test cases for screening command option parsing."""
+
+    def test_parse_options_splits_flags_and_positional(self):
+        """Test flags are case-folded while values and positional tokens keep case."""
+        from pulse.cli.commands.screening import _parse_options
+
+        options, positional = _parse_options("rsi<30 --Universe=TW50 --export=My.csv --FAST")
+
+        assert options == {"universe": "TW50", "export": "My.csv", "fast": None}
+        assert positional == ["rsi<30"]
+
+    def test_parse_options_empty(self):
+        """Test empty args yield no options."""
+        from pulse.cli.commands.screening import _parse_options
+
+        assert _parse_options("") == ({}, [])
+
+
+class TestSmartMoneyCommand:
+    """Test cases for smart money command option parsing."""
+
+    @pytest.mark.asyncio
+    async def test_smart_money_options_are_case_insensitive(self, mock_app):
+        """Test market, mode, score and limit flags are parsed regardless of case."""
+        from pulse.cli.commands.screening import smart_money_command
+
+        with patch("pulse.core.smart_money_screener.SmartMoneyScreener") as mock_screener:
+            mock_screener.return_value.screen = AsyncMock(return_value=[])
+            await smart_money_command(mock_app, "--OTC --Fast --MIN=55.5 --Limit=7")
+
+        mock_screener.return_value.screen.assert_awaited_once_with(
+            min_score=55.5, limit=7, market="otc", fast_mode=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_smart_money_invalid_values_use_defaults(self, mock_app):
+        """Test malformed numeric options fall back to defaults."""
+        from pulse.cli.commands.screening import smart_money_command
+
+        with patch("pulse.core.smart_money_screener.SmartMoneyScreener") as mock_screener:
+            mock_screener.return_value.screen = AsyncMock(return_value=[])
+            await smart_money_command(mock_app, "--min=abc --limit=")
+
+        mock_screener.return_value.screen.assert_awaited_once_with(
+            min_score=40.0, limit=20, market="tw50", fast_mode=False
+        )
+
+
+class TestExportResultsToCsv:
+    """Test cases for screening CSV export."""
+
+    def test_export_writes_header_and_rows(self, tmp_path, monkeypatch):
+        """Test every result is exported with Happy Lines columns filled or blank."""
+        import csv
+
+        from pulse.cli.commands.screening import export_results_to_csv
+        from pulse.core.screener import ScreenResult
+
+        monkeypatch.chdir(tmp_path)
+        happy = MagicMock(
+            line_1=1.0, line_2=2.0, line_3=3.0, line_4=4.0, line_5=5.0, position_ratio=42.0
+        )
+        happy.zone.value = "平衡區"
+        results = [
+            ScreenResult(ticker="2330", name="台積電", price=1000.0, signals=["RSI oversold"]),
+            ScreenResult(ticker="2454", happy_lines=happy),
+        ]
+
+        path = export_results_to_csv(results, "out.csv")
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert [r["ticker"] for r in rows] == ["2330", "2454"]
+        assert rows[0]["name"] == "台積電"
+        assert rows[0]["price"] == "1000.0"
+        assert rows[0]["signals"] == "RSI oversold"
+        assert rows[0]["happy_zone"] == ""
+        assert rows[1]["name"] == ""
+        assert rows[1]["happy_line_5"] == "5.0"
+        assert rows[1]["happy_position_ratio"] == "42.00%"
+        assert rows[1]["happy_zone"] == "平衡區"
+
 
 class TestCompareCommand:
     """Test cases for compare command handler."""
@@ -284,6 +538,39 @@ class TestCompareCommand:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    @pytest.mark.asyncio
+    async def test_compare_command_skips_failed_fetches(self, mock_app):
+        """Test compare command ignores tickers whose fetch fails."""
+        from pulse.cli.commands.screening import compare_command
+
+        def make_stock(ticker):
+            return MagicMock(
+                ticker=ticker,
+                name=ticker,
+                current_price=100.0,
+                change=1.0,
+                change_percent=1.0,
+                volume=1000,
+            )
+
+        async def fake_fetch(ticker):
+            if ticker == "9999":
+                raise RuntimeError("network error")
+            if ticker == "8888":
+                return None
+            return make_stock(ticker)
+
+        with (
+            patch("pulse.core.data.yfinance.YFinanceFetcher.fetch_stock", side_effect=fake_fetch),
+            patch("pulse.utils.rich_output.create_compare_table") as mock_table,
+        ):
+            mock_table.return_value = "table"
+            result = await compare_command(mock_app, "2330 9999 8888 2454")
+
+        assert result == "table"
+        compared = [row["ticker"] for row in mock_table.call_args.args[0]]
+        assert compared == ["2330", "2454"]
+
 
 class TestChartCommandInputValidation:
     """Test cases for chart command input validation."""
@@ -0,0 +1,119 @@
+"""Tests for the analysis data review screen."""
+
+import pytest
+from textual.app import App
+
+from pulse.cli.data_review_screen import (
+    DataReviewScreen,
+    LazyDataView,
+    format_analysis_data,
+    format_analysis_lines,
+)
+
+SAMPLE_DATA = {
+    "stock": {
+        "ticker": "2330",
+        "name": "台積電",
+        "price": 1000.0,
+        "change": 20.0,
+        "change_percent": 2.04,
+        "volume": 50000000,
+        "market_cap": 26000000000000,
+    },
+    "technical": {
+        "trend": "Bullish",
+        "indicators": {"rsi_14": 65.5, "status": "[neutral]"},
+        "signals": ["MACD golden cross", "Above SMA20"],
+        "support": 950.0,
+        "resistance": 1050.0,
+    },
+    "fundamental": {
+        "valuation": {"pe_ratio": 22.5},
+        "profitability": {"roe": 28.1},
+        "growth": {"revenue_growth": 33.3, "note": "N/A"},
+    },
+    "broker": {
+        "foreign": {"net_buy": 12345},
+        "trust": {"net_buy": -678},
+        "summary": "外資連續買超",
+    },
+}
+
+
+def test_format_analysis_data_sections():
+    text = format_analysis_data("2330", SAMPLE_DATA)
+
+    assert "代碼: 2330" in text
+    assert "當前價格: NT$ 1000.00" in text
+    assert "成交量: 50,000,000" in text
+    assert "  rsi_14: 65.50" in text
+    assert "信號: MACD golden cross, Above SMA20" in text
+    assert "  roe: 28.10%" in text
+    assert "  note: N/A" in text
+    assert "外資買賣超: 12,345 張" in text
+    assert "投信買賣超: -678 張" in text
+    assert text.endswith("- 按 Esc 取消分析")
+
+
+def test_format_analysis_data_empty():
+    text = format_analysis_data("2330", {})
+
+    assert text.startswith("=" * 50)
+    assert "股票基本資訊" not in text
+
+
+def test_format_analysis_lines_matches_joined_text():
+    lines = format_analysis_lines("2330", SAMPLE_DATA)
+
+    assert all("\n" not in line for line in lines)
+    assert "\n".join(lines) == format_analysis_data("2330", SAMPLE_DATA)
+
+
+def test_data_review_screen_formats_data_once():
+    screen = DataReviewScreen("2330", SAMPLE_DATA)
+
+    assert screen.formatted_data == format_analysis_data("2330", SAMPLE_DATA)
+    assert screen._lines == screen.formatted_data.split("\n")
+
+
+@pytest.mark.asyncio
+async def test_lazy_data_view_renders_visible_lines():
+    lines = [f"line {i} [neutral]" for i in range(100)]
+
+    class ViewApp(App):
+        def compose(self):
+            yield LazyDataView(lines)
+
+    async with ViewApp().run_test(size=(40, 10)) as pilot:
+        view = pilot.app.query_one(LazyDataView)
+        assert view.virtual_size.height == 100
+        # Plain text: values like "[neutral]" are not read as markup
+        assert view.render_line(0).text.startswith("line 0 [neutral]")
+
+        view.scroll_to(y=50, animate=False)
+        await pilot.pause()
+        assert view.render_line(0).text.startswith("line 50 ")
+
+
+@pytest.mark.asyncio
+async def test_lazy_data_view_splits_multiline_values():
+    data = {"broker": {"summary": "外資連續買超\n投信轉賣"}}
+    lines = format_analysis_lines("2330", data)
+
+    class ViewApp(App):
+        def compose(self):
+            yield LazyDataView(lines)
+
+    async with ViewApp().run_test(size=(40, 40)) as pilot:
+        view = pilot.app.query_one(LazyDataView)
+        assert view.virtual_size.height == len(lines) + 1
+        rows = [view.render_line(y).text.rstrip() for y in range(view.virtual_size.height)]
+        assert all("\n" not in row for row in rows)
+        assert rows.index("近期趨勢: 外資連續買超") + 1 == rows.index("投信轉賣")
+
+
+def test_format_analysis_data_empty_sections_only_footer():
+    empty = format_analysis_data("2330", {})
+
+    assert format_analysis_data("2330", {"stock": {}, "broker": None}) == empty
+    assert empty.endswith("- 按 Esc 取消分析")
@@ -13,6 +13,30 @@ def test_parse_stocks_args_supports_sync():
     assert parsed["sync"] is True
 
 
+def test_parse_stocks_args_supports_no_cache():
+    parsed = parse_stocks_args("--no-cache")
+
+    assert parsed["no_cache"] is True
+
+
+def test_parse_stocks_args_defaults_false():
+    parsed = parse_stocks_args("")
+
+    assert parsed == {
+        "json": False,
+        "csv": False,
+        "twse_only": False,
+        "tpex_only": False,
+        "tickers_only": False,
+        "sync": False,
+        "no_cache": False,
+    }
+
+
+def test_parse_stocks_args_rejects_unknown_flag():
+    assert "error" in parse_stocks_args("--tickers --bogus")
+
+
 @pytest.mark.asyncio
 async def test_stocks_command_sync_refreshes_all_files():
     mock_fetcher = MagicMock()
@@ -38,3 +62,75 @@ async def test_stocks_command_sync_refreshes_all_files():
     assert "TWSE: data/tw_codes_listed.json" in result
     assert "TPEx: data/tw_codes_otc.json" in result
     mock_fetcher.save_all_for_main_program.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stocks_command_tickers_fetches_both_markets():
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_twse_stocks.return_value = [{"ticker": "2330"}]
+    mock_fetcher.get_tpex_stocks.return_value = [{"ticker": "6488"}]
+
+    mock_app = MagicMock()
+    mock_app.config.finmind_token = ""
+
+    with patch("pulse.cli.commands.stock_list.StockListFetcher", return_value=mock_fetcher):
+        result = await stocks_command(mock_app, "--tickers")
+
+    assert result == "2330\n6488"
+
+
+@pytest.mark.asyncio
+async def test_stocks_command_twse_only_skips_tpex():
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_twse_stocks.return_value = [{"ticker": "2330"}]
+
+    mock_app = MagicMock()
+    mock_app.config.finmind_token = ""
+
+    with patch("pulse.cli.commands.stock_list.StockListFetcher", return_value=mock_fetcher):
+        result = await stocks_command(mock_app, "--twse --tickers")
+
+    assert result == "2330"
+    mock_fetcher.get_tpex_stocks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stocks_command_prints_sample_tables():
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_twse_stocks.return_value = [
+        {"ticker": "2330", "name": "台積電", "industry": "半導體"}
+    ]
+    mock_fetcher.get_tpex_stocks.return_value = [
+        {"ticker": "6488", "name": "環球晶", "industry": None}
+    ]
+
+    mock_app = MagicMock()
+    mock_app.config.finmind_token = ""
+
+    with (
+        patch("pulse.cli.commands.stock_list.StockListFetcher", return_value=mock_fetcher),
+        patch("rich.console.Console") as mock_console,
+    ):
+        result = await stocks_command(mock_app, "")
+
+    assert "總計: 2 檔股票" in result
+    assert mock_console.return_value.print.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stocks_command_tickers_sorted_numerically():
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_twse_stocks.return_value = [
+        {"ticker": "2330"},
+        {"ticker": "0050"},
+        {"ticker": "2881A"},
+    ]
+    mock_fetcher.get_tpex_stocks.return_value = [{"ticker": "11011"}, {"ticker": "1102"}]
+
+    mock_app = MagicMock()
+    mock_app.config.finmind_token = ""
+
+    with patch("pulse.cli.commands.stock_list.StockListFetcher", return_value=mock_fetcher):
+        result = await stocks_command(mock_app, "--tickers")
+
+    assert result.split("\n") == ["0050", "1102", "2330", "11011", "2881A"]
@@ -0,0 +1,131 @@
+"""Tests for Fundamental Data Recovery."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pulse.core.analysis import fundamental_recovery
+from pulse.core.analysis.fundamental_recovery import (
+    FundamentalDataRecovery,
+    fetch_fundamentals_with_recovery,
+    get_recovery,
+)
+from pulse.core.models import FundamentalData
+
+
+class TestGetRecovery:
+    """Test cases for the shared recovery engine."""
+
+    def test_returns_same_instance(self):
+        """Test the recovery engine is constructed once and reused."""
+        with patch.object(fundamental_recovery, "_default_recovery", None):
+            first = get_recovery()
+            assert isinstance(first, FundamentalDataRecovery)
+            assert get_recovery() is first
+
+    @pytest.mark.asyncio
+    async def test_convenience_function_reuses_engine(self):
+        """Test fetch_fundamentals_with_recovery does not rebuild fetchers per call."""
+        with (
+            patch.object(fundamental_recovery, "_default_recovery", None),
+            patch.object(
+                FundamentalDataRecovery, "fetch_with_recovery", new_callable=AsyncMock
+            ) as mock_fetch,
+            patch.object(FundamentalDataRecovery, "__init__", return_value=None) as mock_init,
+        ):
+            mock_fetch.return_value = (None, {})
+
+            await fetch_fundamentals_with_recovery("2330")
+            await fetch_fundamentals_with_recovery("2454", sector="Semiconductor")
+
+        mock_init.assert_called_once()
+        assert mock_fetch.await_count == 2
+
+
+class TestFetchWithRecovery:
+    """Test cases for multi-source fetching."""
+
+    @pytest.fixture
+    def recovery(self):
+        """Create a recovery engine with mocked sources."""
+        engine = FundamentalDataRecovery()
+        engine.finmind = MagicMock()
+        engine.yfinance = MagicMock()
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_sources_fetched_concurrently(self, recovery):
+        """Test FinMind and yfinance requests overlap instead of running in turn."""
+        both_started = asyncio.Event()
+        started = 0
+
+        async def fetch(*args):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return FundamentalData(ticker="2330", pe_ratio=20.0)
+
+        recovery.finmind.fetch_fundamentals = fetch
+        recovery.yfinance.fetch_fundamentals = fetch
+
+        result, info = await recovery.fetch_with_recovery("2330")
+
+        assert result.pe_ratio == 20.0
+        assert info["sources_used"] == ["FinMind", "yfinance"]
+
+    @pytest.mark.asyncio
+    async def test_failed_source_is_skipped(self, recovery):
+        """Test a failing source does not prevent using the other."""
+        recovery.finmind.fetch_fundamentals = AsyncMock(side_effect=RuntimeError("down"))
+        recovery.yfinance.fetch_fundamentals = AsyncMock(
+            return_value=FundamentalData(ticker="2330", pe_ratio=18.0)
+        )
+
+        result, info = await recovery.fetch_with_recovery("2330")
+
+        assert result.pe_ratio == 18.0
+        assert info["sources_used"] == ["yfinance"]
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_use_sector_average(self, recovery):
+        """Test missing estimable fields fall back to the sector average."""
+        recovery.finmind.fetch_fundamentals = AsyncMock(return_value=None)
+        recovery.yfinance.fetch_fundamentals = AsyncMock(
+            return_value=FundamentalData(ticker="2330", pe_ratio=25.0, roe=30.0)
+        )
+
+        result, info = await recovery.fetch_with_recovery("2330", sector="Semiconductor")
+
+        assert result.pe_ratio == 25.0
+        assert result.pb_ratio == 4.5
+        assert result.revenue_growth == 12.0
+        assert info["values_recovered"] == ["P/E Ratio", "ROE"]
+        assert "P/B Ratio (sector average)" in info["values_estimated"]
+        assert len(info["values_estimated"]) == 5
+        assert info["values_default"] == []
+        assert info["data_quality_score"] == 70.0
+
+
+class TestMergeSources:
+    """Test cases for merging source data."""
+
+    def test_prefers_yfinance_and_falls_back_to_finmind(self):
+        """Test yfinance values win unless missing, where FinMind fills in."""
+        finmind = FundamentalData(ticker="2330", pe_ratio=19.0, eps=30.0)
+        yfinance = FundamentalData(ticker="2330.TW", pe_ratio=21.0, roe=28.0)
+
+        merged = FundamentalDataRecovery._merge_sources(None, finmind, yfinance)
+
+        assert merged["pe_ratio"] == 21.0
+        assert merged["eps"] == 30.0
+        assert merged["roe"] == 28.0
+        assert merged["pb_ratio"] is None
+        assert "ticker" not in merged
+        assert "fetched_at" not in merged
+
+    def test_no_sources(self):
+        """Test merging with no sources yields no values."""
+        assert FundamentalDataRecovery._merge_sources(None, None, None) == {}
@@ -0,0 +1,191 @@
+"""Tests for Institutional Flow Analyzer."""
+
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+
+from pulse.core.analysis.institutional_flow import InstitutionalFlowAnalyzer, _compute_flow
+from pulse.core.models import SignalType
+from pulse.utils.rich_output import ICONS
+
+
+@pytest.fixture
+def analyzer():
+    """Create InstitutionalFlowAnalyzer instance for testing."""
+    return InstitutionalFlowAnalyzer()
+
+
+@pytest.fixture
+def flow_data():
+    """FinMind-style long format institutional data over two days."""
+    return pd.DataFrame(
+        {
+            "date": ["2024-01-02"] * 5 + ["2024-01-03"] * 5,
+            "stock_id": ["2330"] * 10,
+            "name": [
+                "Foreign_Investor",
+                "Investment_Trust",
+                "Dealer_self",
+                "Dealer_Hedging",
+                "Foreign_Dealer_Self",
+            ]
+            * 2,
+            "buy": [1000, 200, 50, 30, 999, 800, 100, 10, 20, 999],
+            "sell": [400, 300, 20, 10, 0, 600, 50, 40, 0, 0],
+        }
+    )
+
+
+class TestAnalyze:
+    """Test cases for institutional flow analysis."""
+
+    @pytest.mark.asyncio
+    async def test_net_totals_per_institution(self, analyzer, flow_data):
+        """Test net buy/sell is summed per institution, ignoring unknown names."""
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            result = await analyzer.analyze("2330")
+
+        assert result["foreign_investor_net"] == 800
+        assert result["investment_trust_net"] == -50
+        assert result["dealer_net"] == 40
+        assert result["overall_institutional_net_flow"] == 790
+        assert isinstance(result["foreign_investor_net"], int)
+        assert result["signal"] == SignalType.BUY
+        assert result["score"] == 70
+
+        insights = result["insights"]
+        assert len(insights) == 4
+        assert result["overall_institutional_net_flow_formatted"] in insights[0]
+        assert insights[1].endswith(f"外資淨買超 {result['foreign_investor_net_formatted']}")
+        assert insights[2].endswith(f"投信淨賣超 {result['investment_trust_net_formatted']}")
+        assert insights[3].endswith(f"自營商淨買超 {result['dealer_net_formatted']}")
+
+    @pytest.mark.asyncio
+    async def test_missing_institution_counts_as_zero(self, analyzer, flow_data):
+        """Test institutions absent from the data contribute zero."""
+        only_foreign = flow_data[flow_data["name"] == "Foreign_Investor"]
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = only_foreign
+
+            result = await analyzer.analyze("2330")
+
+        assert result["investment_trust_net"] == 0
+        assert result["dealer_net"] == 0
+        assert result["overall_institutional_net_flow"] == 800
+        assert len(result["insights"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_values_are_skipped(self, analyzer, flow_data):
+        """Test NaN buy/sell values are left out of the totals."""
+        flow_data["buy"] = flow_data["buy"].astype(float)
+        flow_data.loc[0, "buy"] = float("nan")
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            result = await analyzer.analyze("2330")
+
+        assert result["foreign_investor_net"] == -200
+        assert result["overall_institutional_net_flow"] == -210
+        assert result["signal"] == SignalType.SELL
+        assert "外資淨賣超" in result["insights"][1]
+
+    @pytest.mark.asyncio
+    async def test_no_data_returns_none(self, analyzer):
+        """Test None is returned when no data is available."""
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = pd.DataFrame()
+
+            assert await analyzer.analyze("2330") is None
+
+    @pytest.mark.asyncio
+    async def test_net_selling_signal(self, analyzer, flow_data):
+        """Test overall net selling yields a sell signal."""
+        flow_data["buy"], flow_data["sell"] = flow_data["sell"], flow_data["buy"]
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            result = await analyzer.analyze("2330")
+
+        assert result["signal"] == SignalType.SELL
+        assert result["score"] == 30
+        assert "機構法人總計淨賣超" in result["insights"][0]
+        assert "外資淨賣超" in result["insights"][1]
+
+    @pytest.mark.asyncio
+    async def test_flat_flow_is_neutral(self, analyzer, flow_data):
+        """Test zero net flow is neutral with only the overall insight."""
+        flow_data["sell"] = flow_data["buy"]
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            result = await analyzer.analyze("2330", days=10)
+
+        assert result["signal"] == SignalType.NEUTRAL
+        assert result["score"] == 50
+        assert result["insights"] == [f"{ICONS['white']} 機構法人買賣超不明顯 (過去 10 個交易日)"]
+
+
+class TestFormatSummaryTable:
+    """Test cases for the summary table."""
+
+    @pytest.mark.asyncio
+    async def test_summary_table(self, analyzer, flow_data):
+        """Test the summary lists net flows followed by insights."""
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            result = await analyzer.analyze("2330")
+
+        table = analyzer.format_summary_table(result)
+        lines = table.split("\n")
+
+        assert lines[0].startswith("═══ 機構法人動向: 2330 (")
+        assert lines[2] == f"總體訊號: {SignalType.BUY.value} (評分: 70/100)"
+        assert lines[6] == f"外資淨流量: {result['foreign_investor_net_formatted']}"
+        assert lines[8] == f"自營商淨流量: {result['dealer_net_formatted']}"
+        assert lines[9] == ""
+        assert lines[10] == "─── 洞察報告 ───"
+        assert lines[11:] == result["insights"]
+
+    def test_summary_table_without_insights(self, analyzer):
+        """Test the summary ends after the net flows when there are no insights."""
+        table = analyzer.format_summary_table(
+            {"ticker": "2330", "analysis_period_start": "a", "analysis_period_end": "b"}
+        )
+
+        assert table.endswith("自營商淨流量: -\n")
+        assert "洞察報告" not in table
+
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_is_memoized(self, analyzer, flow_data):
+        """Test identical data reuses the computed result without sharing state."""
+        _compute_flow.cache_clear()
+        with patch.object(
+            analyzer.data_provider, "fetch_institutional_investors", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = flow_data
+
+            first = await analyzer.analyze("2330")
+            first["insights"].append("mutated")
+            second = await analyzer.analyze("2330")
+
+        assert _compute_flow.cache_info().hits == 1
+        assert "mutated" not in second["insights"]
+        assert second["foreign_investor_net"] == 800
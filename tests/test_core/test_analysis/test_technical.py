@@ -1,5 +1,8 @@
 """Tests for Technical Analyzer - RSI, MACD, Bollinger Bands, etc."""
 
+import asyncio
+import threading
+
 import pytest
 import pandas as pd
 import numpy as np
@@ -8,6 +11,7 @@ from unittest.mock import MagicMock, AsyncMock, patch
 
 from pulse.core.analysis.technical import TechnicalAnalyzer
 from pulse.core.models import (
+    HappyZone,
     SignalType,
     TechnicalIndicators,
     TrendType,
@@ -118,6 +122,20 @@ def oversold_price_data():
     return pd.DataFrame(data, index=dates)
 
 
+def _record_threads(func):
+    """Wrap ``func`` so each call records the thread it ran in.
+
+    Returns the wrapper (for use as a ``patch`` side effect) and the list of threads.
+    """
+    threads = []
+
+    def wrapper(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return func(*args, **kwargs)
+
+    return wrapper, threads
+
+
 # ============ Test Classes ============
 
 
@@ -510,6 +528,22 @@ class TestAnalyzeMethod:
         assert result is not None
         mock_fetch.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_analyze_fetches_one_year_to_today(self, analyzer, sample_price_data):
+        """Test the history request covers the year up to today."""
+        from datetime import date, timedelta
+
+        with patch.object(analyzer.fetcher, "fetch_history", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = sample_price_data
+
+            await analyzer.analyze("2330")
+
+        today = date.today()
+        assert mock_fetch.call_args.kwargs == {
+            "start_date": (today - timedelta(days=365)).strftime("%Y-%m-%d"),
+            "end_date": today.strftime("%Y-%m-%d"),
+        }
+
     @pytest.mark.asyncio
     async def test_analyze_returns_none_for_no_data(self, analyzer):
         """Test analysis returns None when no data available."""
@@ -530,6 +564,425 @@ class TestAnalyzeMethod:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_analyze_calculates_off_event_loop(self, analyzer, sample_price_data):
+        """Test indicator calculation runs in a worker thread, not on the event loop."""
+        calculate, calc_threads = _record_threads(analyzer._calculate_indicators)
+
+        with patch.object(analyzer, "_calculate_indicators", side_effect=calculate):
+            result = await analyzer.analyze("2330", df=sample_price_data)
+
+        assert isinstance(result, TechnicalIndicators)
+        assert calc_threads and calc_threads[0] is not threading.current_thread()
+
+
+class TestHappyLines:
+    """Test cases for Happy Lines (樂活五線譜) calculation."""
+
+    def test_lines_match_rolling_statistics(self, analyzer, sample_price_data):
+        """Test the five lines equal the trailing rolling mean/std bands."""
+        period = 60
+        result = analyzer.calculate_happy_lines(sample_price_data, "2330", period=period)
+
+        close = sample_price_data["close"]
+        mean = close.rolling(window=period).mean().iloc[-1]
+        std = close.rolling(window=period).std().iloc[-1]
+
+        assert result is not None
+        assert result.line_3 == pytest.approx(mean)
+        assert result.std_dev == pytest.approx(std)
+        assert result.line_5 == pytest.approx(mean + 2 * std)
+        assert result.line_1 == pytest.approx(mean - 2 * std)
+        assert 0 <= result.position_ratio <= 100
+
+    def test_channel_matches_rolling_means(self, analyzer, sample_price_data):
+        """Test the LOHAS channel bands equal the 20-day rolling means."""
+        result = analyzer.calculate_happy_lines(sample_price_data, "2330", period=60)
+
+        assert result.channel is not None
+        assert result.channel.mid_band == pytest.approx(
+            sample_price_data["close"].rolling(20).mean().iloc[-1]
+        )
+        assert result.channel.upper_band == pytest.approx(
+            sample_price_data["high"].rolling(20).mean().iloc[-1]
+        )
+
+    def test_insufficient_data_returns_none(self, analyzer, sample_price_data):
+        """Test None is returned when history is shorter than the period."""
+        result = analyzer.calculate_happy_lines(sample_price_data.head(30), "2330", period=60)
+
+        assert result is None
+
+    def test_trend_sideways_without_short_window(self, analyzer):
+        """Test trend is sideways when history is shorter than the 20-day MA."""
+        close = np.linspace(100.0, 110.0, 10)
+
+        assert analyzer._determine_happy_trend(close, 5) == TrendType.SIDEWAYS
+
+    @pytest.mark.parametrize(
+        ("zone", "trend", "expected"),
+        [
+            (HappyZone.OVERSOLD, TrendType.BULLISH, SignalType.STRONG_BUY),
+            (HappyZone.UNDERVALUED, TrendType.SIDEWAYS, SignalType.BUY),
+            (HappyZone.UNDERVALUED, TrendType.BEARISH, SignalType.NEUTRAL),
+            (HappyZone.OVERBOUGHT, TrendType.BEARISH, SignalType.STRONG_SELL),
+            (HappyZone.OVERVALUED, TrendType.SIDEWAYS, SignalType.SELL),
+            (HappyZone.OVERVALUED, TrendType.BULLISH, SignalType.NEUTRAL),
+            (HappyZone.BALANCED, TrendType.BULLISH, SignalType.NEUTRAL),
+        ],
+    )
+    def test_signal_by_zone_and_trend(self, analyzer, zone, trend, expected):
+        """Test the zone/trend signal table, including the wait-for-reversal cases."""
+        assert analyzer._determine_happy_signal(zone, trend) == expected
+
+    @pytest.mark.asyncio
+    async def test_analyze_calculates_off_event_loop(self, analyzer, sample_price_data):
+        """Test Happy Lines are calculated in a worker thread, not on the event loop."""
+        calculate, calc_threads = _record_threads(analyzer.calculate_happy_lines)
+
+        with (
+            patch.object(analyzer.fetcher, "fetch_history", new_callable=AsyncMock) as mock_fetch,
+            patch.object(analyzer, "calculate_happy_lines", side_effect=calculate),
+        ):
+            mock_fetch.return_value = sample_price_data
+            result = await analyzer.analyze_happy_lines("2330")
+
+        assert result is not None
+        assert calc_threads and calc_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_analyze_fetches_window_sized_to_lookback(self, analyzer, sample_price_data):
+        """Test the history request covers the lookback with a cushion, not a full year."""
+        from datetime import date, timedelta
+
+        with patch.object(analyzer.fetcher, "fetch_history", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = sample_price_data
+            await analyzer.analyze_happy_lines("2330", lookback_period=60)
+
+        today = date.today()
+        assert mock_fetch.call_args.kwargs == {
+            "start_date": (today - timedelta(days=106)).isoformat(),
+            "end_date": today.isoformat(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_analyze_refetches_year_when_window_is_short(self, analyzer, sample_price_data):
+        """Test a short window with too few bars falls back to a one-year request."""
+        from datetime import date, timedelta
+
+        with patch.object(analyzer.fetcher, "fetch_history", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = [sample_price_data.tail(50), sample_price_data]
+            result = await analyzer.analyze_happy_lines("2330", lookback_period=60)
+
+        assert result is not None
+        assert mock_fetch.await_count == 2
+        today = date.today()
+        assert mock_fetch.call_args.kwargs == {
+            "start_date": (today - timedelta(days=365)).isoformat(),
+            "end_date": today.isoformat(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_analyze_reuses_cached_result(self, analyzer, sample_price_data):
+        """Test repeat analyses reuse the result; other lookbacks and misses refetch."""
+        with patch.object(analyzer.fetcher, "fetch_history", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = sample_price_data
+
+            first = await analyzer.analyze_happy_lines("2330")
+            second = await analyzer.analyze_happy_lines("2330")
+            assert second is first
+            assert mock_fetch.await_count == 1
+
+            await analyzer.analyze_happy_lines("2330", lookback_period=120)
+            assert mock_fetch.await_count == 2
+
+            mock_fetch.return_value = None
+            assert await analyzer.analyze_happy_lines("2317") is None
+            assert await analyzer.analyze_happy_lines("2317") is None
+            assert mock_fetch.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_overlaps_fetches_in_input_order(self, analyzer, sample_price_data):
+        """Test batch analysis fetches concurrently and keeps results in input order."""
+        in_flight = peak = 0
+
+        async def fetch_history(ticker, *args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if ticker == "FAIL":
+                raise ConnectionError("network down")
+            return None if ticker == "EMPTY" else sample_price_data
+
+        with patch.object(analyzer.fetcher, "fetch_history", side_effect=fetch_history):
+            results = await analyzer.analyze_happy_lines_batch(
+                ["2330", "EMPTY", "FAIL", "2317"], max_concurrency=2
+            )
+
+        assert peak == 2
+        assert results[0].ticker == "2330"
+        assert results[1] is None
+        assert isinstance(results[2], ConnectionError)
+        assert results[3].ticker == "2317"
+
+
+class TestCalculateIndicatorsFrame:
+    """Test cases for the backtest indicator frame."""
+
+    @pytest.mark.asyncio
+    async def test_moving_window_columns_match_rolling(self, analyzer, sample_price_data):
+        """Test SMA and Bollinger columns equal their pandas rolling definitions."""
+        result = await analyzer.calculate_indicators(sample_price_data)
+
+        close = sample_price_data["close"]
+        sma_20 = close.rolling(20).mean()
+        std_20 = close.rolling(20).std(ddof=0)
+        expected = {
+            "MA_20": sma_20,
+            "MA_50": close.rolling(50).mean(),
+            "MA_200": close.rolling(200).mean(),
+            "BB_middle": sma_20,
+            "BB_upper": sma_20 + 2 * std_20,
+            "BB_lower": sma_20 - 2 * std_20,
+            "BB_width": 4 * std_20 / sma_20 * 100,
+            "Volume_SMA_20": sample_price_data["volume"].rolling(20).mean(),
+        }
+        for column, values in expected.items():
+            np.testing.assert_allclose(result[column].to_numpy(), values.to_numpy(), err_msg=column)
+
+        assert {"RSI_14", "MACD", "MACD_signal", "MACD_hist", "ATR", "EMA_9", "ADX"} <= set(
+            result.columns
+        )
+
+    @pytest.mark.asyncio
+    async def test_ema_columns_match_ta_library(self, analyzer, sample_price_data):
+        """Test MACD and EMA columns equal the ta library's indicators."""
+        from ta.trend import MACD, EMAIndicator
+
+        result = await analyzer.calculate_indicators(sample_price_data)
+
+        close = sample_price_data["close"]
+        macd = MACD(close)
+        expected = {
+            "MACD": macd.macd(),
+            "MACD_signal": macd.macd_signal(),
+            "MACD_hist": macd.macd_diff(),
+            "EMA_9": EMAIndicator(close, n=9).ema_indicator(),
+            "EMA_21": EMAIndicator(close, n=21).ema_indicator(),
+        }
+        for column, values in expected.items():
+            np.testing.assert_array_equal(result[column].to_numpy(), values.to_numpy(), column)
+
+    @pytest.mark.asyncio
+    async def test_rsi_column_matches_ta_library(self, analyzer, sample_price_data):
+        """Test the RSI column equals the ta library's RSIIndicator, NaN warm-up included."""
+        from ta.momentum import RSIIndicator
+
+        result = await analyzer.calculate_indicators(sample_price_data)
+
+        expected = RSIIndicator(sample_price_data["close"], n=14).rsi()
+        np.testing.assert_allclose(result["RSI_14"].to_numpy(), expected.to_numpy())
+        assert result["RSI_14"].iloc[:13].isna().all()
+
+    def test_rsi_without_losses_is_100(self):
+        """Test a window with no down moves reads 100."""
+        from pulse.core.analysis.technical import _rsi
+
+        assert _rsi(np.arange(30, dtype=float), 14)[-1] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_short_history_returns_none(self, analyzer, sample_price_data):
+        """Test fewer bars than the ATR window returns None without computing columns."""
+        assert await analyzer.calculate_indicators(sample_price_data.head(13)) is None
+
+    @pytest.mark.asyncio
+    async def test_long_windows_nan_on_short_history(self, analyzer, sample_price_data):
+        """Test windows longer than the history come back all-NaN."""
+        result = await analyzer.calculate_indicators(sample_price_data.head(40))
+
+        assert result["MA_50"].isna().all()
+        assert result["MA_200"].isna().all()
+        assert result["ATR"].iloc[-1] > 0
+
+    @pytest.mark.asyncio
+    async def test_uppercase_columns_leave_input_untouched(self, analyzer, sample_price_data):
+        """Test capitalized OHLCV columns are accepted without modifying the caller's frame."""
+        upper = sample_price_data.rename(columns=str.capitalize)
+
+        result = await analyzer.calculate_indicators(upper)
+
+        assert list(upper.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert "close" in result.columns
+        assert "RSI_14" not in upper.columns
+
+
+def _pandas_adx(high, low, close, n=14):
+    """Reference ADX/DI built from pandas rolling means."""
+    prev_close = close.shift(1)
+    tr = pd.concat([high - low, abs(high - prev_close), abs(low - prev_close)], axis=1).max(axis=1)
+    plus_dm = high.diff()
+    minus_dm = -low.diff()
+    plus_dm = plus_dm.where(plus_dm > minus_dm, 0).where(plus_dm > 0, 0)
+    minus_dm = minus_dm.where(minus_dm > plus_dm, 0).where(minus_dm > 0, 0)
+    atr = tr.rolling(n).mean()
+    plus_di = plus_dm.rolling(n).mean() / atr * 100
+    minus_di = minus_dm.rolling(n).mean() / atr * 100
+    dx = abs(plus_di - minus_di) / (plus_di + minus_di) * 100
+    return dx.rolling(n).mean(), plus_di, minus_di
+
+
+class TestAdxCci:
+    """Test cases for the ADX and CCI calculations."""
+
+    def test_adx_matches_rolling_reference(self, analyzer, sample_price_data):
+        """Test ADX and +/-DI equal the pandas rolling-mean formulation."""
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+        adx, plus_di, minus_di = _pandas_adx(high, low, close)
+
+        result = analyzer._calculate_adx(high, low, close, n=14)
+
+        assert result == pytest.approx((adx.iloc[-1], plus_di.iloc[-1], minus_di.iloc[-1]))
+
+    def test_adx_series_matches_rolling_reference(self, analyzer, sample_price_data):
+        """Test the ADX series keeps the index and leading NaNs of the rolling version."""
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+        expected, _, _ = _pandas_adx(high, low, close)
+
+        result = analyzer._calculate_adx_series(high, low, close, n=14)
+
+        assert result.index.equals(high.index)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+    def test_adx_insufficient_data(self, analyzer, sample_price_data):
+        """Test ADX values are None when history is shorter than the period."""
+        short = sample_price_data.head(10)
+
+        result = analyzer._calculate_adx(short["high"], short["low"], short["close"], n=14)
+
+        assert result == (None, None, None)
+
+    def test_adx_flat_market_is_zero(self, analyzer, sample_price_data):
+        """Test a stretch without directional movement reads 0 instead of blanking ADX."""
+        flat = sample_price_data.copy()
+        flat.iloc[-40:, :] = 100.0
+
+        result = analyzer._calculate_adx(flat["high"], flat["low"], flat["close"], n=14)
+
+        assert result == (0.0, 0.0, 0.0)
+
+    def test_adx_series_keeps_warm_up_nan(self, analyzer, sample_price_data):
+        """Test the ADX series is NaN until enough bars exist for both smoothing windows."""
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+
+        result = analyzer._calculate_adx_series(high, low, close, n=14)
+
+        assert result.iloc[:26].isna().all()
+        assert result.iloc[26:].notna().all()
+
+    def test_cci_matches_rolling_reference(self, analyzer, sample_price_data):
+        """Test CCI equals the rolling mean-deviation formulation."""
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+        tp = (high + low + close) / 3
+        mean_dev = tp.rolling(20).apply(lambda x: abs(x - x.mean()).mean(), raw=True)
+        expected = ((tp - tp.rolling(20).mean()) / (0.015 * mean_dev)).iloc[-1]
+
+        assert analyzer._calculate_cci(high, low, close, n=20) == pytest.approx(expected)
+
+    def test_cci_insufficient_data(self, analyzer, sample_price_data):
+        """Test CCI is None when history is shorter than the period."""
+        short = sample_price_data.head(5)
+
+        assert analyzer._calculate_cci(short["high"], short["low"], short["close"]) is None
+
+    def test_accepts_ndarrays(self, analyzer, sample_price_data):
+        """Test ADX and CCI give the same values for arrays as for Series."""
+        series = [sample_price_data[c] for c in ("high", "low", "close")]
+        arrays = [s.to_numpy(dtype=float) for s in series]
+
+        assert analyzer._calculate_adx(*arrays) == analyzer._calculate_adx(*series)
+        assert analyzer._calculate_cci(*arrays) == analyzer._calculate_cci(*series)
+
+
+class TestAtrKeltner:
+    """Test cases for ATR and the Keltner Channel."""
+
+    def test_atr_matches_ta_library(self, analyzer, sample_price_data):
+        """Test the reported ATR equals the ta library's AverageTrueRange."""
+        from ta.volatility import AverageTrueRange
+
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+        expected = AverageTrueRange(high, low, close, n=14).average_true_range().iloc[-1]
+
+        result = analyzer._calculate_indicators("2330", sample_price_data)
+
+        assert result.atr_14 == pytest.approx(expected)
+
+    def test_keltner_accepts_precomputed_true_range(self, analyzer, sample_price_data):
+        """Test a shared true range gives the same channel as computing it afresh."""
+        from pulse.core.analysis.technical import _true_range
+
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+        true_range = _true_range(high.to_numpy(), low.to_numpy(), close.to_numpy())
+
+        shared = analyzer._calculate_keltner_channel(close, high, low, true_range=true_range)
+
+        assert shared == analyzer._calculate_keltner_channel(close, high, low)
+        assert shared[2] < shared[0] < shared[1]
+
+    def test_keltner_insufficient_data(self, analyzer, sample_price_data):
+        """Test the channel is empty when history is shorter than the ATR period."""
+        short = sample_price_data.head(5)
+
+        result = analyzer._calculate_keltner_channel(short["close"], short["high"], short["low"])
+
+        assert result == (None, None, None)
+
+
+class TestSupportResistance:
+    """Test cases for pivot-point support and resistance."""
+
+    def test_pivot_levels_from_trailing_window(self, analyzer, sample_price_data):
+        """Test levels come from the last 20 bars' high, low and close."""
+        recent = sample_price_data.tail(20)
+        high, low = recent["high"].max(), recent["low"].min()
+        pivot = (high + low + recent["close"].iloc[-1]) / 3
+
+        result = analyzer._calculate_support_resistance(sample_price_data)
+
+        assert result == pytest.approx(
+            (2 * pivot - high, pivot - (high - low), 2 * pivot - low, pivot + (high - low))
+        )
+
+
+class TestIchimoku:
+    """Test cases for the Ichimoku Cloud."""
+
+    def test_matches_rolling_windows(self, analyzer, sample_price_data):
+        """Test each line equals the pandas rolling max/min definition."""
+        high, low, close = (sample_price_data[c] for c in ("high", "low", "close"))
+
+        def midpoint(window):
+            return (high.rolling(window).max() + low.rolling(window).min()) / 2
+
+        result = analyzer._calculate_ichimoku(sample_price_data)
+
+        assert result["tenkan"] == pytest.approx(midpoint(9).iloc[-1])
+        assert result["kijun"] == pytest.approx(midpoint(26).iloc[-1])
+        assert result["senkou_a"] == pytest.approx(((midpoint(9) + midpoint(26)) / 2).iloc[-26])
+        assert result["senkou_b"] == pytest.approx(midpoint(52).iloc[-26])
+        assert result["chikou"] == pytest.approx(close.iloc[-26])
+
+    def test_short_history(self, analyzer, sample_price_data):
+        """Test leading and lagging spans are None without 26 bars of history."""
+        result = analyzer._calculate_ichimoku(sample_price_data.head(20))
+
+        assert result["tenkan"] is not None
+        assert result["senkou_a"] is None
+        assert result["senkou_b"] is None
+        assert result["chikou"] is None
+
 
 class TestSignalTypeEnum:
     """Test cases for SignalType enum."""
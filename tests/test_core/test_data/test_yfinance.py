@@ -123,3 +123,10 @@ class TestYFinanceFetcher:
         assert data.name == "Taiwan Weighted Index"
         assert data.sector == "Index"
         assert data.current_price == 1025.0
+
+
+def test_get_fetcher_returns_shared_instance():
+    from pulse.core.data.yfinance import get_fetcher
+
+    assert get_fetcher() is get_fetcher()
+    assert isinstance(get_fetcher(), YFinanceFetcher)
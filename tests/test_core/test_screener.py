@@ -268,6 +268,21 @@ class TestScreenResult:
         result = ScreenResult(ticker="2330", macd=None, macd_signal=None)
         assert result.macd_status == "N/A"
 
+    def test_signal_prefers_rsi_extremes(self):
+        """Test signal uses RSI extremes before MACD."""
+        result = ScreenResult(ticker="2330", rsi_14=25.0, macd=1.0, macd_signal=2.0)
+        assert result.signal == "bullish"
+
+    def test_signal_falls_back_to_macd(self):
+        """Test signal uses MACD when RSI is neutral."""
+        result = ScreenResult(ticker="2330", rsi_14=50.0, macd=1.0, macd_signal=2.0)
+        assert result.signal == "bearish"
+
+    def test_signal_empty_without_data(self):
+        """Test signal is empty when no indicators are available."""
+        result = ScreenResult(ticker="2330")
+        assert result.signal == ""
+
 
 class TestStockScreenerInitialization:
     """Test cases for StockScreener initialization."""
@@ -738,6 +753,32 @@ class TestRunScreen:
 
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_run_screen_bounds_concurrency(self):
+        """Test every ticker is fetched with at most `concurrency` requests in flight."""
+        import asyncio
+
+        tickers = [str(2300 + i) for i in range(10)]
+        screener = StockScreener(universe=tickers, concurrency=3)
+        in_flight = 0
+        peak = 0
+        seen = []
+
+        async def fake_fetch(ticker, fetcher=None, analyzer=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            seen.append(ticker)
+            return None
+
+        with patch.object(screener, "_fetch_stock_data", side_effect=fake_fetch):
+            await screener._run_screen(criteria={}, show_progress=False)
+
+        assert sorted(seen) == tickers
+        assert peak == 3
+
 
 class TestFetchStockData:
     """Test cases for stock data fetching."""
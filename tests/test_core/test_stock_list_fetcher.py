@@ -1,9 +1,14 @@
 """Tests for StockListFetcher."""
 
 import json
+import threading
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pandas as pd
+
+from pulse.core.data.cache import DataCache
 from pulse.core.data.stock_list_fetcher import StockListFetcher
 
 
@@ -31,3 +36,60 @@ def test_save_all_for_main_program_includes_tw50(monkeypatch):
     assert "0050" in tickers
     assert "2330" in tickers
     assert len(tickers) >= 50
+
+
+def test_concurrent_fetches_share_single_download():
+    fetcher = StockListFetcher(use_cache=False)
+    calls = []
+
+    def slow_stock_info():
+        calls.append(1)
+        time.sleep(0.05)
+        return pd.DataFrame({"stock_id": ["2330"], "type": ["twse"]})
+
+    fetcher._dl = MagicMock()
+    fetcher._dl.taiwan_stock_info.side_effect = slow_stock_info
+
+    threads = [threading.Thread(target=fetcher._fetch_all_stocks) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+
+
+def test_stock_list_read_from_disk_cache(tmp_path):
+    cache = DataCache(cache_dir=tmp_path)
+    frame = pd.DataFrame({"stock_id": ["2330"], "type": ["twse"]})
+
+    first = StockListFetcher(cache=cache)
+    first._dl = MagicMock()
+    first._dl.taiwan_stock_info.return_value = frame
+    first._fetch_all_stocks()
+
+    second = StockListFetcher(cache=cache)
+    second._dl = MagicMock()
+    result = second._fetch_all_stocks()
+
+    second._dl.taiwan_stock_info.assert_not_called()
+    assert result.equals(frame)
+    cache.close()
+
+
+def test_stock_list_cache_bypass_refetches(tmp_path):
+    cache = DataCache(cache_dir=tmp_path)
+    frame = pd.DataFrame({"stock_id": ["2330"], "type": ["twse"]})
+
+    first = StockListFetcher(cache=cache)
+    first._dl = MagicMock()
+    first._dl.taiwan_stock_info.return_value = frame
+    first._fetch_all_stocks()
+
+    second = StockListFetcher(use_cache=False, cache=cache)
+    second._dl = MagicMock()
+    second._dl.taiwan_stock_info.return_value = frame
+    second._fetch_all_stocks()
+
+    second._dl.taiwan_stock_info.assert_called_once()
+    cache.close()